@@ -5,7 +5,7 @@ from pathlib import Path
 BASE_DIR = Path(__file__).parent.parent
 
 # Test results directory
-TEST_RESULTS_DIR = os.getenv('TEST_RESULTS_DIR', BASE_DIR / 'test-result')
+TEST_RESULTS_DIR = Path(os.getenv('TEST_RESULTS_DIR', BASE_DIR / 'test-result'))
 
 # Screenshots directory
 SCREENSHOTS_DIR = TEST_RESULTS_DIR / 'screenshots'
@@ -16,9 +16,37 @@ HTML_REPORTS_DIR = TEST_RESULTS_DIR / 'html'
 # Allure results directory
 ALLURE_RESULTS_DIR = TEST_RESULTS_DIR / 'allure-results'
 
-# Create directories if they don't exist
-for directory in [TEST_RESULTS_DIR, SCREENSHOTS_DIR, HTML_REPORTS_DIR, ALLURE_RESULTS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Cached authenticated browser sessions (storage state)
+AUTH_STATE_DIR = TEST_RESULTS_DIR / '.auth'
+
+# Response sizes learned by the request filter, used to estimate bytes saved
+REQUEST_SIZES_FILE = TEST_RESULTS_DIR / '.request-sizes.json'
+
+# Browser traffic recordings for --network-mode=record/replay
+HAR_DIR = TEST_RESULTS_DIR / 'har'
+
+# Recorded APIHelpers interactions for --api-mode=record/replay
+CASSETTES_DIR = BASE_DIR / 'data' / 'cassettes'
+
+# Traces and videos kept for failed or rerun tests
+TRACES_DIR = TEST_RESULTS_DIR / 'traces'
+VIDEOS_DIR = TEST_RESULTS_DIR / 'videos'
+
+# Pooled test users shared by xdist workers (one file per application URL)
+USER_POOL_DIR = TEST_RESULTS_DIR / '.users'
+
+# Parsed test_cases specs compiled to pickles, keyed by file hash
+CASE_CACHE_DIR = TEST_RESULTS_DIR / '.case-cache'
+
+# Per-worker page action timings (JSONL)
+TIMINGS_DIR = TEST_RESULTS_DIR / 'timings'
+
+
+def ensure_result_dirs() -> None:
+    """Create the report directories (once per run, not on every import)"""
+    for directory in [TEST_RESULTS_DIR, SCREENSHOTS_DIR, HTML_REPORTS_DIR, ALLURE_RESULTS_DIR]:
+        directory.mkdir(parents=True, exist_ok=True)
+
 
 # Browser configuration
 BROWSER = os.getenv('BROWSER', 'chromium')
@@ -1,12 +1,56 @@
 import os
 import json
+import functools
+import logging
 import pytest
 import allure
 from pathlib import Path
-from typing import Dict, Any, Generator
+from typing import Callable, Dict, Any, Generator, List, Optional
 from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 from dotenv import load_dotenv, find_dotenv
-from config.env import TEST_RESULTS_DIR, SCREENSHOTS_DIR
+from config.env import SCREENSHOTS_DIR, REQUEST_SIZES_FILE, CASSETTES_DIR, ensure_result_dirs
+from pages.login_page import LoginPage
+from utils.auth_state import AuthStateCache, DEFAULT_TTL_SECONDS
+from utils.browser_manager import BrowserManager
+from utils.parabank_server import ParaBankStubServer
+from utils.request_filter import RequestFilter, RequestStats
+from utils.har_network import HarNetwork, NETWORK_MODES
+from utils.cassette import Cassette, CASSETTE_MODES, MATCH_FIELDS
+from utils.waits import WAIT_STATS
+from utils.step_timing import STEP_TIMER
+from utils.artifact_writer import ARTIFACT_WRITER
+from utils.failure_artifacts import FailureArtifacts
+from utils.browser_logs import BrowserLogBuffer, DEFAULT_MAX_ENTRIES
+from utils.http_transport import PooledTransport, configure_default_transport, default_transport
+from utils.response_cache import CacheStats, ResponseCache
+from utils.api_helpers import APIHelpers
+from utils.parabank_client import ParaBankClient
+from utils.user_pool import PooledUser, UserPool
+from utils.data_generator import DataGenerator
+from utils.case_specs import CaseSpecCache, select_cases
+from utils.fan_out import FAILED, CaseResult, FanOutRunner
+from utils.duration_balance import DurationHistory, MakespanStats, uses_browser
+from utils.response_logging import ResponseLogPolicy
+
+logger = logging.getLogger(__name__)
+
+# Browser request counters of this process (and of all workers on the xdist controller)
+REQUEST_STATS = RequestStats()
+
+# API response cache counters of this process (and of all workers on the xdist controller)
+RESPONSE_CACHE_STATS = CacheStats()
+
+# Parsed test case specs, shared by every test marked cases(...) in this process
+CASE_SPECS = CaseSpecCache()
+
+# Per-test durations of previous runs, updated with this run's reports (saved by the controller)
+TEST_DURATIONS = DurationHistory()
+
+# Predicted and measured busy time per worker of a --duration-balance run
+MAKESPAN_STATS = MakespanStats()
+
+# Replayed tests that made requests missing from their HAR recording (node id -> count)
+HAR_UNMATCHED: Dict[str, int] = {}
 
 # Load environment variables from .env file
 load_dotenv(find_dotenv())
@@ -41,13 +85,97 @@ def pytest_addoption(parser):
     parser.addoption("--headless", action="store_true", default=False, help="Run browser in headless mode")
     parser.addoption("--slow-mo", action="store", default=100, type=int, help="Slow down browser execution in milliseconds")
     parser.addoption("--env", action="store", default="dev", help="Environment to run tests against (dev, qa, staging, prod)")
+    parser.addoption("--offline", action="store_true", default=False, help="Run against the bundled local ParaBank stand-in instead of the public demo")
+    parser.addoption("--no-request-filtering", action="store_true", default=False, help="Load every resource instead of applying the config's requestFiltering rules")
+    parser.addoption("--network-mode", action="store", default="live", choices=NETWORK_MODES, help="live: real network, record: capture browser traffic to HAR under test-result/har, replay: serve it from the HAR")
+    parser.addoption("--api-mode", action="store", default=None, choices=CASSETTE_MODES, help="live, record or replay APIHelpers traffic with cassettes under data/cassettes (defaults to --network-mode)")
+    parser.addoption("--response-cache", action="store_true", default=False, help="Cache repeated APIHelpers GETs even when the config's responseCache section is disabled")
+    parser.addoption("--user-pool", action="store_true", default=False, help="Lease pooled, pre-registered users to tests even when the config's userPool section is disabled")
+    parser.addoption("--data-seed", action="store", default=None, type=int, help="Seed DataGenerator for reproducible test data (overrides dataGeneration.seed)")
+    parser.addoption("--startup-profile", action="store_true", default=False, help="Report where collecting this run spends its import time (python -X importtime) and exit")
+    parser.addoption("--fan-out-concurrency", action="store", default=None, type=int, help="Cases a fan-out test drives at once, each in its own browser context (overrides fanOut.concurrency)")
+    parser.addoption("--duration-balance", action="store_true", default=False, help="With -n, send tests longest-first to the least-loaded worker using durations of previous runs (replaces --dist)")
+    parser.addoption("--recycle-browser-after", action="store", default=0, type=int, help="Relaunch the worker's browser after this many tests (0 disables)")
+    parser.addoption("--recycle-browser-memory-mb", action="store", default=0, type=int, help="Relaunch the worker's browser once it uses more memory than this (0 disables)")
 
 # Fixtures for configuration
 @pytest.fixture(scope="session")
 def config(request):
     """Fixture to load environment configuration"""
     env = request.config.getoption("--env")
-    return read_config(env)
+    config = read_config(env)
+    
+    if request.config.getoption("--offline"):
+        # Point the suite at the local stand-in started for this worker
+        server = request.getfixturevalue("parabank_server")
+        config = {**config, "baseUrl": server.base_url, "apiUrl": server.api_url}
+    
+    return config
+
+@pytest.fixture(scope="session", autouse=True)
+def artifact_writer(config):
+    """Background writer for screenshots, configured from the artifacts section"""
+    ARTIFACT_WRITER.apply_config(config)
+    return ARTIFACT_WRITER
+
+@pytest.fixture(scope="session", autouse=True)
+def data_seed(config, request) -> Optional[int]:
+    """Seed DataGenerator from --data-seed or dataGeneration.seed, if either is set"""
+    seed = request.config.getoption("--data-seed")
+    if seed is None:
+        seed = config.get("dataGeneration", {}).get("seed")
+    # xdist gives every worker of a run the same id, which keeps unseeded id shards apart
+    run_id = getattr(request.config, "workerinput", {}).get("testrunuid")
+    if seed is not None:
+        logger.info(f"Seeding test data generation with {seed}")
+    if seed is not None or run_id is not None:
+        DataGenerator.seed(seed, run_id=run_id)
+    return seed
+
+@pytest.fixture(scope="session", autouse=True)
+def http_transport(config) -> Generator[PooledTransport, None, None]:
+    """Connection pool and retry policy shared by every APIHelpers of this worker"""
+    transport = configure_default_transport(config)
+    yield transport
+    transport.shutdown()
+
+@pytest.fixture(scope="session")
+def response_cache(config, request) -> Optional[ResponseCache]:
+    """GET response cache shared by this worker's API clients (None when disabled)"""
+    if request.config.getoption("--response-cache"):
+        section = {**config.get("responseCache", {}), "enabled": True}
+        config = {**config, "responseCache": section}
+    return ResponseCache.from_config(config, stats=RESPONSE_CACHE_STATS)
+
+@pytest.fixture(scope="session")
+def parabank_client(config, response_cache) -> ParaBankClient:
+    """Typed ParaBank service client for setting up test state over HTTP"""
+    api = APIHelpers(config["apiUrl"], log_policy=ResponseLogPolicy.from_config(config), cache=response_cache)
+    return ParaBankClient(api)
+
+@pytest.fixture(scope="session")
+def user_pool(config, parabank_client, request) -> Optional[UserPool]:
+    """Cross-worker pool of registered users (None when disabled)"""
+    if not (config.get("userPool", {}).get("enabled") or request.config.getoption("--user-pool")):
+        return None
+    return UserPool.from_config(config, parabank_client)
+
+@pytest.fixture(scope="function")
+def leased_user(user_pool: Optional[UserPool], config, request) -> Generator[PooledUser, None, None]:
+    """User leased exclusively to this test (the config's default user when the pool is disabled)"""
+    if user_pool is None:
+        yield PooledUser.from_config_user(config["users"]["default"])
+        return
+    user = user_pool.lease(f"{os.getenv('PYTEST_XDIST_WORKER', 'main')}:{request.node.nodeid}")
+    yield user
+    user_pool.release(user)
+
+@pytest.fixture(scope="session")
+def parabank_server() -> Generator[ParaBankStubServer, None, None]:
+    """Local ParaBank stand-in on an ephemeral port, one per worker"""
+    server = ParaBankStubServer().start()
+    yield server
+    server.stop()
 
 @pytest.fixture(scope="session")
 def base_url(config):
@@ -66,24 +194,24 @@ def browser_type_launch_args(request):
 
 @pytest.fixture(scope="session")
 def browser_context_args(request, base_url):
-    """Configure browser context arguments"""
-    videos_dir = TEST_RESULTS_DIR / "videos"
-    videos_dir.mkdir(exist_ok=True)
-    
+    """Configure browser context arguments (video recording is set up by failure_artifacts)"""
     return {
         "ignore_https_errors": True,
         "viewport": {"width": 1366, "height": 768},
-        "base_url": base_url,
-        "record_video_dir": str(videos_dir) if os.getenv("RECORD_VIDEO", "false").lower() == "true" else None,
+        # Trailing slash lets page objects navigate with paths relative to the app root
+        "base_url": base_url.rstrip("/") + "/",
     }
 
 @pytest.fixture(scope="function")
-def page(context: BrowserContext, request) -> Generator[Page, None, None]:
-    """Create a new page for each test function"""
-    page = context.new_page()
-    
-    # Add event listener for console messages
-    page.on("console", lambda msg: print(f"[Browser Console] {msg.text}"))
+def browser_logs(config) -> BrowserLogBuffer:
+    """Console messages, page errors and failed requests of the test's pages, reported on failure"""
+    max_entries = config.get("reporting", {}).get("browserLogBufferSize", DEFAULT_MAX_ENTRIES)
+    return BrowserLogBuffer(max_entries)
+
+def _instrument_page(page: Page, browser_logs: BrowserLogBuffer) -> Page:
+    """Attach browser log capture and Allure reporting to a freshly created page"""
+    # Buffer console messages and errors instead of printing them
+    browser_logs.attach(page)
     
     # Attach Allure step for navigation
     old_goto = page.goto
@@ -92,47 +220,281 @@ def page(context: BrowserContext, request) -> Generator[Page, None, None]:
         return old_goto(url, **kwargs)
     page.goto = goto_with_allure
     
-    # Modify screenshot method to also attach to Allure
+    # Modify screenshot method to also attach to Allure; the file is written
+    # by the background artifact writer instead of on the test thread
     old_screenshot = page.screenshot
+    @functools.wraps(old_screenshot)
     def screenshot_with_allure(**kwargs):
+        path = kwargs.pop("path", None)
+        if path is not None and "type" not in kwargs:
+            kwargs["type"] = "jpeg" if Path(path).suffix.lower() in (".jpg", ".jpeg") else "png"
+        image_format = kwargs.get("type", "png")
         screenshot_bytes = old_screenshot(**kwargs)
-        allure.attach(screenshot_bytes, name="Screenshot", attachment_type=allure.attachment_type.PNG)
+        ARTIFACT_WRITER.submit(screenshot_bytes, "Screenshot", path=path, image_format=image_format,
+                               to_disk=path is not None)
         return screenshot_bytes
     page.screenshot = screenshot_with_allure
     
+    return page
+
+# Managed browser lifecycle: one browser per worker, one context per test
+@pytest.fixture(scope="session")
+def request_filter(config, request) -> Generator[Optional[RequestFilter], None, None]:
+    """Per-environment resource blocking applied to every browser context"""
+    request_filter = RequestFilter.from_config(config)
+    if request_filter is None:
+        yield None
+        return
+    if request.config.getoption("--no-request-filtering"):
+        request_filter.enabled = False
+    request_filter.load_sizes(REQUEST_SIZES_FILE)
+    
+    yield request_filter
+    
+    request_filter.save_sizes(REQUEST_SIZES_FILE)
+    REQUEST_STATS.merge(request_filter.totals.to_dict())
+
+@pytest.fixture(scope="session")
+def browser_manager(browser_type, browser_type_launch_args, request_filter, request) -> Generator[BrowserManager, None, None]:
+    """Owns this worker's browser process and recycles it when configured to"""
+    manager = BrowserManager(
+        browser_type,
+        browser_type_launch_args,
+        recycle_after=request.config.getoption("--recycle-browser-after"),
+        memory_limit_mb=request.config.getoption("--recycle-browser-memory-mb"),
+        context_hooks=[request_filter.attach] if request_filter else []
+    )
+    yield manager
+    manager.close()
+
+@pytest.fixture(scope="function")
+def browser(browser_manager: BrowserManager) -> Browser:
+    """The worker's current browser (may change between tests when recycled)"""
+    return browser_manager.browser
+
+@pytest.fixture(scope="session")
+def fan_out_runner(config, browser_name, browser_type_launch_args, browser_context_args,
+                   request) -> Generator[FanOutRunner, None, None]:
+    """Concurrent runner for independent UI cases, with its own browser launched on first use"""
+    runner = FanOutRunner.from_config(config, browser_name, browser_type_launch_args, browser_context_args)
+    concurrency = request.config.getoption("--fan-out-concurrency")
+    if concurrency:
+        runner.concurrency = concurrency
+    yield runner
+    runner.close()
+
+def _report_case_results(item, results: List[CaseResult]) -> None:
+    """List every fanned-out case in a report section of the test and attach failure screenshots"""
+    lines = []
+    for result in results:
+        line = f"{result.outcome.upper():<7} [{result.case_id}] {result.duration:.2f}s"
+        if result.message:
+            line += f" - {result.message.splitlines()[0]}"
+        lines.append(line)
+        if result.screenshot:
+            allure.attach(result.screenshot, name=f"Case {result.case_id} failure",
+                          attachment_type=allure.attachment_type.PNG)
+    failures = [f"[{result.case_id}]\n{result.longrepr}" for result in results if result.longrepr]
+    item.add_report_section("call", "fan-out cases", "\n\n".join(["\n".join(lines), *failures]))
+
+@pytest.fixture(scope="function")
+def fan_out(fan_out_runner: FanOutRunner, request) -> Callable[..., List[CaseResult]]:
+    """
+    Run a page-object flow for many cases concurrently, one Allure step and report line per case
+
+    Usage: fan_out(cases, flow, concurrency=None); the test fails if any case failed.
+    """
+    def run(cases, flow, concurrency: Optional[int] = None) -> List[CaseResult]:
+        results = fan_out_runner.run(cases, flow, concurrency)
+        _report_case_results(request.node, results)
+        failed = [result.case_id for result in results if result.outcome == FAILED]
+        if failed:
+            pytest.fail(f"{len(failed)} of {len(results)} cases failed: {', '.join(failed)}", pytrace=False)
+        return results
+    return run
+
+@pytest.fixture(scope="session")
+def failure_artifacts(config) -> Generator[FailureArtifacts, None, None]:
+    """Traces and videos per test, kept only for failed or rerun tests (reporting section)"""
+    # RECORD_VIDEO=true keeps the video of every test
+    video = "on" if os.getenv("RECORD_VIDEO", "false").lower() == "true" else None
+    artifacts = FailureArtifacts.from_config(config, video=video)
+    yield artifacts
+    artifacts.cleanup()
+
+def _test_failed(node) -> bool:
+    """Whether a test failed so far, or is a rerun of a failed attempt"""
+    reports = (getattr(node, "rep_setup", None), getattr(node, "rep_call", None))
+    return any(report is not None and report.failed for report in reports) or getattr(node, "execution_count", 1) > 1
+
+@pytest.fixture(scope="session")
+def har_network(request, request_filter) -> HarNetwork:
+    """Browser traffic recording/replay selected with --network-mode"""
+    return HarNetwork(request.config.getoption("--network-mode"), request_filter=request_filter)
+
+def _report_unmatched(har_network: HarNetwork, request) -> None:
+    """Report requests a replayed test made that are missing from its recording"""
+    unmatched = har_network.take_unmatched(request.node.nodeid)
+    if unmatched:
+        HAR_UNMATCHED[request.node.nodeid] = len(unmatched)
+        request.node.user_properties.append(("har_unmatched", len(unmatched)))
+        allure.attach("\n".join(unmatched), name="Requests missing from HAR", attachment_type=allure.attachment_type.TEXT)
+
+@pytest.fixture(scope="function")
+def context(browser_manager: BrowserManager, browser_context_args, request_filter, har_network: HarNetwork,
+            failure_artifacts: FailureArtifacts, request) -> Generator[BrowserContext, None, None]:
+    """Create a fresh context for each test and close it deterministically"""
+    requests_before = request_filter.totals.snapshot() if request_filter else None
+    test_id = request.node.nodeid
+    context = browser_manager.new_context(
+        **browser_context_args, **har_network.context_args(test_id), **failure_artifacts.context_args()
+    )
+    failure_artifacts.start(context)
+    har_network.attach(context, test_id)
+    
+    yield context
+    
+    failure_artifacts.attach(failure_artifacts.finish(context, test_id, _test_failed(request.node)))
+    browser_manager.test_finished()
+    _report_unmatched(har_network, request)
+    
+    if request_filter:
+        stats = request_filter.totals - requests_before
+        logger.info(f"Browser requests: {stats}")
+        for name, value in stats.to_dict().items():
+            request.node.user_properties.append((f"requests_{name}", value))
+
+@pytest.fixture(scope="function")
+def page(context: BrowserContext, browser_logs: BrowserLogBuffer) -> Generator[Page, None, None]:
+    """Create a new page for each test function"""
+    page = _instrument_page(context.new_page(), browser_logs)
+    
+    yield page
+    
+    page.close()
+
+# Fixtures for API record/replay
+@pytest.fixture(scope="module")
+def api_cassette(request, config) -> Generator[Optional[Cassette], None, None]:
+    """Cassette for APIHelpers, one file per test module, or None when running live"""
+    mode = request.config.getoption("--api-mode") or request.config.getoption("--network-mode")
+    if mode == "live":
+        yield None
+        return
+    
+    settings = config.get("apiCassettes", {})
+    module_name = request.module.__name__.split(".")[-1]
+    cassette = Cassette(
+        CASSETTES_DIR / f"{module_name}.json",
+        mode=mode,
+        match_on=settings.get("matchOn", MATCH_FIELDS),
+        strict=settings.get("strict", True)
+    )
+    
+    yield cassette
+    
+    cassette.save()
+
+# Fixtures for pre-authenticated sessions
+@pytest.fixture(scope="session")
+def auth_state_cache(browser_manager: BrowserManager, browser_context_args, config) -> AuthStateCache:
+    """Per-worker cache of logged-in storage state, one login per user role"""
+    session_cache = config.get("sessionCache", {})
+    return AuthStateCache(
+        browser_manager,
+        config.get("users", {}),
+        context_args=browser_context_args,
+        ttl_seconds=session_cache.get("ttlSeconds", DEFAULT_TTL_SECONDS)
+    )
+
+@pytest.fixture(scope="function")
+def authenticated_context(auth_state_cache: AuthStateCache, browser_manager: BrowserManager, browser_context_args,
+                          har_network: HarNetwork, failure_artifacts: FailureArtifacts,
+                          request) -> Generator[Callable[..., BrowserContext], None, None]:
+    """
+    Factory for browser contexts that are already logged in
+    
+    Usage: context = authenticated_context("default")
+    """
+    contexts = []
+    test_id = request.node.nodeid
+    
+    def _new_context(role: str = "default", **overrides) -> BrowserContext:
+        overrides = {**har_network.context_args(test_id), **failure_artifacts.context_args(), **overrides}
+        if har_network.mode == "replay":
+            # Responses come from the recording, so no real session is needed
+            context = browser_manager.new_context(**{**browser_context_args, **overrides})
+        else:
+            context = auth_state_cache.new_context(role, **overrides)
+        failure_artifacts.start(context)
+        har_network.attach(context, test_id)
+        contexts.append(context)
+        return context
+    
+    yield _new_context
+    
+    failed = _test_failed(request.node)
+    for context in contexts:
+        failure_artifacts.attach(failure_artifacts.finish(context, test_id, failed))
+    if contexts:
+        browser_manager.test_finished()
+        _report_unmatched(har_network, request)
+
+@pytest.fixture(scope="function")
+def logged_in_page(authenticated_context, auth_state_cache: AuthStateCache, browser_logs: BrowserLogBuffer,
+                   base_url) -> Generator[Page, None, None]:
+    """Page opened on the accounts overview as the default user, skipping the login form"""
+    role = "default"
+    overview_url = f"{base_url}/overview.htm"
+    
+    page = _instrument_page(authenticated_context(role).new_page(), browser_logs)
+    page.goto(overview_url)
+    if not LoginPage(page).is_user_logged_in():
+        # Cached session was rejected by the server, log in again and retry once
+        logger.warning(f"Cached session for role '{role}' is stale, logging in again")
+        auth_state_cache.invalidate(role)
+        page = _instrument_page(authenticated_context(role).new_page(), browser_logs)
+        page.goto(overview_url)
+        assert LoginPage(page).is_user_logged_in(), f"Could not restore a logged-in session for role '{role}'"
+    
     yield page
 
 # Hook to capture test outcome
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Capture screenshots on test failure and attach to Allure report"""
+    """Capture screenshots and browser logs on test failure and attach to Allure report"""
     outcome = yield
     report = outcome.get_result()
     
     # Set report attribute for test outcome
     setattr(item, f"rep_{report.when}", report)
+    # Browser tests are balanced separately from API tests (report attributes reach the xdist controller)
+    report.uses_browser = uses_browser(item.fixturenames)
     
     # Check if test failed and we're in the call phase
     if report.when == "call" and report.failed:
         try:
             # Try to get page fixture
-            page = item.funcargs.get("page")
+            page = item.funcargs.get("page") or item.funcargs.get("logged_in_page")
             if page:
-                # Take screenshot and attach to report
-                screenshot = page.screenshot()
-                allure.attach(
+                # Attach to the report and save to file in the background
+                screenshot = ARTIFACT_WRITER.capture(page)
+                ARTIFACT_WRITER.submit(
                     screenshot,
                     name="screenshot_on_failure",
-                    attachment_type=allure.attachment_type.PNG
+                    path=SCREENSHOTS_DIR / f"{item.name}.{ARTIFACT_WRITER.extension}"
                 )
-                
-                # Save screenshot to file
-                screenshot_path = SCREENSHOTS_DIR / f"{item.name}.png"
-                with open(screenshot_path, "wb") as f:
-                    f.write(screenshot)
                     
         except Exception as e:
             print(f"Failed to take screenshot: {e}")
+    
+    # Browser logs are only reported for tests that failed
+    if report.when in ("setup", "call") and report.failed:
+        browser_logs = item.funcargs.get("browser_logs")
+        if browser_logs is not None and len(browser_logs):
+            log_text = browser_logs.text()
+            report.sections.append((f"Captured browser log {report.when}", log_text))
+            allure.attach(log_text, name="Browser log", attachment_type=allure.attachment_type.TEXT)
 
 # Fixtures for test data
 @pytest.fixture(scope="function")
@@ -145,4 +507,115 @@ def test_data(request):
     if data_path.exists():
         with open(data_path, "r") as f:
             return json.load(f)
-    return {} 
\ No newline at end of file
+    return {} 
+
+@pytest.fixture(scope="session")
+def case_specs() -> CaseSpecCache:
+    """Parsed test case specs, for tests that load cases themselves (e.g. to fan them out)"""
+    return CASE_SPECS
+
+def pytest_generate_tests(metafunc):
+    """Parametrize the case argument of tests marked cases(...) with the specs of a test_cases file"""
+    marker = metafunc.definition.get_closest_marker("cases")
+    if marker is None or "case" not in metafunc.fixturenames:
+        return
+    path = marker.args[0] if marker.args else marker.kwargs["path"]
+    cases = select_cases(
+        CASE_SPECS.load(path, marker.kwargs.get("keys")),
+        ids=marker.kwargs.get("ids"),
+        automation=marker.kwargs.get("automation"),
+        priority=marker.kwargs.get("priority")
+    )
+    metafunc.parametrize("case", [pytest.param(case, id=case.id) for case in cases])
+
+# Session-level performance summaries, merged from xdist workers on the controller
+def pytest_configure(config):
+    """Create report directories and clear step timings of the previous run (controller only, before workers start)"""
+    if not hasattr(config, "workerinput"):
+        ensure_result_dirs()
+        STEP_TIMER.reset_output()
+        TEST_DURATIONS.load(getattr(config, "cache", None))
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """Balance workers by recorded test durations with --duration-balance"""
+    if not config.getoption("--duration-balance"):
+        return None
+    from utils.duration_balance import DurationScheduling
+    return DurationScheduling(config, log, history=TEST_DURATIONS, stats=MAKESPAN_STATS)
+
+def pytest_runtest_logreport(report):
+    """Record test durations (on the xdist controller this sees the reports of every worker)"""
+    TEST_DURATIONS.record(report)
+    MAKESPAN_STATS.record(report)
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """Profile startup in a child collection run instead of testing, with --startup-profile"""
+    config = session.config
+    if not config.getoption("--startup-profile") or hasattr(config, "workerinput"):
+        return
+    from utils.startup_profile import profile_startup
+    reporter = config.pluginmanager.get_plugin("terminalreporter")
+    reporter.section("Startup profile")
+    for line in profile_startup(config.invocation_params.args):
+        reporter.write_line(line)
+    pytest.exit("Startup profile complete", returncode=0)
+
+def pytest_sessionfinish(session, exitstatus):
+    """Ship this worker's statistics to the xdist controller"""
+    STEP_TIMER.flush()
+    ARTIFACT_WRITER.close()
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is None:
+        TEST_DURATIONS.save(getattr(session.config, "cache", None))
+    else:
+        workeroutput["wait_stats"] = WAIT_STATS.to_dict()
+        workeroutput["request_stats"] = REQUEST_STATS.to_dict()
+        workeroutput["har_unmatched"] = HAR_UNMATCHED
+        workeroutput["http_stats"] = default_transport().stats.to_dict()
+        workeroutput["response_cache_stats"] = RESPONSE_CACHE_STATS.to_dict()
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge statistics reported by a finished xdist worker"""
+    workeroutput = getattr(node, "workeroutput", {})
+    if "wait_stats" in workeroutput:
+        WAIT_STATS.merge(workeroutput["wait_stats"])
+    if "request_stats" in workeroutput:
+        REQUEST_STATS.merge(workeroutput["request_stats"])
+    HAR_UNMATCHED.update(workeroutput.get("har_unmatched", {}))
+    if "http_stats" in workeroutput:
+        default_transport().stats.merge(workeroutput["http_stats"])
+    if "response_cache_stats" in workeroutput:
+        RESPONSE_CACHE_STATS.merge(workeroutput["response_cache_stats"])
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Print where page-object actions spent their waiting time, what the browser loaded and API connection reuse"""
+    if WAIT_STATS.kinds:
+        terminalreporter.section("Page wait times")
+        for line in WAIT_STATS.summary_lines():
+            terminalreporter.write_line(line)
+    step_lines = STEP_TIMER.summary_lines()
+    if step_lines:
+        terminalreporter.section("Page action timings")
+        for line in step_lines:
+            terminalreporter.write_line(line)
+    if REQUEST_STATS.allowed or REQUEST_STATS.blocked:
+        terminalreporter.section("Browser requests")
+        terminalreporter.write_line(str(REQUEST_STATS))
+    http_stats = default_transport().stats
+    if http_stats.requests:
+        terminalreporter.section("API connections")
+        terminalreporter.write_line(str(http_stats))
+    if RESPONSE_CACHE_STATS.hits or RESPONSE_CACHE_STATS.misses:
+        terminalreporter.section("API response cache")
+        terminalreporter.write_line(str(RESPONSE_CACHE_STATS))
+    if MAKESPAN_STATS.predicted:
+        terminalreporter.section("Duration balance")
+        for line in MAKESPAN_STATS.summary_lines():
+            terminalreporter.write_line(line)
+    if HAR_UNMATCHED:
+        terminalreporter.section("Stale HAR recordings")
+        for test_id, count in sorted(HAR_UNMATCHED.items()):
+            terminalreporter.write_line(f"{count:>5} unmatched requests  {test_id}")
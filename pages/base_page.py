@@ -1,64 +1,297 @@
 import allure
+import contextlib
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from urllib.parse import urljoin
 from playwright.sync_api import Page, Locator, TimeoutError as PlaywrightTimeoutError
-from config.env import SCREENSHOTS_DIR
+from utils.artifact_writer import ARTIFACT_WRITER
+from utils.step_timing import STEP_TIMER, timed_step
+from utils.waits import WAIT_STATS, WaitCondition
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Sets every field of a form in one evaluate() call. The native value setter is
+# used so frameworks tracking the property (React, Angular) see the change, and
+# input/change events are dispatched like a user edit would.
+_FILL_FORM_SCRIPT = """
+(form, fields) => {
+    const failures = {};
+    for (const [selector, value] of fields) {
+        let element;
+        try {
+            element = form.querySelector(selector);
+        } catch (error) {
+            failures[selector] = `invalid selector: ${error.message}`;
+            continue;
+        }
+        if (!element) {
+            failures[selector] = "not found in form";
+            continue;
+        }
+        if (!("value" in element)) {
+            failures[selector] = `not a form field (<${element.tagName.toLowerCase()}>)`;
+            continue;
+        }
+        if (element.disabled || element.readOnly) {
+            failures[selector] = "not editable";
+            continue;
+        }
+        element.focus();
+        if (element.type === "checkbox" || element.type === "radio") {
+            element.checked = Boolean(value);
+        } else {
+            const prototype = Object.getPrototypeOf(element);
+            const setter = Object.getOwnPropertyDescriptor(prototype, "value").set;
+            setter.call(element, String(value));
+            if (element.value !== String(value)) {
+                failures[selector] = `value rejected (field holds '${element.value}')`;
+                continue;
+            }
+        }
+        element.dispatchEvent(new Event("input", { bubbles: true }));
+        element.dispatchEvent(new Event("change", { bubbles: true }));
+        element.blur();
+    }
+    return failures;
+}
+"""
+
+# Reports attached/visible/enabled/text for a list of CSS selectors in one call.
+# With a required state it returns null until every selector reaches it, which
+# lets page.wait_for_function() poll inside the browser under one deadline.
+_ELEMENTS_STATE_SCRIPT = """
+({ selectors, until }) => {
+    const states = {};
+    for (const selector of selectors) {
+        const element = document.querySelector(selector);
+        if (!element) {
+            states[selector] = { attached: false, visible: false, enabled: false, text: "" };
+            continue;
+        }
+        const rect = element.getBoundingClientRect();
+        const style = window.getComputedStyle(element);
+        const visible = rect.width > 0 && rect.height > 0 && style.visibility !== "hidden";
+        states[selector] = {
+            attached: true,
+            visible: visible,
+            enabled: !element.matches(":disabled"),
+            text: (element.textContent || "").trim()
+        };
+    }
+    if (until && !Object.values(states).every(state => state[until] && (until !== "enabled" || state.visible))) {
+        return null;
+    }
+    return states;
+}
+"""
+
+
+@dataclass
+class ElementState:
+    """State of one selector as seen by BasePage.check_elements"""
+    selector: str
+    attached: bool = False
+    visible: bool = False
+    enabled: bool = False
+    text: str = ""
+
+
+class FormFillError(Exception):
+    """Raised by BasePage.fill_form when one or more fields could not be set"""
+
+    def __init__(self, form: str, failures: Dict[str, str]):
+        self.form = form
+        self.failures = failures
+        details = "; ".join(f"{selector}: {reason}" for selector, reason in failures.items())
+        super().__init__(f"Could not fill {len(failures)} field(s) in {form}: {details}")
+
+
 class BasePage:
     """
     Base Page Object Model class providing common methods for all pages
     """
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, base_url: Optional[str] = None):
+        """
+        Args:
+            page: Playwright page to drive
+            base_url: Application root; when omitted, paths resolve against the
+                browser context's base_url
+        """
         self.page = page
+        self.base_url = base_url
+    
+    def url_for(self, path: str) -> str:
+        """Build the URL of an application page from its path relative to the app root"""
+        if self.base_url:
+            return urljoin(self.base_url.rstrip("/") + "/", path)
+        return path
     
+    @timed_step("navigate")
     @allure.step("Navigate to URL: {url}")
     def navigate(self, url: str) -> None:
         """Navigate to a specific URL"""
         logger.info(f"Navigating to {url}")
         self.page.goto(url)
     
+    @timed_step("wait_for_page_load")
     @allure.step("Wait for page load complete")
     def wait_for_page_load(self) -> None:
-        """Wait for page to be fully loaded"""
-        self.page.wait_for_load_state("networkidle")
+        """Wait for page to be fully loaded (prefer wait_until with a targeted condition)"""
+        start = time.perf_counter()
+        with STEP_TIMER.waiting():
+            self.page.wait_for_load_state("networkidle")
+        WAIT_STATS.record("networkidle", time.perf_counter() - start)
         logger.info("Page fully loaded")
     
+    @contextlib.contextmanager
+    def _armed(self, condition: WaitCondition, timeout: float, marks: Dict[str, float]) -> Iterator[None]:
+        """Arm an event condition around an action and record how long it took to resolve"""
+        try:
+            with condition.expect(self.page, timeout):
+                yield
+        except Exception:
+            WAIT_STATS.record(condition.kind, time.perf_counter() - marks.get("action_done", marks["start"]), ok=False)
+            raise
+        elapsed = time.perf_counter() - marks.get("action_done", marks["start"])
+        WAIT_STATS.record(condition.kind, elapsed)
+        logger.debug(f"Waited {elapsed * 1000:.0f} ms for {condition!r}")
+    
+    def perform_and_wait(self, action: Optional[Callable[[], Any]], *conditions: WaitCondition,
+                         timeout: int = 10000) -> None:
+        """
+        Run an action and wait only for the conditions it actually depends on
+        
+        Event conditions (responses, navigations) are armed before the action so
+        fast responses are not missed; element and load-state conditions are
+        checked once the action has returned.
+        
+        Args:
+            action: Callable performing the action, or None to only wait
+            conditions: Conditions to wait for, see utils.waits.WaitFor
+            timeout: Timeout in milliseconds for each condition
+        """
+        marks = {"start": time.perf_counter()}
+        with contextlib.ExitStack() as stack:
+            for condition in conditions:
+                if condition.armed:
+                    stack.enter_context(self._armed(condition, timeout, marks))
+            if action is not None:
+                action()
+            marks["action_done"] = time.perf_counter()
+            # Armed conditions resolve while the stack unwinds, which is waiting time
+            with STEP_TIMER.waiting():
+                stack.close()
+        
+        for condition in conditions:
+            if condition.armed:
+                continue
+            start = time.perf_counter()
+            try:
+                with STEP_TIMER.waiting():
+                    condition.wait(self.page, timeout)
+            except Exception:
+                WAIT_STATS.record(condition.kind, time.perf_counter() - start, ok=False)
+                raise
+            elapsed = time.perf_counter() - start
+            WAIT_STATS.record(condition.kind, elapsed)
+            logger.debug(f"Waited {elapsed * 1000:.0f} ms for {condition!r}")
+    
+    @timed_step("wait_until")
+    @allure.step("Wait until: {conditions}")
+    def wait_until(self, *conditions: WaitCondition, timeout: int = 10000) -> None:
+        """
+        Wait for one or more conditions without performing an action
+        
+        Args:
+            conditions: Conditions to wait for, see utils.waits.WaitFor
+            timeout: Timeout in milliseconds for each condition
+        """
+        self.perform_and_wait(None, *conditions, timeout=timeout)
+    
+    @timed_step("click_and_wait")
+    @allure.step("Click element: {selector} and wait for: {conditions}")
+    def click_and_wait(self, selector: str, *conditions: WaitCondition,
+                       timeout: int = 10000) -> None:
+        """
+        Click an element and wait for what the click is expected to cause
+        
+        Args:
+            selector: Element to click
+            conditions: Conditions to wait for, see utils.waits.WaitFor
+            timeout: Timeout in milliseconds for the click and each condition
+        """
+        self.perform_and_wait(lambda: self.click(selector, timeout=timeout), *conditions, timeout=timeout)
+    
     @allure.step("Get element: {selector}")
     def get_element(self, selector: str) -> Locator:
         """Get an element by CSS or XPath selector"""
         logger.debug(f"Getting element with selector: {selector}")
         return self.page.locator(selector)
     
+    @timed_step("click")
     @allure.step("Click element: {selector}")
     def click(self, selector: str, force: bool = False, 
               timeout: int = 10000) -> None:
         """Click on an element"""
         logger.info(f"Clicking element: {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="visible", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="visible", timeout=timeout)
         element.click(force=force)
     
+    @timed_step("fill_text")
     @allure.step("Fill input: {selector} with text: {text}")
     def fill_text(self, selector: str, text: str, timeout: int = 10000) -> None:
         """Fill text in an input field"""
         logger.info(f"Filling '{text}' in {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="visible", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="visible", timeout=timeout)
         element.fill(text)
     
+    @timed_step("fill_form")
+    @allure.step("Fill form: {selector}")
+    def fill_form(self, fields: Dict[str, Any], selector: str = "form",
+                  timeout: int = 10000) -> None:
+        """
+        Fill several fields of a form in a single browser round trip
+        
+        The form is waited for once; every field is then set in one evaluate()
+        call that fires the same input/change events as typing would.
+        
+        Args:
+            fields: CSS selector (relative to the form) -> value; booleans
+                check or uncheck checkboxes and radios
+            selector: Form container
+            timeout: Timeout in milliseconds for the form to become visible
+        
+        Raises:
+            FormFillError: A field is missing, not editable or rejected its value
+        """
+        logger.info(f"Filling {len(fields)} fields in {selector}")
+        form = self.get_element(selector)
+        with STEP_TIMER.waiting():
+            form.wait_for(state="visible", timeout=timeout)
+        failures = form.evaluate(_FILL_FORM_SCRIPT, [[field, value] for field, value in fields.items()])
+        if failures:
+            raise FormFillError(selector, failures)
+    
+    @timed_step("get_text")
     @allure.step("Get text from element: {selector}")
     def get_text(self, selector: str, timeout: int = 10000) -> str:
         """Get text from an element"""
         logger.info(f"Getting text from element: {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="visible", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="visible", timeout=timeout)
         return element.text_content() or ""
     
+    @timed_step("is_element_visible")
     @allure.step("Check if element exists: {selector}")
     def is_element_visible(self, selector: str, timeout: int = 5000) -> bool:
         """Check if element is visible on the page"""
@@ -69,23 +302,71 @@ class BasePage:
         except PlaywrightTimeoutError:
             return False
     
+    @timed_step("check_elements")
+    @allure.step("Check elements: {selectors}")
+    def check_elements(self, *selectors: str, until: Optional[str] = None,
+                       timeout: int = 5000) -> Dict[str, ElementState]:
+        """
+        Read the state of several elements in a single browser round trip
+        
+        With until set, the check is polled inside the browser until every
+        selector reaches that state or the overall timeout expires; the state
+        at the deadline is returned rather than raising.
+        
+        Args:
+            selectors: CSS selectors (first match of each is inspected)
+            until: attached, visible or enabled; None checks once without waiting
+            timeout: Overall deadline in milliseconds for all selectors together
+        
+        Returns:
+            Selector -> ElementState, in the order given
+        """
+        if until not in (None, "attached", "visible", "enabled"):
+            raise ValueError(f"Unsupported element state '{until}', expected attached, visible or enabled")
+        logger.info(f"Checking {len(selectors)} elements{f' until {until}' if until else ''}")
+        arg = {"selectors": list(selectors), "until": until}
+        states = None
+        if until is not None:
+            try:
+                with STEP_TIMER.waiting():
+                    handle = self.page.wait_for_function(_ELEMENTS_STATE_SCRIPT, arg=arg, timeout=timeout, polling=100)
+                states = handle.json_value()
+            except PlaywrightTimeoutError:
+                logger.info(f"Elements did not become {until} within {timeout} ms")
+        if states is None:
+            states = self.page.evaluate(_ELEMENTS_STATE_SCRIPT, {**arg, "until": None})
+        return {selector: ElementState(selector, **states[selector]) for selector in selectors}
+    
+    def are_elements_visible(self, *selectors: str, timeout: int = 5000) -> bool:
+        """Whether all elements become visible within one shared timeout"""
+        states = self.check_elements(*selectors, until="visible", timeout=timeout)
+        hidden = [selector for selector, state in states.items() if not state.visible]
+        if hidden:
+            logger.info(f"Elements not visible: {', '.join(hidden)}")
+        return not hidden
+    
+    @timed_step("wait_for_element")
     @allure.step("Wait for element: {selector}")
     def wait_for_element(self, selector: str, state: str = "visible", 
                          timeout: int = 10000) -> Locator:
         """Wait for an element to be in a specific state"""
         logger.info(f"Waiting for element {selector} to be {state}")
         element = self.get_element(selector)
-        element.wait_for(state=state, timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state=state, timeout=timeout)
         return element
     
+    @timed_step("select_option")
     @allure.step("Select option: {value} from dropdown: {selector}")
     def select_option(self, selector: str, value: str, timeout: int = 10000) -> None:
         """Select an option from a dropdown by value"""
         logger.info(f"Selecting option '{value}' from dropdown {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="visible", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="visible", timeout=timeout)
         element.select_option(value=value)
     
+    @timed_step("get_elements_text")
     @allure.step("Get all text from elements: {selector}")
     def get_elements_text(self, selector: str) -> List[str]:
         """Get text from all matching elements"""
@@ -93,31 +374,36 @@ class BasePage:
         elements = self.page.locator(selector).all()
         return [element.text_content() or "" for element in elements]
     
+    @timed_step("take_screenshot")
     @allure.step("Take screenshot: {name}")
     def take_screenshot(self, name: str = "screenshot") -> bytes:
-        """Take a screenshot and attach to Allure report"""
+        """Take a screenshot; saving it and attaching it to Allure happen in the background"""
         logger.info(f"Taking screenshot: {name}")
-        screenshot_path = SCREENSHOTS_DIR / f"{name}.png"
-        screenshot = self.page.screenshot(path=screenshot_path)
-        allure.attach(screenshot, name=name, attachment_type=allure.attachment_type.PNG)
+        screenshot = ARTIFACT_WRITER.capture(self.page)
+        ARTIFACT_WRITER.submit(screenshot, name)
         return screenshot
     
+    @timed_step("scroll_into_view")
     @allure.step("Scroll element into view: {selector}")
     def scroll_into_view(self, selector: str, timeout: int = 10000) -> None:
         """Scroll element into view"""
         logger.info(f"Scrolling element into view: {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="attached", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="attached", timeout=timeout)
         element.scroll_into_view_if_needed()
     
+    @timed_step("hover")
     @allure.step("Hover over element: {selector}")
     def hover(self, selector: str, timeout: int = 10000) -> None:
         """Hover over an element"""
         logger.info(f"Hovering over element: {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="visible", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="visible", timeout=timeout)
         element.hover()
     
+    @timed_step("set_checkbox")
     @allure.step("Check/uncheck checkbox: {selector} to state: {check}")
     def set_checkbox(self, selector: str, check: bool = True, 
                      timeout: int = 10000) -> None:
@@ -125,40 +411,50 @@ class BasePage:
         state = "check" if check else "uncheck"
         logger.info(f"{state.capitalize()}ing checkbox: {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="visible", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="visible", timeout=timeout)
         
         if check:
             element.check()
         else:
             element.uncheck()
     
+    @timed_step("get_attribute")
     @allure.step("Get attribute: {attribute} from element: {selector}")
     def get_attribute(self, selector: str, attribute: str, 
                       timeout: int = 10000) -> Optional[str]:
         """Get attribute value from an element"""
         logger.info(f"Getting attribute '{attribute}' from element: {selector}")
         element = self.get_element(selector)
-        element.wait_for(state="attached", timeout=timeout)
+        with STEP_TIMER.waiting():
+            element.wait_for(state="attached", timeout=timeout)
         return element.get_attribute(attribute)
     
+    @timed_step("press_key")
     @allure.step("Press key: {key}")
     def press_key(self, key: str) -> None:
         """Press a key on the keyboard"""
         logger.info(f"Pressing key: {key}")
         self.page.keyboard.press(key)
     
+    @timed_step("execute_script")
     @allure.step("Execute JavaScript: {script}")
     def execute_script(self, script: str, arg: Any = None) -> Any:
         """Execute JavaScript in the browser context"""
         logger.info("Executing JavaScript")
         return self.page.evaluate(script, arg)
     
+    @timed_step("wait_for_network_idle")
     @allure.step("Wait for network idle")
     def wait_for_network_idle(self) -> None:
-        """Wait for network to be idle (no requests for 500ms)"""
+        """Wait for network to be idle (no requests for 500ms); prefer wait_until with a targeted condition"""
         logger.info("Waiting for network to be idle")
-        self.page.wait_for_load_state("networkidle")
+        start = time.perf_counter()
+        with STEP_TIMER.waiting():
+            self.page.wait_for_load_state("networkidle")
+        WAIT_STATS.record("networkidle", time.perf_counter() - start)
     
+    @timed_step("reload_page")
     @allure.step("Reload page")
     def reload_page(self) -> None:
         """Reload the current page"""
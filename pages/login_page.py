@@ -1,6 +1,7 @@
 import allure
 import logging
 from pages.base_page import BasePage
+from utils.waits import WaitFor
 
 logger = logging.getLogger(__name__)
 
@@ -16,13 +17,14 @@ class LoginPage(BasePage):
     REGISTER_LINK = "a[href*='register.htm']"
     LOGOUT_LINK = "a[href*='logout.htm']"
     ACCOUNTS_OVERVIEW_TITLE = "#rightPanel h1"
+    RIGHT_PANEL = "#rightPanel"
     
     @allure.step("Navigate to login page")
     def navigate(self):
         """Navigate to the login page"""
         logger.info("Navigating to login page")
-        self.page.goto("https://parabank.parasoft.com/parabank/index.htm")
-        self.wait_for_page_load()
+        self.page.goto(self.url_for("index.htm"), wait_until="domcontentloaded")
+        self.wait_until(WaitFor.element(self.USERNAME_INPUT))
         assert self.is_login_form_visible(), "Login page did not load correctly"
     
     @allure.step("Login with username: {username}")
@@ -37,8 +39,8 @@ class LoginPage(BasePage):
         logger.info(f"Logging in with username: {username}")
         self.fill_text(self.USERNAME_INPUT, username)
         self.fill_text(self.PASSWORD_INPUT, password)
-        self.click(self.LOGIN_BUTTON)
-        self.wait_for_network_idle()
+        # Success lands on the overview, failure re-renders the login page with an error
+        self.click_and_wait(self.LOGIN_BUTTON, WaitFor.navigation(), WaitFor.element(self.RIGHT_PANEL))
     
     @allure.step("Get login error message")
     def get_error_message(self):
@@ -54,24 +56,20 @@ class LoginPage(BasePage):
     def click_forgot_login_info(self):
         """Click the forgot login info link"""
         logger.info("Clicking forgot login info link")
-        self.click(self.FORGOT_LOGIN_INFO_LINK)
-        self.wait_for_network_idle()
+        self.click_and_wait(self.FORGOT_LOGIN_INFO_LINK, WaitFor.navigation("**/lookup.htm"),
+                            WaitFor.element(self.RIGHT_PANEL))
     
     @allure.step("Navigate to registration page")
     def navigate_to_register(self):
         """Navigate to the registration page from login page"""
         logger.info("Navigating to registration page")
-        self.click(self.REGISTER_LINK)
-        self.wait_for_network_idle()
+        self.click_and_wait(self.REGISTER_LINK, WaitFor.navigation("**/register.htm"),
+                            WaitFor.element(self.RIGHT_PANEL))
     
     @allure.step("Check if login form is visible")
     def is_login_form_visible(self):
         """Check if login form is visible on the page"""
-        form_visible = (
-            self.is_element_visible(self.USERNAME_INPUT) and 
-            self.is_element_visible(self.PASSWORD_INPUT) and
-            self.is_element_visible(self.LOGIN_BUTTON)
-        )
+        form_visible = self.are_elements_visible(self.USERNAME_INPUT, self.PASSWORD_INPUT, self.LOGIN_BUTTON)
         logger.info(f"Login form visibility check: {form_visible}")
         return form_visible
     
@@ -87,8 +85,7 @@ class LoginPage(BasePage):
         """Log out the current user"""
         if self.is_user_logged_in():
             logger.info("Logging out user")
-            self.click(self.LOGOUT_LINK)
-            self.wait_for_network_idle()
+            self.click_and_wait(self.LOGOUT_LINK, WaitFor.navigation(), WaitFor.element(self.USERNAME_INPUT))
             assert self.is_login_form_visible(), "Logout failed - login form not visible after logout"
             return True
         logger.warning("Cannot logout - user is not logged in")
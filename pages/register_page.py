@@ -1,6 +1,7 @@
 import allure
 import logging
 from pages.base_page import BasePage
+from utils.waits import WaitFor
 
 logger = logging.getLogger(__name__)
 
@@ -8,6 +9,7 @@ class RegisterPage(BasePage):
     """Page object for the Registration page"""
     
     # Element locators
+    REGISTER_FORM = "#customerForm"
     FIRST_NAME_INPUT = "input[id='customer.firstName']"
     LAST_NAME_INPUT = "input[id='customer.lastName']"
     ADDRESS_INPUT = "input[id='customer.address.street']"
@@ -27,8 +29,8 @@ class RegisterPage(BasePage):
     def navigate(self):
         """Navigate to the registration page"""
         logger.info("Navigating to registration page")
-        self.page.goto("https://parabank.parasoft.com/parabank/register.htm")
-        self.wait_for_page_load()
+        self.page.goto(self.url_for("register.htm"), wait_until="domcontentloaded")
+        self.wait_until(WaitFor.element(self.FIRST_NAME_INPUT))
         # Verify we're on the registration page
         if not self.is_registration_form_visible():
             raise Exception("Failed to load registration page")
@@ -43,25 +45,25 @@ class RegisterPage(BasePage):
         """
         logger.info(f"Registering new user with username: {user_data.get('username', '')}")
         
-        # Fill in personal information
-        self.fill_text(self.FIRST_NAME_INPUT, user_data.get('firstName', ''))
-        self.fill_text(self.LAST_NAME_INPUT, user_data.get('lastName', ''))
-        self.fill_text(self.ADDRESS_INPUT, user_data.get('address', ''))
-        self.fill_text(self.CITY_INPUT, user_data.get('city', ''))
-        self.fill_text(self.STATE_INPUT, user_data.get('state', ''))
-        self.fill_text(self.ZIP_CODE_INPUT, user_data.get('zipCode', ''))
-        self.fill_text(self.PHONE_INPUT, user_data.get('phone', ''))
-        self.fill_text(self.SSN_INPUT, user_data.get('ssn', ''))
-        
-        # Fill in account information
-        self.fill_text(self.USERNAME_INPUT, user_data.get('username', ''))
-        self.fill_text(self.PASSWORD_INPUT, user_data.get('password', ''))
-        self.fill_text(self.CONFIRM_PASSWORD_INPUT, user_data.get('confirm', ''))
+        # Fill in personal and account information in one round trip
+        self.fill_form({
+            self.FIRST_NAME_INPUT: user_data.get('firstName', ''),
+            self.LAST_NAME_INPUT: user_data.get('lastName', ''),
+            self.ADDRESS_INPUT: user_data.get('address', ''),
+            self.CITY_INPUT: user_data.get('city', ''),
+            self.STATE_INPUT: user_data.get('state', ''),
+            self.ZIP_CODE_INPUT: user_data.get('zipCode', ''),
+            self.PHONE_INPUT: user_data.get('phone', ''),
+            self.SSN_INPUT: user_data.get('ssn', ''),
+            self.USERNAME_INPUT: user_data.get('username', ''),
+            self.PASSWORD_INPUT: user_data.get('password', ''),
+            self.CONFIRM_PASSWORD_INPUT: user_data.get('confirm', '')
+        }, self.REGISTER_FORM)
         
         # Submit registration form
         logger.info("Clicking register button")
-        self.click(self.REGISTER_BUTTON)
-        self.wait_for_network_idle()
+        # Both the success page and the re-rendered form with errors have a paragraph in the right panel
+        self.click_and_wait(self.REGISTER_BUTTON, WaitFor.navigation(), WaitFor.element(self.SUCCESS_MESSAGE))
         
         # Check for any error messages
         error_message = self.get_error_message()
@@ -107,10 +109,6 @@ class RegisterPage(BasePage):
     @allure.step("Check if registration form is visible")
     def is_registration_form_visible(self):
         """Check if registration form is visible on the page"""
-        form_visible = (
-            self.is_element_visible(self.FIRST_NAME_INPUT) and
-            self.is_element_visible(self.LAST_NAME_INPUT) and
-            self.is_element_visible(self.REGISTER_BUTTON)
-        )
+        form_visible = self.are_elements_visible(self.FIRST_NAME_INPUT, self.LAST_NAME_INPUT, self.REGISTER_BUTTON)
         logger.info(f"Registration form visibility check: {form_visible}")
         return form_visible 
\ No newline at end of file
@@ -0,0 +1,102 @@
+import allure
+import logging
+from pages.base_page import BasePage
+from utils.waits import WaitFor
+
+logger = logging.getLogger(__name__)
+
+class UpdateProfilePage(BasePage):
+    """Page object for the Update Contact Info page (requires a logged-in session)"""
+    
+    # Element locators
+    PROFILE_FORM = "#rightPanel form"
+    FIRST_NAME_INPUT = "input[id='customer.firstName']"
+    LAST_NAME_INPUT = "input[id='customer.lastName']"
+    ADDRESS_INPUT = "input[id='customer.address.street']"
+    CITY_INPUT = "input[id='customer.address.city']"
+    STATE_INPUT = "input[id='customer.address.state']"
+    ZIP_CODE_INPUT = "input[id='customer.address.zipCode']"
+    PHONE_INPUT = "input[id='customer.phoneNumber']"
+    UPDATE_BUTTON = "input[value='Update Profile']"
+    ERROR_MESSAGE = "#rightPanel .error"
+    RESULT_PANEL = "#updateProfileResult"
+    
+    @allure.step("Navigate to update profile page")
+    def navigate(self):
+        """Navigate to the update profile page"""
+        logger.info("Navigating to update profile page")
+        self.page.goto(self.url_for("updateprofile.htm"), wait_until="domcontentloaded")
+        # ParaBank fills the form from a customer lookup after load; reading or typing earlier races it
+        self.wait_until(WaitFor.element(self.FIRST_NAME_INPUT), WaitFor.value(self.FIRST_NAME_INPUT))
+    
+    def _field_map(self):
+        return {
+            'firstName': self.FIRST_NAME_INPUT,
+            'lastName': self.LAST_NAME_INPUT,
+            'address': self.ADDRESS_INPUT,
+            'city': self.CITY_INPUT,
+            'state': self.STATE_INPUT,
+            'zipCode': self.ZIP_CODE_INPUT,
+            'phone': self.PHONE_INPUT
+        }
+    
+    @allure.step("Get current profile")
+    def get_profile(self):
+        """
+        Read the contact information currently shown in the form
+        
+        Returns:
+            Dictionary with the same keys update_profile() accepts
+        """
+        return {key: self.get_element(selector).input_value() for key, selector in self._field_map().items()}
+    
+    @allure.step("Update profile")
+    def update_profile(self, profile_data):
+        """
+        Update the contact information of the logged-in customer
+        
+        Args:
+            profile_data: Dictionary with firstName, lastName, address, city,
+                state, zipCode and phone; missing keys keep the current value
+        
+        Returns:
+            True if the profile update was confirmed
+        """
+        field_map = self._field_map()
+        fields = {selector: profile_data[key] for key, selector in field_map.items() if key in profile_data}
+        logger.info(f"Updating profile fields: {', '.join(key for key in field_map if key in profile_data)}")
+        self.fill_form(fields, self.PROFILE_FORM)
+        
+        # ParaBank confirms in place while the stand-in server renders a new page;
+        # the result panel becoming visible covers both
+        self.click_and_wait(
+            self.UPDATE_BUTTON,
+            WaitFor.element(f"{self.RESULT_PANEL}:visible, {self.ERROR_MESSAGE}:visible")
+        )
+        
+        if self.is_element_visible(self.ERROR_MESSAGE, timeout=1000):
+            logger.error(f"Profile update error: {self.get_text(self.ERROR_MESSAGE)}")
+            return False
+        return self.is_element_visible(self.RESULT_PANEL, timeout=1000)
+    
+    @allure.step("Restore profile")
+    def restore_profile(self, profile_data):
+        """
+        Put back a profile read with get_profile()
+        
+        Args:
+            profile_data: Dictionary returned by get_profile()
+        
+        Raises:
+            AssertionError: If ParaBank did not confirm the update
+        """
+        self.navigate()
+        restored = self.update_profile(profile_data)
+        assert restored, f"Could not restore profile of {profile_data.get('firstName')} {profile_data.get('lastName')}"
+    
+    @allure.step("Get profile update result message")
+    def get_result_message(self):
+        """Get the confirmation text shown after updating the profile"""
+        if self.is_element_visible(self.RESULT_PANEL):
+            return self.get_text(self.RESULT_PANEL)
+        return None
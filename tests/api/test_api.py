@@ -2,6 +2,7 @@ import pytest
 import allure
 import requests
 from utils.api_helpers import APIHelpers
+from utils.response_logging import ResponseLogPolicy
 
 @allure.feature("API Testing")
 @allure.story("API Endpoints")
@@ -9,10 +10,11 @@ class TestAPI:
     """Test suite for API endpoints"""
     
     @pytest.fixture(scope="class")
-    def api_client(self, config):
-        """Create an API client"""
+    def api_client(self, config, api_cassette, response_cache):
+        """Create an API client (replaying recorded responses with --api-mode=replay)"""
         base_url = config["apiUrl"]
-        return APIHelpers(base_url)
+        return APIHelpers(base_url, cassette=api_cassette, log_policy=ResponseLogPolicy.from_config(config),
+                          cache=response_cache)
     
     @allure.title("Test API endpoint availability")
     @allure.severity(allure.severity_level.CRITICAL)
@@ -10,7 +10,7 @@ class TestLogin:
     @allure.title("User can login with valid credentials")
     @allure.severity(allure.severity_level.CRITICAL)
     @pytest.mark.smoke
-    def test_successful_login(self, page, config):
+    def test_successful_login(self, page, leased_user):
         """Verify that a user can login with valid credentials"""
         # Initialize page object
         login_page = LoginPage(page)
@@ -18,9 +18,9 @@ class TestLogin:
         # Navigate to login page
         login_page.navigate()
         
-        # Get user credentials from config
-        username = config['users']['default']['username']
-        password = config['users']['default']['password']
+        # Use a user leased exclusively to this test (the config's default user without a pool)
+        username = leased_user.username
+        password = leased_user.password
         
         # Perform login with valid credentials
         login_page.login(username, password)
@@ -69,27 +69,18 @@ class TestLogin:
     
     @allure.title("User can log out successfully")
     @allure.severity(allure.severity_level.CRITICAL)
-    def test_logout(self, page, config):
+    def test_logout(self, page, leased_user):
         """Verify that a logged-in user can successfully log out"""
-        # Initialize page object
+        # Log in on a session of its own: logging out of the cached one would end it for every worker
         login_page = LoginPage(page)
-        
-        # Navigate to login page
         login_page.navigate()
+        login_page.login(leased_user.username, leased_user.password)
         
-        # Get user credentials from config
-        username = config['users']['default']['username']
-        password = config['users']['default']['password']
-        
-        # Perform login
-        login_page.login(username, password)
-        
-        # Verify login was successful
+        # Verify user starts logged in
         assert page.locator("a:text('Log Out')").is_visible(), "Login failed, Log Out link not visible"
         
         # Perform logout
-        page.locator("a:text('Log Out')").click()
-        login_page.wait_for_network_idle()
+        assert login_page.logout(), "Logout could not be performed"
         
         # Take screenshot for report
         login_page.take_screenshot("logout_completed")
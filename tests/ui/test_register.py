@@ -3,7 +3,6 @@ import sys
 import pytest
 import allure
 import uuid
-import random
 from pathlib import Path
 from pages.register_page import RegisterPage
 from utils.data_generator import DataGenerator
@@ -35,23 +34,10 @@ class TestRegister:
             if 'users' in config and 'new_user' in config['users']:
                 # Use config data if available
                 user_data = dict(config['users']['new_user'])
-                user_data['username'] = f"testuser_{uuid.uuid4().hex[:8]}"
+                user_data['username'] = DataGenerator.unique_username("testuser_")
             else:
                 # Generate random test data if no config data
-                password = DataGenerator.random_password()
-                user_data = {
-                    'firstName': DataGenerator.random_first_name(),
-                    'lastName': DataGenerator.random_last_name(),
-                    'address': DataGenerator.random_address()['street'],
-                    'city': DataGenerator.random_address()['city'],
-                    'state': DataGenerator.random_address()['state'],
-                    'zipCode': DataGenerator.random_address()['zip'],
-                    'phone': DataGenerator.random_phone_number(),
-                    'ssn': ''.join([str(random.randint(0, 9)) for _ in range(9)]),
-                    'username': f"testuser_{DataGenerator.random_uuid()[:8]}",
-                    'password': password,
-                    'confirm': password
-                }
+                user_data = DataGenerator.registration_records(1)[0]
             
             # Attempt registration
             registration_successful = self.register_page.register_user(user_data)
@@ -0,0 +1,155 @@
+import pytest
+import allure
+from pages.login_page import LoginPage
+from pages.register_page import RegisterPage
+from pages.update_profile_page import UpdateProfilePage
+from utils.case_specs import CaseSpec
+from utils.data_generator import DataGenerator
+
+# Texts ParaBank shows for a rejected login (the data JSON's expected_error texts are not ParaBank's)
+LOGIN_ERRORS = ("could not be verified", "username and password", "error logging in")
+
+
+def _describe(case: CaseSpec) -> None:
+    """Name the Allure result after the spec"""
+    allure.dynamic.title(f"{case.id}: {case.title}")
+    if case.description:
+        allure.dynamic.description(case.description)
+    if case.priority:
+        allure.dynamic.tag(case.priority)
+
+
+def _flow(flows, case: CaseSpec):
+    if case.id not in flows:
+        pytest.skip(f"No page-object flow bound to {case.source} {case.id}")
+    return flows[case.id]
+
+
+# Login flows (test_cases/login.yaml and the data/test_login.json matrices)
+def login_succeeds(page, case: CaseSpec) -> None:
+    login_page = LoginPage(page)
+    login_page.navigate()
+    login_page.login(case.test_data["username"], case.test_data["password"])
+    assert "Accounts Overview" in page.title(), "User not redirected to accounts page after login"
+    assert login_page.is_user_logged_in(), "Log Out link not visible after login"
+
+
+def login_is_rejected(page, case: CaseSpec) -> None:
+    login_page = LoginPage(page)
+    login_page.navigate()
+    login_page.login(case.test_data["username"], case.test_data["password"])
+    error_message = login_page.get_error_message()
+    assert error_message is not None, "No error message displayed for rejected login"
+    assert any(text in error_message.lower() for text in LOGIN_ERRORS), f"Unexpected error message: {error_message}"
+    assert login_page.is_login_form_visible(), "Login form not visible after failed login"
+
+
+def login_form_is_complete(page, case: CaseSpec) -> None:
+    login_page = LoginPage(page)
+    login_page.navigate()
+    assert login_page.is_login_form_visible(), "Login form is incomplete"
+    assert page.locator("input[name='password']").get_attribute("type") == "password", "Password is not masked"
+    assert page.locator("a:text('Forgot login info?')").is_visible(), "Forgot login info link missing"
+    assert page.locator("a:text('Register')").is_visible(), "Register link missing"
+
+
+# Registration flows (test_cases/register.yaml)
+def registration_succeeds(page, case: CaseSpec) -> None:
+    data = case.test_data
+    register_page = RegisterPage(page)
+    register_page.navigate()
+    # The spec's username is only a template: registering it twice would fail on reruns
+    registered = register_page.register_user({
+        'firstName': data['first_name'],
+        'lastName': data['last_name'],
+        'address': data['address'],
+        'city': data['city'],
+        'state': data['state'],
+        'zipCode': data['zip_code'],
+        'phone': data['phone'],
+        'ssn': data['ssn'],
+        'username': DataGenerator.unique_username(f"{data['username']}_"),
+        'password': data['password'],
+        'confirm': data['confirm']
+    })
+    assert registered, "Registration should be successful with valid data"
+
+
+# Update profile flows (test_cases/update_profile.yaml), run on a logged-in page
+def profile_is_updated(page, case: CaseSpec) -> None:
+    data = case.test_data
+    profile_page = UpdateProfilePage(page)
+    profile_page.navigate()
+    updated = profile_page.update_profile({
+        'firstName': data['first_name'],
+        'lastName': data['last_name'],
+        'address': data['address'],
+        'city': data['city'],
+        'state': data['state'],
+        'zipCode': data['zip_code'],
+        'phone': data['phone']
+    })
+    assert updated, "Profile update was not confirmed"
+    assert "Profile Updated" in (profile_page.get_result_message() or "")
+
+
+LOGIN_FLOWS = {"TC001": login_succeeds, "TC002": login_is_rejected, "TC004": login_form_is_complete}
+REGISTER_FLOWS = {"TC101": registration_succeeds}
+PROFILE_FLOWS = {"TC201": profile_is_updated}
+
+
+@allure.feature("Authentication")
+@allure.story("Login")
+class TestLoginCases:
+    """Login cases generated from test_cases/login.yaml and data/test_login.json"""
+
+    @pytest.mark.login
+    @pytest.mark.cases("test_cases/login.yaml", automation="Automated")
+    def test_login_case(self, page, case):
+        """Run the page-object flow bound to a login.yaml case"""
+        _describe(case)
+        _flow(LOGIN_FLOWS, case)(page, case)
+
+    @pytest.mark.login
+    def test_rejected_logins(self, fan_out, case_specs):
+        """Every invalid or incomplete credential pair is rejected (cases run concurrently, listed one by one)"""
+        cases = case_specs.load("data/test_login.json", keys=("invalid_users", "validation_cases"))
+        results = fan_out(cases, login_is_rejected)
+        assert len(results) == len(cases)
+
+
+@allure.feature("Registration")
+@allure.story("User Registration")
+class TestRegisterCases:
+    """Registration cases generated from test_cases/register.yaml"""
+
+    @pytest.mark.register
+    @pytest.mark.cases("test_cases/register.yaml", automation="Automated")
+    def test_register_case(self, page, case):
+        """Run the page-object flow bound to a register.yaml case"""
+        _describe(case)
+        _flow(REGISTER_FLOWS, case)(page, case)
+
+
+@allure.feature("Account Services")
+@allure.story("Update Contact Info")
+class TestUpdateProfileCases:
+    """Update profile cases generated from test_cases/update_profile.yaml"""
+
+    @pytest.mark.cases("test_cases/update_profile.yaml", automation="Automated")
+    def test_update_profile_case(self, page, leased_user, user_pool, request, case):
+        """Run the page-object flow bound to an update_profile.yaml case as a leased user"""
+        _describe(case)
+        flow = _flow(PROFILE_FLOWS, case)
+        login_page = LoginPage(page)
+        login_page.navigate()
+        login_page.login(leased_user.username, leased_user.password)
+        assert login_page.is_user_logged_in(), "Could not log in as the leased user"
+
+        if user_pool is None or not user_pool.reset_on_release:
+            # Pooled users are reset on release; anyone else (the shared default account) is put back here
+            profile_page = UpdateProfilePage(page)
+            profile_page.navigate()
+            original = profile_page.get_profile()
+            request.addfinalizer(lambda: profile_page.restore_profile(original))
+        flow(page, case)
@@ -0,0 +1,39 @@
+import allure
+from pages.login_page import LoginPage
+from pages.update_profile_page import UpdateProfilePage
+
+@allure.feature("Account Services")
+@allure.story("Update Contact Info")
+class TestUpdateProfile:
+    """Test suite for the update profile flow (test_cases/update_profile.yaml)"""
+    
+    @allure.title("TC201: User can update contact information")
+    @allure.severity(allure.severity_level.CRITICAL)
+    def test_update_contact_information(self, page, leased_user, user_pool, request):
+        """Verify that a logged-in user can update their contact information"""
+        # A leased user keeps the change away from tests logging in concurrently
+        login_page = LoginPage(page)
+        login_page.navigate()
+        login_page.login(leased_user.username, leased_user.password)
+        assert login_page.is_user_logged_in(), "Could not log in as the leased user"
+        
+        profile_page = UpdateProfilePage(page)
+        profile_page.navigate()
+        if user_pool is None or not user_pool.reset_on_release:
+            # Pooled users are reset on release; anyone else (the shared default account) is put back here
+            original = profile_page.get_profile()
+            request.addfinalizer(lambda: profile_page.restore_profile(original))
+        
+        updated = profile_page.update_profile({
+            'firstName': "John",
+            'lastName': "Updated",
+            'address': "456 New Street",
+            'city': "New City",
+            'state': "CA",
+            'zipCode': "54321",
+            'phone': "555-123-4567"
+        })
+        
+        profile_page.take_screenshot("profile_updated")
+        assert updated, "Profile update was not confirmed"
+        assert "Profile Updated" in (profile_page.get_result_message() or "")
@@ -0,0 +1,61 @@
+import pytest
+from utils.api_helpers import APIHelpers, BatchRequestError, RequestSpec
+from utils.http_transport import PooledTransport
+from utils.parabank_server import ParaBankStubServer
+
+
+class TestAPIBatch:
+    """Concurrent batched requests"""
+
+    def test_responses_keep_spec_order(self):
+        """Responses come back in the order the specs were given"""
+        with ParaBankStubServer() as server:
+            server.state.add_customer({"firstName": "Jane", "lastName": "Doe"}, "jane", "secret")
+            client = APIHelpers(server.api_url)
+            result = client.batch(
+                [RequestSpec("GET", f"/customers/{customer_id}") for customer_id in (12212, 12223, 12212)] +
+                [{"method": "GET", "endpoint": "/login/jane/secret"}],
+                max_workers=4
+            )
+
+        assert result.ok
+        assert [r.json()["id"] for r in result.responses] == [12212, 12223, 12212, 12223]
+
+    def test_failures_are_reported_together(self):
+        """HTTP errors are collected without stopping the rest of the batch"""
+        with ParaBankStubServer() as server:
+            result = APIHelpers(server.api_url).batch([
+                RequestSpec("GET", "/customers/12212"),
+                RequestSpec("GET", "/customers/99999"),
+                RequestSpec("GET", "/customers/12212/accounts"),
+            ])
+
+        assert result.responses[0].status_code == 200
+        assert result.responses[2].status_code == 200
+        assert set(result.http_errors) == {1}
+        with pytest.raises(BatchRequestError, match=r"\[1\] GET /customers/99999: HTTP 400"):
+            result.raise_for_errors()
+
+    def test_transport_errors_do_not_raise(self):
+        """Connection failures are stored per request"""
+        result = APIHelpers("http://127.0.0.1:9").batch([RequestSpec("GET", "/customers/1", timeout=2)] * 2)
+
+        assert result.responses == [None, None]
+        assert set(result.errors) == {0, 1}
+        assert "ConnectionError" in result.error_report()
+
+    def test_batches_stay_within_the_shared_pool(self):
+        """A batch wider than the pool neither resizes it nor drops connections kept for other helpers"""
+        transport = PooledTransport(pool_maxsize=2)
+        with ParaBankStubServer() as server:
+            other = APIHelpers(server.api_url, transport=transport)
+            other.get("/customers/12212")
+            result = APIHelpers(server.api_url, transport=transport).batch(
+                [RequestSpec("GET", "/customers/12212")] * 8, max_workers=8
+            )
+            other.get("/customers/12212")
+        transport.shutdown()
+
+        assert result.ok
+        assert transport.pool_maxsize == 2
+        assert transport.stats.opened <= 2
@@ -0,0 +1,39 @@
+import os
+from utils.artifact_writer import ArtifactWriter
+
+
+class TestArtifactWriter:
+    """Background screenshot writer"""
+
+    def test_identical_screenshots_are_stored_once(self, tmp_path):
+        """Duplicates become hard links to the first file"""
+        writer = ArtifactWriter(output_dir=tmp_path)
+        writer.submit(b"same image", "first", to_allure=False)
+        writer.submit(b"same image", "second", to_allure=False)
+        writer.submit(b"other image", "third", to_allure=False)
+        writer.close()
+
+        assert sorted(os.listdir(tmp_path)) == ["first.png", "second.png", "third.png"]
+        assert (tmp_path / "second.png").read_bytes() == b"same image"
+        assert writer.written == 2
+        assert writer.deduplicated == 1
+
+    def test_writer_restarts_after_close(self, tmp_path):
+        """Artifacts submitted after a flush at session end are still written"""
+        writer = ArtifactWriter(output_dir=tmp_path, max_queue=1)
+        writer.submit(b"one", "one", to_allure=False)
+        writer.close()
+        writer.submit(b"two", "two", path=tmp_path / "nested" / "two.png", to_allure=False)
+        writer.close()
+
+        assert (tmp_path / "nested" / "two.png").read_bytes() == b"two"
+
+    def test_allure_attachment_is_made_on_the_calling_thread(self, tmp_path, monkeypatch):
+        """Allure gets the captured image right away; only disk output is queued"""
+        attached = []
+        monkeypatch.setattr("allure.attach", lambda body, name, attachment_type: attached.append((body, name)))
+        writer = ArtifactWriter(output_dir=tmp_path)
+        writer.submit(b"image", "report only", to_disk=False)
+
+        assert attached == [(b"image", "report only")]
+        assert writer._thread is None
@@ -0,0 +1,45 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from utils.async_api_helpers import AsyncAPIHelpers
+from utils.cassette import Cassette
+from utils.parabank_server import ParaBankStubServer
+
+
+def _run(coroutine):
+    """Run a scenario on its own event loop (sync Playwright leaves one running on the test thread)"""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+class TestAsyncAPIHelpers:
+    """aiohttp based API client"""
+
+    def test_concurrent_requests_share_the_pool(self):
+        """Many in-flight requests complete over a small connection pool"""
+        async def scenario(api_url):
+            async with AsyncAPIHelpers(api_url, limit=5) as client:
+                client.set_auth_token("token")
+                return await asyncio.gather(*(client.get("/customers/12212") for _ in range(50)))
+
+        with ParaBankStubServer() as server:
+            responses = _run(scenario(server.api_url))
+
+        assert all(AsyncAPIHelpers.is_success(r) for r in responses)
+        assert {r.json()["id"] for r in responses} == {12212}
+
+    def test_responses_replay_from_cassette(self, tmp_path):
+        """Responses recorded by the async client replay without a server"""
+        cassette_path = tmp_path / "async.json"
+
+        async def fetch(api_url, cassette):
+            async with AsyncAPIHelpers(api_url, cassette=cassette) as client:
+                return await client.get("/login", params={"username": "john", "password": "demo"})
+
+        with ParaBankStubServer() as server:
+            recorder = Cassette(cassette_path, mode="record")
+            recorded = _run(fetch(server.api_url, recorder))
+            recorder.save()
+        replayed = _run(fetch("http://127.0.0.1:9", Cassette(cassette_path, mode="replay")))
+
+        assert replayed.status_code == recorded.status_code == 200
+        assert replayed.json() == recorded.json()
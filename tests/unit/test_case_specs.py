@@ -0,0 +1,65 @@
+import pytest
+from utils.case_specs import CaseSpecCache, CaseSpecError, select_cases
+
+SPEC = """
+test_cases:
+  - id: TC001
+    title: Login with valid credentials
+    test_data:
+      username: john
+    priority: High
+    automation_status: Automated
+  - id: TC002
+    title: Login page UI verification
+    priority: Low
+    automation_status: Not Automated
+"""
+
+
+@pytest.fixture
+def cases_dir(tmp_path):
+    (tmp_path / "specs").mkdir()
+    return tmp_path
+
+
+class TestCaseSpecCache:
+    """Parsing, validation and the compiled cache of test_cases files"""
+
+    def test_compiled_cache_is_reused(self, cases_dir):
+        """A second process loads unchanged specs from the pickle; an edit recompiles them"""
+        spec = cases_dir / "specs" / "login.yaml"
+        spec.write_text(SPEC)
+        cache_dir = cases_dir / "cache"
+
+        first = CaseSpecCache(cache_dir, cases_dir).load("specs/login.yaml")
+        second = CaseSpecCache(cache_dir, cases_dir)
+
+        assert second.load("specs/login.yaml") == first
+        assert (second.hits, second.misses) == (1, 0)
+        assert [case.id for case in select_cases(first, automation="Automated")] == ["TC001"]
+
+        spec.write_text(SPEC.replace("john", "jane"))
+        edited = CaseSpecCache(cache_dir, cases_dir)
+        assert edited.load("specs/login.yaml")[0].test_data == {"username": "jane"}
+        assert edited.misses == 1
+        assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+    def test_entry_without_id_is_rejected(self, cases_dir):
+        """An entry missing its '- id:' line fails with the offending line instead of merging into its neighbour"""
+        broken = SPEC.replace("  - id: TC002\n", "\n")
+        (cases_dir / "specs" / "login.yaml").write_text(broken)
+
+        with pytest.raises(CaseSpecError, match="duplicate key 'title'"):
+            CaseSpecCache(cases_dir / "cache", cases_dir).load("specs/login.yaml")
+
+    def test_json_matrix_rows_become_cases(self, cases_dir):
+        """Rows of a data JSON list get ids from their key and position"""
+        (cases_dir / "specs" / "data.json").write_text(
+            '{"invalid_users": [{"username": "a", "password": "b"}], "validation_cases": [{"username": ""}]}'
+        )
+
+        cases = CaseSpecCache(cases_dir / "cache", cases_dir).load(
+            "specs/data.json", keys=("invalid_users", "validation_cases"))
+
+        assert [case.id for case in cases] == ["invalid_users[0]", "validation_cases[0]"]
+        assert cases[0].test_data == {"username": "a", "password": "b"}
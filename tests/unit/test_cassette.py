@@ -0,0 +1,82 @@
+import pytest
+from utils.api_helpers import APIHelpers
+from utils.cassette import Cassette, CassetteMissError
+from utils.parabank_server import ParaBankStubServer
+
+
+class TestCassette:
+    """Record/replay of APIHelpers traffic"""
+
+    def test_replay_serves_recorded_responses_without_network(self, tmp_path):
+        """Responses recorded against one server replay after it is gone"""
+        cassette_path = tmp_path / "api.json"
+
+        with ParaBankStubServer() as server:
+            recorder = Cassette(cassette_path, mode="record")
+            client = APIHelpers(server.api_url, cassette=recorder)
+            recorded = client.get("/customers/12212")
+            client.get("/login", params={"username": "john", "password": "demo"})
+            recorder.save()
+
+        player = Cassette(cassette_path, mode="replay")
+        client = APIHelpers("http://127.0.0.1:9/parabank/services/bank", cassette=player)
+        replayed = client.get("/customers/12212")
+
+        assert replayed.status_code == recorded.status_code
+        assert replayed.json() == recorded.json()
+        assert "application/json" in replayed.headers["Content-Type"]
+        assert client.get("/login", params={"password": "demo", "username": "john"}).json()["id"] == 12212
+        assert player.hits == 2
+
+    def test_strict_replay_fails_on_unrecorded_request(self, tmp_path):
+        """Strict cassettes refuse to fall through to the network"""
+        client = APIHelpers("http://127.0.0.1:9", cassette=Cassette(tmp_path / "empty.json", mode="replay"))
+
+        with pytest.raises(CassetteMissError):
+            client.get("/customers/1")
+
+    def test_match_on_ignores_unlisted_fields(self, tmp_path):
+        """Params are ignored when not part of the matching rules"""
+        cassette_path = tmp_path / "api.json"
+        with ParaBankStubServer() as server:
+            recorder = Cassette(cassette_path, mode="record")
+            APIHelpers(server.api_url, cassette=recorder).get("/customers/12212/accounts", params={"page": 1})
+            recorder.save()
+
+        player = Cassette(cassette_path, mode="replay", match_on=("method", "endpoint"))
+        response = APIHelpers("http://127.0.0.1:9", cassette=player).get("/customers/12212/accounts", params={"page": 2})
+
+        assert response.status_code == 200
+        assert response.json()[0]["customerId"] == 12212
+
+    def test_replay_rejects_fields_not_recorded(self, tmp_path):
+        """A cassette recorded without params matching cannot silently replay with it"""
+        cassette_path = tmp_path / "api.json"
+        with ParaBankStubServer() as server:
+            recorder = Cassette(cassette_path, mode="record", match_on=("method", "endpoint"))
+            APIHelpers(server.api_url, cassette=recorder).get("/customers/12212")
+            recorder.save()
+
+        with pytest.raises(ValueError, match="params"):
+            Cassette(cassette_path, mode="replay")
+
+    def test_rerecording_keeps_other_interactions(self, tmp_path):
+        """Recording a subset again replaces only the requests made again"""
+        cassette_path = tmp_path / "api.json"
+        with ParaBankStubServer() as server:
+            recorder = Cassette(cassette_path, mode="record")
+            client = APIHelpers(server.api_url, cassette=recorder)
+            client.get("/customers/12212")
+            client.get("/customers/12212/accounts")
+            recorder.save()
+
+            recorder = Cassette(cassette_path, mode="record")
+            APIHelpers(server.api_url, cassette=recorder).get("/customers/12212")
+            recorder.save()
+
+        player = Cassette(cassette_path, mode="replay")
+        client = APIHelpers("http://127.0.0.1:9", cassette=player)
+
+        assert client.get("/customers/12212").json()["id"] == 12212
+        assert client.get("/customers/12212/accounts").status_code == 200
+        assert len(player._interactions) == 2
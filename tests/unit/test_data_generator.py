@@ -0,0 +1,60 @@
+import pytest
+from utils.data_generator import DataGenerator
+
+
+@pytest.fixture(autouse=True)
+def unseeded():
+    yield
+    DataGenerator.seed(None)
+
+
+class TestBulkDataGeneration:
+    """Seeded, worker-sharded bulk records"""
+
+    def test_seed_reproduces_records(self):
+        """The same seed yields the same records"""
+        DataGenerator.seed(42)
+        first = DataGenerator.registration_records(5)
+        DataGenerator.seed(42)
+
+        assert DataGenerator.registration_records(5) == first
+        assert all(record["password"] == record["confirm"] for record in first)
+
+    def test_workers_never_share_ids(self, monkeypatch):
+        """Usernames and SSNs from different xdist workers do not collide under one seed"""
+        records = []
+        for worker in ("gw0", "gw1"):
+            monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+            monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+            DataGenerator.seed(7)
+            records += DataGenerator.registration_records(1000)
+
+        assert len({record["username"] for record in records}) == 2000
+        assert len({record["ssn"] for record in records}) == 2000
+
+    def test_unseeded_workers_share_the_run_offset(self, monkeypatch):
+        """Workers drawing offsets 1000 and 999 collide on their first id unless the run id sets one offset"""
+        def usernames(run_id):
+            offsets = iter([1000, 999])
+            monkeypatch.setattr("random.SystemRandom.randrange", lambda self, stop: next(offsets))
+            records = []
+            for worker in ("gw0", "gw1"):
+                monkeypatch.setenv("PYTEST_XDIST_WORKER", worker)
+                monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+                DataGenerator.seed(None, run_id=run_id)
+                records += DataGenerator.registration_records(1000)
+            return {record["username"] for record in records}
+
+        assert len(usernames(run_id=None)) < 2000
+        assert len(usernames(run_id="3f2b9c0e1a")) == 2000
+
+    def test_stream_yields_in_batches(self):
+        """Streaming stops after count records and card numbers pass the Luhn check"""
+        cards = list(DataGenerator.stream("card", count=25, batch_size=10))
+
+        def luhn_ok(number: str) -> bool:
+            digits = [int(d) for d in reversed(number)]
+            return sum(digits[0::2] + [sum(divmod(2 * d, 10)) for d in digits[1::2]]) % 10 == 0
+
+        assert len(cards) == 25
+        assert all(luhn_ok(card["number"]) for card in cards)
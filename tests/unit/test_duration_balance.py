@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+from utils.duration_balance import DurationHistory, DurationScheduling, MakespanStats, plan_longest_first
+
+HISTORY = {
+    "tests/ui/test_register.py::test_successful_registration": {"seconds": 30.0, "browser": True},
+    "tests/ui/test_open_browser.py::test_launch_multiple_browsers": {"seconds": 25.0, "browser": True},
+    "tests/ui/test_login.py::test_logout": {"seconds": 6.0, "browser": True},
+    "tests/api/test_api.py::test_get_customer": {"seconds": 2.0, "browser": False},
+    "tests/api/test_api.py::test_get_accounts": {"seconds": 2.0, "browser": False},
+    "tests/api/test_api.py::test_transfer": {"seconds": 1.0, "browser": False},
+}
+
+
+class FakeConfig:
+    def getvalue(self, name):
+        return ["2*popen"]
+
+    def getoption(self, name):
+        return None
+
+
+class FakeNode:
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.received = []
+
+    def send_runtest_some(self, indices):
+        self.received.extend(indices)
+
+    def shutdown(self):
+        self.shutting_down = True
+
+
+class TestDurationBalance:
+    """Longest-first planning and the xdist scheduler built on it"""
+
+    def test_long_browser_tests_go_to_different_workers(self):
+        """The two slowest browser tests are split and API tests fill the lighter worker"""
+        nodeids = list(HISTORY)
+        queues, loads = plan_longest_first(nodeids, DurationHistory(HISTORY), workers=2)
+
+        assert [nodeids[queue[0]] for queue in queues] == nodeids[:2]
+        assert loads == [33.0, 33.0]
+
+    def test_history_is_smoothed_and_estimates_unknown_tests(self):
+        """New measurements are averaged in; unseen tests get the median of their kind"""
+        history = DurationHistory(HISTORY)
+        cache = {}
+        fake_cache = SimpleNamespace(get=lambda key, default: cache.get(key, default),
+                                     set=lambda key, value: cache.__setitem__(key, value))
+        for when, seconds in (("setup", 1.0), ("call", 8.0), ("teardown", 1.0)):
+            history.record(SimpleNamespace(nodeid="tests/ui/test_login.py::test_logout", when=when,
+                                           duration=seconds, skipped=False, uses_browser=True))
+        history.save(fake_cache)
+
+        assert history.entries["tests/ui/test_login.py::test_logout"]["seconds"] == 8.0
+        assert history.estimate("tests/ui/test_new.py::test_new") == (25.0, True)
+        assert history.estimate("tests/api/test_new.py::test_new") == (2.0, False)
+        assert len(next(iter(cache.values()))) == len(HISTORY)
+
+    def test_scheduler_runs_every_test_once(self):
+        """Workers get their planned tests two at a time and idle workers take over queued work"""
+        stats = MakespanStats()
+        scheduler = DurationScheduling(FakeConfig(), history=DurationHistory(HISTORY), stats=stats)
+        nodes = [FakeNode("gw0"), FakeNode("gw1")]
+        for node in nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, list(HISTORY))
+        scheduler.schedule()
+
+        assert all(len(node.received) == 2 for node in nodes)
+        # gw1 finishes its tests quickly and must not go idle while gw0 still has queued work
+        while scheduler.node2pending[nodes[1]]:
+            scheduler.mark_test_complete(nodes[1], scheduler.node2pending[nodes[1]][0])
+        while scheduler.node2pending[nodes[0]]:
+            scheduler.mark_test_complete(nodes[0], scheduler.node2pending[nodes[0]][0])
+
+        assert sorted(nodes[0].received + nodes[1].received) == list(range(len(HISTORY)))
+        assert scheduler.tests_finished and all(node.shutting_down for node in nodes)
+        assert stats.predicted == {"gw0": 33.0, "gw1": 33.0}
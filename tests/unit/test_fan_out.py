@@ -0,0 +1,116 @@
+import asyncio
+import time
+import pytest
+from utils.fan_out import FAILED, PASSED, SKIPPED, FanOutRunner, _LoopBridge
+
+
+class FakeEventInfo:
+    def __init__(self, future: asyncio.Future):
+        self._future = future
+
+    @property
+    async def value(self) -> str:
+        return await self._future
+
+
+class FakeEventContext:
+    def __init__(self, future: asyncio.Future):
+        self._event = FakeEventInfo(future)
+
+    async def __aenter__(self) -> FakeEventInfo:
+        return self._event
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._event.value
+
+
+class FakePage:
+    """Async page stand-in: every action takes `delay` seconds on the event loop"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def goto(self, url: str) -> str:
+        await asyncio.sleep(self.delay)
+        return url
+
+    def expect_navigation(self) -> FakeEventContext:
+        future = asyncio.get_running_loop().create_future()
+        asyncio.get_running_loop().call_later(self.delay, future.set_result, "navigated")
+        return FakeEventContext(future)
+
+    async def screenshot(self, **kwargs) -> bytes:
+        return b"png"
+
+
+class FakeContext:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def new_page(self) -> FakePage:
+        return FakePage(self.delay)
+
+    async def close(self) -> None:
+        pass
+
+
+class FakeBrowser:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def is_connected(self) -> bool:
+        return True
+
+    async def new_context(self, **kwargs) -> FakeContext:
+        return FakeContext(self.delay)
+
+
+# Wrapped in blocking views like the objects of the async API
+for fake in (FakeEventInfo, FakeEventContext, FakePage, FakeContext, FakeBrowser):
+    fake.__module__ = "playwright.async_api"
+
+
+@pytest.fixture
+def runner():
+    runner = FanOutRunner(concurrency=8)
+    runner._bridge = _LoopBridge()
+    runner._browser = FakeBrowser(delay=0.2)
+    yield runner
+    runner._browser = None
+    runner.close()
+
+
+class TestFanOutRunner:
+    """Concurrent cases on one (fake) async browser through blocking page views"""
+
+    def test_cases_run_concurrently(self, runner):
+        """Eight cases of two 0.2 s actions each take about as long as one case"""
+        def flow(page, case):
+            with page.expect_navigation() as navigation:
+                assert page.goto(f"/case/{case['id']}") == f"/case/{case['id']}"
+            assert navigation.value == "navigated"
+
+        started = time.perf_counter()
+        results = runner.run([{"id": f"c{i}"} for i in range(8)], flow)
+
+        assert [result.outcome for result in results] == [PASSED] * 8
+        assert time.perf_counter() - started < 1.0
+
+    def test_each_case_gets_its_own_outcome(self, runner):
+        """Failures and skips are captured per case, with a screenshot of the failed page"""
+        def flow(page, case):
+            page.goto("/")
+            if case == "fail":
+                assert False, "wrong error message"
+            if case == "skip":
+                pytest.skip("no flow bound")
+            if case == "pytest.fail":
+                pytest.fail("not reachable")
+
+        results = runner.run(["ok", "fail", "skip", "pytest.fail"], flow)
+
+        assert [result.outcome for result in results] == [PASSED, FAILED, SKIPPED, FAILED]
+        assert [result.case_id for result in results] == ["0", "1", "2", "3"]
+        assert "wrong error message" in results[1].message
+        assert results[3].message == "Failed: not reachable"
+        assert results[1].screenshot == b"png"
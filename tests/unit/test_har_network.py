@@ -0,0 +1,17 @@
+from utils.har_network import HarNetwork
+
+
+class TestHarNetwork:
+    """Per-test HAR recording paths"""
+
+    def test_each_context_of_a_test_records_its_own_archive(self, tmp_path):
+        """A second context gets its own HAR, and the numbering restarts with the next run of the test"""
+        network = HarNetwork("record", har_dir=tmp_path)
+        test_id = "tests/ui/test_open_browser.py::test_launch_multiple_browsers[chromium]"
+
+        paths = [network.context_args(test_id)["record_har_path"] for _ in range(2)]
+        network.take_unmatched(test_id)
+
+        assert paths == [str(network.har_path(test_id)), str(network.har_path(test_id, 2))]
+        assert paths[1].endswith("_chromium-2.har")
+        assert network.context_args(test_id)["record_har_path"] == paths[0]
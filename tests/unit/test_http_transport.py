@@ -0,0 +1,36 @@
+import requests
+from utils.api_helpers import APIHelpers
+from utils.http_transport import PooledTransport
+from utils.parabank_server import ParaBankStubServer
+
+
+class TestPooledTransport:
+    """Shared connection pool and retries under APIHelpers"""
+
+    def test_helpers_share_connections(self):
+        """A connection opened by one helper is reused by the next"""
+        transport = PooledTransport()
+        with ParaBankStubServer() as server:
+            for _ in range(3):
+                client = APIHelpers(server.api_url, transport=transport)
+                assert client.get("/customers/12212").status_code == 200
+                client.session.close()
+        transport.shutdown()
+
+        assert transport.stats.requests == 3
+        assert transport.stats.opened == 1
+        assert transport.stats.reused == 2
+
+    def test_connection_errors_are_retried(self):
+        """Refused connections are retried up to the configured count"""
+        transport = PooledTransport.from_config({"retries": 2, "httpPool": {"backoffFactor": 0}})
+        client = APIHelpers("http://127.0.0.1:9", transport=transport)
+
+        try:
+            client.get("/customers/1")
+        except requests.ConnectionError as e:
+            assert "Max retries exceeded" in str(e)
+        else:
+            raise AssertionError("Expected a connection error")
+        assert transport.stats.requests == 1
+        assert transport.stats.opened == 3
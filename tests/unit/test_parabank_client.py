@@ -0,0 +1,46 @@
+import pytest
+from utils.api_helpers import APIHelpers
+from utils.parabank_client import Account, ParaBankAPIError, ParaBankClient
+from utils.parabank_server import ParaBankStubServer
+
+
+@pytest.fixture
+def bank():
+    with ParaBankStubServer() as server:
+        yield ParaBankClient(APIHelpers(server.api_url))
+
+
+class TestParaBankClient:
+    """Typed ParaBank service client"""
+
+    def test_bulk_account_setup(self, bank):
+        """Accounts are opened, funded and their transactions fetched in bulk"""
+        customer = bank.login("john", "demo")
+        checking = bank.get_accounts(customer.id)[0]
+
+        savings = bank.create_accounts(customer.id, checking.id, count=3, account_type="SAVINGS")
+        bank.fund_accounts([account.id for account in savings], 250)
+        history = bank.get_transactions_for(account.id for account in savings)
+
+        assert all(isinstance(account, Account) and account.type == "SAVINGS" for account in savings)
+        assert len({account.id for account in savings}) == 3
+        assert bank.get_account(checking.id).balance == pytest.approx(checking.balance - 300)
+        assert [sum(t.signed_amount for t in history[a.id]) for a in savings] == [350, 350, 350]
+
+    def test_transfer_loan_and_errors(self, bank):
+        """Money movement updates balances and service errors raise ParaBankAPIError"""
+        customer = bank.login("john", "demo")
+        checking = bank.get_accounts(customer.id)[0]
+        savings = bank.create_account(customer.id, checking.id, "SAVINGS")
+
+        bank.transfer(checking.id, savings.id, 15.5)
+        payment = bank.pay_bill(savings.id, 10, "Electric Co", 54321)
+        declined = bank.request_loan(customer.id, 1000, down_payment=10_000, from_account_id=checking.id)
+        approved = bank.request_loan(customer.id, 1000, down_payment=50, from_account_id=checking.id)
+
+        assert bank.get_account(savings.id).balance == pytest.approx(105.5)
+        assert payment.payee_name == "Electric Co"
+        assert not declined.approved and declined.message == "error.insufficient.funds.for.down.payment"
+        assert approved.approved and bank.get_account(approved.account_id).type == "LOAN"
+        with pytest.raises(ParaBankAPIError, match="Could not find account #1"):
+            bank.deposit(1, 10)
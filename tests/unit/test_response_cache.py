@@ -0,0 +1,52 @@
+from utils.api_helpers import APIHelpers
+from utils.parabank_server import ParaBankStubServer
+from utils.response_cache import ResponseCache
+from utils.response_logging import APIResponse
+
+
+def _response(body: bytes) -> APIResponse:
+    response = APIResponse()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+class TestResponseCache:
+    """TTL/LRU cache of GET responses"""
+
+    def test_repeated_gets_are_served_from_cache(self):
+        """Only the first GET reaches the server and each hit gets its own parsed JSON"""
+        cache = ResponseCache()
+        with ParaBankStubServer() as server:
+            client = APIHelpers(server.api_url, cache=cache)
+            first = client.get("/customers/12212")
+            first.json()["firstName"] = "Changed"
+            second = client.get("/customers/12212")
+            other_user = APIHelpers(server.api_url, cache=cache, headers={"Authorization": "Bearer other"})
+            other_user.get("/customers/12212")
+
+        assert second.json()["firstName"] == "John"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+    def test_mutation_invalidates_resource_prefix(self):
+        """A POST drops the cached entries under the prefixes it touches"""
+        cache = ResponseCache(invalidates={"/createAccount": ["/customers"]})
+        for endpoint in ("/customers/12212", "/customers/12212/accounts", "/accounts/13344"):
+            cache.put(("http://bank" + endpoint, "", ""), endpoint, _response(b"{}"))
+
+        assert cache.invalidate(*cache.prefixes_for("/createAccount")) == 2
+        assert len(cache) == 1
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """The memory bound evicts the entry read least recently, and zero TTLs are never stored"""
+        cache = ResponseCache(max_bytes=3000, ttls={"/loans/*": 0})
+        cache.put(("a",), "/a", _response(b"x" * 900))
+        cache.put(("b",), "/b", _response(b"x" * 900))
+        cache.get(("a",))
+        cache.put(("c",), "/c", _response(b"x" * 900))
+        cache.put(("d",), "/loans/1", _response(b"x"))
+
+        assert cache.get(("a",)) is not None
+        assert cache.get(("b",)) is None
+        assert cache.get(("d",)) is None
+        assert cache.stats.evicted == 1
@@ -0,0 +1,43 @@
+import json
+import requests
+from utils.response_logging import ResponseLogPolicy, as_api_response
+
+
+def _response(body: bytes, status_code: int = 200, content_type: str = "application/json") -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers["Content-Type"] = content_type
+    response.encoding = "utf-8"
+    response._content = body
+    return response
+
+
+class TestResponseLogging:
+    """Response log policy and cached JSON accessor"""
+
+    def test_json_is_parsed_once(self):
+        """Repeated json() calls return the same parsed object"""
+        response = as_api_response(_response(b'{"id": 12212}'))
+
+        assert response.json() is response.json()
+        assert response.json()["id"] == 12212
+
+    def test_large_bodies_are_truncated_before_decoding(self):
+        """Only max_body_bytes of a large payload are shown"""
+        payload = json.dumps([{"id": i} for i in range(1000)]).encode()
+        policy = ResponseLogPolicy(max_body_bytes=100)
+
+        text, is_json, truncated = policy.format_body(_response(payload))
+
+        assert truncated and is_json
+        assert text.startswith(payload[:100].decode())
+        assert f"[{len(payload) - 100} more bytes]" in text
+
+    def test_sampling_keeps_errors(self):
+        """Only every n-th success is sampled while errors always are"""
+        policy = ResponseLogPolicy(sample_rate=0.25)
+
+        sampled = [policy.sampled(_response(b"{}")) for _ in range(8)]
+
+        assert sampled.count(True) == 2
+        assert policy.sampled(_response(b"error", status_code=500, content_type="text/plain"))
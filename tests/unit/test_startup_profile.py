@@ -0,0 +1,27 @@
+from utils.startup_profile import child_args, parse_importtime
+
+
+class TestStartupProfile:
+    """python -X importtime parsing for --startup-profile"""
+
+    def test_parse_importtime(self):
+        """Module lines are parsed with their nesting depth, other stderr lines are skipped"""
+        output = "\n".join([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   faker.config",
+            "import time:       300 |        420 | faker",
+            "some warning",
+        ])
+
+        records = parse_importtime(output)
+
+        assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in records] == [
+            ("faker.config", 120, 120, 1), ("faker", 300, 420, 0)
+        ]
+        assert records[0].package == "faker"
+
+    def test_child_args_drop_xdist_options(self):
+        """The profiled run collects in a single process"""
+        args = child_args(["-n", "auto", "--dist=load", "-n4", "--startup-profile", "-k", "smoke"])
+
+        assert args == ["-k", "smoke", "--collect-only", "-q", "-p", "no:cacheprovider"]
@@ -0,0 +1,53 @@
+import dataclasses
+import json
+import pytest
+from utils.api_helpers import APIHelpers
+from utils.parabank_client import ParaBankClient
+from utils.parabank_server import ParaBankStubServer
+from utils.user_pool import UserPool, UserPoolExhausted
+
+
+@pytest.fixture
+def pool(tmp_path):
+    with ParaBankStubServer() as server:
+        yield UserPool(server.base_url, ParaBankClient(APIHelpers(server.api_url)), size=2,
+                       pool_dir=tmp_path, wait_seconds=0)
+
+
+class TestUserPool:
+    """Cross-worker pool of leased users"""
+
+    def test_leases_are_exclusive(self, pool):
+        """Each lease gets its own user and an exhausted pool raises"""
+        first = pool.lease("gw0:test_a")
+        second = pool.lease("gw1:test_b")
+
+        assert first.username != second.username
+        assert pool.client.login(first.username, first.password).id == first.customer_id
+        with pytest.raises(UserPoolExhausted):
+            pool.lease("gw2:test_c")
+
+        pool.release(first)
+        assert pool.lease("gw2:test_c").username == first.username
+
+    def test_release_resets_profile(self, pool):
+        """Profile and credential changes made during a lease are undone on release"""
+        user = pool.lease("gw0:test_a")
+        customer = pool.client.get_customer(user.customer_id)
+        pool.client.update_customer(dataclasses.replace(customer, first_name="Changed"), "renamed", "secret")
+
+        pool.release(user)
+
+        assert pool.client.login(user.username, user.password).first_name == user.profile["firstName"]
+
+    def test_stale_leases_are_reclaimed(self, pool):
+        """A lease held by a dead process is taken over"""
+        user = pool.lease("gw0:test_a")
+        pool.lease("gw1:test_b")
+        data = json.loads(pool.path.read_text())
+        for entry in data["users"]:
+            if entry["username"] == user.username:
+                entry["lease"]["pid"] = 2 ** 22 + 1
+        pool.path.write_text(json.dumps(data))
+
+        assert pool.lease("gw2:test_c").username == user.username
@@ -1,27 +1,97 @@
-import json
 import logging
 import requests
-from typing import Dict, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, List, Optional, Union
 from requests.exceptions import RequestException
 import allure
+from utils.artifact_writer import allure_enabled
+from utils.cassette import Cassette
+from utils.http_transport import PooledTransport, default_transport
+from utils.response_cache import MUTATING_METHODS, ResponseCache
+from utils.response_logging import APIResponse, ResponseLogPolicy, as_api_response
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class RequestSpec:
+    """One request of an APIHelpers.batch() call"""
+    method: str
+    endpoint: str
+    params: Optional[Dict[str, Any]] = None
+    data: Optional[Dict[str, Any]] = None
+    json_data: Optional[Dict[str, Any]] = None
+    headers: Optional[Dict[str, str]] = None
+    timeout: Optional[float] = None
+
+
+class BatchRequestError(Exception):
+    """Raised by BatchResult.raise_for_errors when requests of a batch failed"""
+
+
+@dataclass
+class BatchResult:
+    """Ordered outcome of APIHelpers.batch(): one response or error per spec"""
+    specs: List[RequestSpec]
+    responses: List[Optional[APIResponse]]
+    errors: Dict[int, Exception] = field(default_factory=dict)
+    
+    @property
+    def http_errors(self) -> Dict[int, APIResponse]:
+        """Responses with a 4xx/5xx status, by spec index"""
+        return {i: r for i, r in enumerate(self.responses) if r is not None and r.status_code >= 400}
+    
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.http_errors
+    
+    def error_report(self) -> str:
+        """One line per failed request, in spec order"""
+        failures = {**{i: f"HTTP {r.status_code}" for i, r in self.http_errors.items()},
+                    **{i: f"{type(e).__name__}: {e}" for i, e in self.errors.items()}}
+        return "\n".join(
+            f"[{i}] {self.specs[i].method} {self.specs[i].endpoint}: {failures[i]}" for i in sorted(failures)
+        )
+    
+    def raise_for_errors(self) -> None:
+        """
+        Raises:
+            BatchRequestError: Any request raised or returned a 4xx/5xx status
+        """
+        if not self.ok:
+            failed = len(self.errors) + len(self.http_errors)
+            raise BatchRequestError(f"{failed} of {len(self.specs)} batched requests failed:\n{self.error_report()}")
+
+
 class APIHelpers:
     """
     Utility class for API interactions
     """
     
-    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None):
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None,
+                 cassette: Optional[Cassette] = None, log_policy: Optional[ResponseLogPolicy] = None,
+                 transport: Optional[PooledTransport] = None, cache: Optional[ResponseCache] = None):
         """
         Initialize the API helper with base URL and optional headers
         
         Args:
             base_url: Base URL for API requests
             headers: Optional headers to include in all requests
+            cassette: Optional cassette to record responses to or replay them from
+            log_policy: How much of each response is logged (defaults to ResponseLogPolicy())
+            transport: Connection pool and retry policy (defaults to the worker's shared transport)
+            cache: Optional cache serving repeated GETs (shared between helpers of one API)
         """
         self.base_url = base_url
+        self.cassette = cassette
+        self.log_policy = log_policy or ResponseLogPolicy()
+        self.transport = transport or default_transport()
+        self.cache = cache
         self.session = requests.Session()
+        # Every helper of the worker mounts the same adapter, so keep-alive
+        # connections outlive the helper that opened them
+        for prefix in ("https://", "http://"):
+            self.session.mount(prefix, self.transport)
         
         # Set default headers
         default_headers = {
@@ -55,7 +125,7 @@ class APIHelpers:
     
     @allure.step("API GET: {endpoint}")
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
-            headers: Optional[Dict[str, str]] = None) -> requests.Response:
+            headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """
         Perform GET request
         
@@ -65,13 +135,13 @@ class APIHelpers:
             headers: Optional additional headers
             
         Returns:
-            Response object
+            Response object (json() is parsed once and cached)
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"Making GET request to {url}")
         
         try:
-            response = self.session.get(url, params=params, headers=headers)
+            response = self._send("GET", endpoint, params=params, headers=headers)
             self._log_response(response)
             return response
         except RequestException as e:
@@ -82,7 +152,7 @@ class APIHelpers:
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
              json_data: Optional[Dict[str, Any]] = None,
              params: Optional[Dict[str, Any]] = None,
-             headers: Optional[Dict[str, str]] = None) -> requests.Response:
+             headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """
         Perform POST request
         
@@ -94,14 +164,14 @@ class APIHelpers:
             headers: Optional additional headers
             
         Returns:
-            Response object
+            Response object (json() is parsed once and cached)
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"Making POST request to {url}")
         
         try:
-            response = self.session.post(url, data=data, json=json_data, 
-                                        params=params, headers=headers)
+            response = self._send("POST", endpoint, data=data, json_data=json_data,
+                                  params=params, headers=headers)
             self._log_response(response)
             return response
         except RequestException as e:
@@ -112,7 +182,7 @@ class APIHelpers:
     def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
             json_data: Optional[Dict[str, Any]] = None,
             params: Optional[Dict[str, Any]] = None,
-            headers: Optional[Dict[str, str]] = None) -> requests.Response:
+            headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """
         Perform PUT request
         
@@ -124,14 +194,14 @@ class APIHelpers:
             headers: Optional additional headers
             
         Returns:
-            Response object
+            Response object (json() is parsed once and cached)
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"Making PUT request to {url}")
         
         try:
-            response = self.session.put(url, data=data, json=json_data, 
-                                       params=params, headers=headers)
+            response = self._send("PUT", endpoint, data=data, json_data=json_data,
+                                  params=params, headers=headers)
             self._log_response(response)
             return response
         except RequestException as e:
@@ -140,7 +210,7 @@ class APIHelpers:
     
     @allure.step("API DELETE: {endpoint}")
     def delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
-               headers: Optional[Dict[str, str]] = None) -> requests.Response:
+               headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """
         Perform DELETE request
         
@@ -150,13 +220,13 @@ class APIHelpers:
             headers: Optional additional headers
             
         Returns:
-            Response object
+            Response object (json() is parsed once and cached)
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"Making DELETE request to {url}")
         
         try:
-            response = self.session.delete(url, params=params, headers=headers)
+            response = self._send("DELETE", endpoint, params=params, headers=headers)
             self._log_response(response)
             return response
         except RequestException as e:
@@ -167,7 +237,7 @@ class APIHelpers:
     def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
               json_data: Optional[Dict[str, Any]] = None,
               params: Optional[Dict[str, Any]] = None,
-              headers: Optional[Dict[str, str]] = None) -> requests.Response:
+              headers: Optional[Dict[str, str]] = None) -> APIResponse:
         """
         Perform PATCH request
         
@@ -179,65 +249,165 @@ class APIHelpers:
             headers: Optional additional headers
             
         Returns:
-            Response object
+            Response object (json() is parsed once and cached)
         """
         url = f"{self.base_url}{endpoint}"
         logger.info(f"Making PATCH request to {url}")
         
         try:
-            response = self.session.patch(url, data=data, json=json_data, 
-                                         params=params, headers=headers)
+            response = self._send("PATCH", endpoint, data=data, json_data=json_data,
+                                  params=params, headers=headers)
             self._log_response(response)
             return response
         except RequestException as e:
             logger.error(f"PATCH request to {url} failed: {str(e)}")
             raise
     
+    def _send(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+              data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None,
+              headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> APIResponse:
+        """
+        Send a request through the session, or serve it from the cache or the cassette
+        
+        Successful GETs are stored in the response cache; other methods invalidate
+        the cached resources they touch.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (will be appended to base_url)
+            params: Optional query parameters
+            data: Optional form data
+            json_data: Optional JSON data
+            headers: Optional additional headers
+            timeout: Optional timeout in seconds
+            
+        Returns:
+            Response object
+        """
+        cache_key = None
+        if self.cache is not None and method == "GET":
+            cache_key = self.cache.key(self.session, self.base_url, endpoint, params, headers)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Served GET {endpoint} from the response cache")
+                return cached
+        
+        response = self._send_uncached(method, endpoint, params, data, json_data, headers, timeout)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, endpoint, response)
+        elif self.cache is not None and method in MUTATING_METHODS:
+            self.cache.invalidate(*self.cache.prefixes_for(endpoint))
+        return response
+    
+    def _send_uncached(self, method: str, endpoint: str, params: Optional[Dict[str, Any]],
+                       data: Optional[Dict[str, Any]], json_data: Optional[Dict[str, Any]],
+                       headers: Optional[Dict[str, str]], timeout: Optional[float]) -> APIResponse:
+        """Send a request through the session, or serve it from the cassette when replaying"""
+        if self.cassette is not None:
+            response = self.cassette.play(method, self.base_url, endpoint, params=params,
+                                          data=data, json_data=json_data)
+            if response is not None:
+                logger.debug(f"Replayed {method} {endpoint} from cassette")
+                return as_api_response(response)
+        
+        response = self.session.request(method, f"{self.base_url}{endpoint}", params=params,
+                                        data=data, json=json_data, headers=headers, timeout=timeout)
+        
+        if self.cassette is not None:
+            self.cassette.record(method, endpoint, params, data, json_data, response)
+        return as_api_response(response)
+    
+    def batch(self, specs: Iterable[Union[RequestSpec, Dict[str, Any]]], max_workers: int = 10,
+              timeout: Optional[float] = 30) -> BatchResult:
+        """
+        Send several requests concurrently and return their responses in order
+        
+        Requests run on a bounded thread pool sharing this helper's transport.
+        At most the transport's pool_maxsize (httpPool.poolMaxsize) requests are
+        in flight, so every one keeps its connection instead of it being
+        discarded; the shared pool is never resized under other helpers. A
+        failing request does not stop the others; inspect the result or call
+        raise_for_errors().
+        
+        Args:
+            specs: RequestSpec objects or dicts with the same keys
+            max_workers: Requests in flight at most (capped at the transport's pool size)
+            timeout: Default per-request timeout in seconds (a spec's own timeout wins)
+            
+        Returns:
+            BatchResult with one response or error per spec
+        """
+        specs = [spec if isinstance(spec, RequestSpec) else RequestSpec(**spec) for spec in specs]
+        responses: List[Optional[APIResponse]] = [None] * len(specs)
+        result = BatchResult(specs, responses)
+        if not specs:
+            return result
+        
+        workers = max(1, min(max_workers, len(specs)))
+        if workers > self.transport.pool_maxsize:
+            logger.info(f"Batch limited to {self.transport.pool_maxsize} concurrent requests by the HTTP pool size "
+                        f"(raise httpPool.poolMaxsize for more)")
+            workers = self.transport.pool_maxsize
+        
+        def _run(spec: RequestSpec) -> APIResponse:
+            return self._send(spec.method.upper(), spec.endpoint, params=spec.params, data=spec.data,
+                              json_data=spec.json_data, headers=spec.headers,
+                              timeout=spec.timeout if spec.timeout is not None else timeout)
+        
+        with allure.step(f"API batch: {len(specs)} requests"):
+            logger.info(f"Sending {len(specs)} batched requests with {workers} workers")
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-batch") as executor:
+                futures = [executor.submit(_run, spec) for spec in specs]
+                for index, future in enumerate(futures):
+                    try:
+                        responses[index] = future.result()
+                    except Exception as e:
+                        result.errors[index] = e
+            
+            # Logged on the calling thread so Allure attaches to this step
+            for response in responses:
+                if response is not None:
+                    self._log_response(response)
+            if not result.ok:
+                logger.warning(f"Batch finished with failures:\n{result.error_report()}")
+        return result
+    
     def _log_response(self, response: requests.Response) -> None:
         """
         Log response details and attach to Allure report
         
+        Headers and body are only formatted when a DEBUG record or an Allure
+        attachment will be produced, within the limits of the log policy.
+        
         Args:
             response: Response object to log
         """
         logger.info(f"Response status code: {response.status_code}")
         
-        # Log headers
-        header_str = "\n".join([f"{k}: {v}" for k, v in response.headers.items()])
-        logger.debug(f"Response headers:\n{header_str}")
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        attach = self.log_policy.attach_to_allure and allure_enabled()
+        if not (log_debug or attach) or not self.log_policy.sampled(response):
+            return
         
-        # Try to parse and log JSON response
-        try:
-            if response.text:
-                # Format the JSON for better readability
-                formatted_json = json.dumps(response.json(), indent=2)
-                logger.debug(f"Response body:\n{formatted_json}")
-                
-                # Attach to Allure report
-                allure.attach(
-                    formatted_json,
-                    name=f"Response {response.status_code}",
-                    attachment_type=allure.attachment_type.JSON
-                )
-            else:
-                logger.debug("Response body is empty")
-        except ValueError:
-            # Not a JSON response
-            if len(response.text) > 1000:
-                logger.debug(f"Response body (truncated):\n{response.text[:1000]}...")
-                allure.attach(
-                    response.text[:1000] + "...",
-                    name=f"Response {response.status_code} (truncated)",
-                    attachment_type=allure.attachment_type.TEXT
-                )
-            else:
-                logger.debug(f"Response body:\n{response.text}")
-                if response.text:
-                    allure.attach(
-                        response.text,
-                        name=f"Response {response.status_code}",
-                        attachment_type=allure.attachment_type.TEXT
-                    )
+        if log_debug:
+            header_str = "\n".join([f"{k}: {v}" for k, v in response.headers.items()])
+            logger.debug(f"Response headers:\n{header_str}")
+        
+        if not response.content:
+            logger.debug("Response body is empty")
+            return
+        
+        body, is_json, truncated = self.log_policy.format_body(response)
+        name = f"Response {response.status_code}{' (truncated)' if truncated else ''}"
+        if log_debug:
+            logger.debug(f"Response body{' (truncated)' if truncated else ''}:\n{body}")
+        if attach:
+            allure.attach(
+                body,
+                name=name,
+                attachment_type=allure.attachment_type.JSON if is_json and not truncated else allure.attachment_type.TEXT
+            )
     
     @staticmethod
     def is_success(response: requests.Response) -> bool:
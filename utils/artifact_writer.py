@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import io
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import allure
+from allure_commons import plugin_manager
+from config.env import SCREENSHOTS_DIR
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, only needed for WebP output
+    Image = None
+
+IMAGE_FORMATS = ("png", "jpeg", "webp")
+
+_ATTACHMENT_TYPES = {"png": allure.attachment_type.PNG, "jpeg": allure.attachment_type.JPG}
+_EXTENSIONS = {"png": "png", "jpeg": "jpg", "webp": "webp"}
+
+
+def allure_enabled() -> bool:
+    """Whether attachments are recorded (tests run with --alluredir)"""
+    return bool(plugin_manager.hook.attach_data.get_hookimpls())
+
+
+class ArtifactWriter:
+    """
+    Writes screenshots to disk from a background thread
+
+    The test thread only captures the image and attaches it to Allure as
+    captured (PNG or JPEG, so no encoding is needed there; Allure ties an
+    attachment to the test or step current on the calling thread). WebP
+    conversion and the files under output_dir are handled by the writer
+    thread. Identical images are stored once on disk: duplicates are hard
+    links to the first copy.
+    """
+
+    def __init__(self, output_dir: Path = SCREENSHOTS_DIR, image_format: str = "png",
+                 quality: Optional[int] = None, max_queue: int = 64, dedupe: bool = True):
+        """
+        Initialize the writer
+
+        Args:
+            output_dir: Directory for screenshots saved by name
+            image_format: png, jpeg (captured natively) or webp (converted for disk, needs Pillow)
+            quality: JPEG/WebP quality 0-100, None for the encoder default
+            max_queue: Artifacts buffered before submit() applies backpressure
+            dedupe: Store identical images once on disk
+        """
+        self.output_dir = Path(output_dir)
+        self.max_queue = max_queue
+        self.configure(image_format=image_format, quality=quality, dedupe=dedupe)
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stored: Dict[str, Path] = {}
+        self.written = 0
+        self.deduplicated = 0
+        self.bytes_written = 0
+        self.failed = 0
+
+    def configure(self, image_format: str = "png", quality: Optional[int] = None,
+                  dedupe: bool = True, max_queue: Optional[int] = None) -> None:
+        """Change the output settings (applies to artifacts submitted afterwards)"""
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown image format '{image_format}', expected one of {', '.join(IMAGE_FORMATS)}")
+        if image_format == "webp" and Image is None:
+            logger.warning("WebP screenshots need Pillow, falling back to PNG")
+            image_format = "png"
+        self.image_format = image_format
+        self.quality = quality
+        self.dedupe = dedupe
+        if max_queue is not None:
+            self.max_queue = max_queue
+
+    def apply_config(self, config: Dict[str, Any]) -> None:
+        """Apply the config's artifacts section (defaults when absent)"""
+        section = config.get("artifacts", {})
+        self.configure(
+            image_format=section.get("screenshotFormat", "png"),
+            quality=section.get("quality"),
+            dedupe=section.get("dedupe", True),
+            max_queue=section.get("queueSize")
+        )
+
+    @property
+    def extension(self) -> str:
+        """File extension of screenshots in the configured format"""
+        return _EXTENSIONS[self.image_format]
+
+    def screenshot_options(self) -> Dict[str, Any]:
+        """page.screenshot() arguments for the configured format"""
+        if self.image_format == "jpeg":
+            options = {"type": "jpeg"}
+            if self.quality is not None:
+                options["quality"] = self.quality
+            return options
+        # WebP is converted from PNG on the writer thread
+        return {"type": "png"}
+
+    def capture(self, page: Page, **kwargs) -> bytes:
+        """
+        Capture a screenshot without going through reporting wrappers
+
+        Args:
+            page: Page to capture
+            kwargs: Extra page.screenshot() arguments (full_page, clip, ...)
+        """
+        screenshot = inspect.unwrap(page.screenshot)
+        return screenshot(**{**self.screenshot_options(), **kwargs})
+
+    def _ensure_started(self) -> queue.Queue:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._queue = queue.Queue(maxsize=self.max_queue)
+                self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+                self._thread.start()
+            return self._queue
+
+    def submit(self, data: bytes, name: str, path: Optional[Path] = None, image_format: Optional[str] = None,
+               to_disk: bool = True, to_allure: bool = True) -> None:
+        """
+        Queue a captured screenshot for writing
+
+        Args:
+            data: Image bytes as captured (see screenshot_options)
+            name: Attachment name; also the file name under output_dir
+            path: Explicit file path instead of output_dir/<name>.<ext>
+            image_format: Output format when it differs from the configured one
+            to_disk: Save the image as a file
+            to_allure: Attach the image to the current Allure test or step
+        """
+        image_format = image_format or self.image_format
+        if to_allure:
+            # WebP is converted from the captured PNG, so that is what Allure gets
+            captured = "jpeg" if image_format == "jpeg" else "png"
+            allure.attach(data, name=name, attachment_type=_ATTACHMENT_TYPES[captured])
+        if not to_disk:
+            return
+
+        disk_path = Path(path) if path is not None else self.output_dir / f"{name}.{_EXTENSIONS[image_format]}"
+        artifacts = self._ensure_started()
+        job = (data, image_format, self.quality, disk_path)
+        try:
+            artifacts.put_nowait(job)
+        except queue.Full:
+            logger.warning(f"Artifact queue full ({self.max_queue}), waiting for the writer")
+            artifacts.put(job)
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._write(*job)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Failed to write artifact: {e}")
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    def _encode(data: bytes, image_format: str, quality: Optional[int]) -> bytes:
+        if image_format != "webp":
+            return data
+        output = io.BytesIO()
+        Image.open(io.BytesIO(data)).save(output, format="WEBP", quality=quality if quality is not None else 80)
+        return output.getvalue()
+
+    def _write(self, data: bytes, image_format: str, quality: Optional[int], disk_path: Path) -> None:
+        digest = hashlib.sha256(data).hexdigest()
+        disk_path.parent.mkdir(parents=True, exist_ok=True)
+        existing = self._stored.get(digest) if self.dedupe else None
+        if existing is not None and existing.exists():
+            if existing == disk_path:
+                self.deduplicated += 1
+                return
+            try:
+                if disk_path.exists():
+                    disk_path.unlink()
+                os.link(existing, disk_path)
+                self.deduplicated += 1
+                return
+            except OSError:
+                pass  # No hard links on this filesystem, write a copy
+        encoded = self._encode(data, image_format, quality)
+        tmp_path = disk_path.with_name(f".{disk_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(encoded)
+        os.replace(tmp_path, disk_path)
+        self._stored[digest] = disk_path
+        self.written += 1
+        self.bytes_written += len(encoded)
+
+    def flush(self) -> None:
+        """Block until every queued artifact has been written"""
+        if self._queue is not None and self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def close(self) -> None:
+        """Flush and stop the writer thread (it restarts on the next submit)"""
+        self.flush()
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._thread = None
+        if self.written or self.deduplicated:
+            logger.info(
+                f"Artifacts: {self.written} written, {self.deduplicated} deduplicated, "
+                f"{self.bytes_written / 1024:.0f} KB, {self.failed} failed"
+            )
+
+
+# Process-wide writer used by page objects and the failure screenshot hook
+ARTIFACT_WRITER = ArtifactWriter()
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import allure
+from requests.structures import CaseInsensitiveDict
+from utils.artifact_writer import allure_enabled
+from utils.cassette import Cassette
+from utils.response_logging import APIResponse, ResponseLogPolicy, as_api_response
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAPIHelpers:
+    """
+    asyncio counterpart of APIHelpers built on aiohttp
+
+    Requests share one keep-alive connection pool (an aiohttp TCPConnector), so
+    thousands of requests can be in flight from a single event loop. Responses
+    are fully read and returned as APIResponse objects, the same type the sync
+    APIHelpers returns, so assertions, cassettes and logging work unchanged.
+
+    Usage:
+        async with AsyncAPIHelpers(config["apiUrl"]) as client:
+            responses = await asyncio.gather(*(client.get(f"/customers/{i}") for i in ids))
+    """
+
+    def __init__(self, base_url: str, headers: Optional[Dict[str, str]] = None,
+                 cassette: Optional[Cassette] = None, log_policy: Optional[ResponseLogPolicy] = None,
+                 limit: int = 100, limit_per_host: int = 0, timeout: float = 30,
+                 connector: Optional[aiohttp.BaseConnector] = None):
+        """
+        Initialize the async API helper
+
+        Args:
+            base_url: Base URL for API requests
+            headers: Optional headers to include in all requests
+            cassette: Optional cassette to record responses to or replay them from
+            log_policy: How much of each response is logged (defaults to ResponseLogPolicy())
+            limit: Open connections at most (requests beyond it wait for a free connection)
+            limit_per_host: Open connections per host at most (0 for no extra limit)
+            timeout: Default total timeout per request in seconds
+            connector: Connection pool shared with other clients (not closed by this client)
+        """
+        self.base_url = base_url
+        self.cassette = cassette
+        self.log_policy = log_policy or ResponseLogPolicy()
+        self.timeout = timeout
+        self.headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json"
+        }
+        if headers:
+            self.headers.update(headers)
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._connector = connector
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncAPIHelpers":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """The client session, created on first use inside the running event loop"""
+        import aiohttp  # deferred: importing aiohttp costs ~100 ms of every worker's startup
+        if self._session is None or self._session.closed:
+            owns_connector = self._connector is None
+            connector = self._connector or aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                connector_owner=owns_connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session and, unless it is shared, its connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    def update_headers(self, headers: Dict[str, str]) -> None:
+        """
+        Update headers sent with every request
+
+        Args:
+            headers: Headers to update or add
+        """
+        self.headers.update(headers)
+
+    def set_auth_token(self, token: str) -> None:
+        """
+        Set authentication token in headers
+
+        Args:
+            token: Authentication token
+        """
+        self.headers.update({"Authorization": f"Bearer {token}"})
+
+    async def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> APIResponse:
+        """Perform GET request (see APIHelpers.get)"""
+        return await self.request("GET", endpoint, params=params, headers=headers)
+
+    async def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                   json_data: Optional[Dict[str, Any]] = None,
+                   params: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None) -> APIResponse:
+        """Perform POST request (see APIHelpers.post)"""
+        return await self.request("POST", endpoint, params=params, data=data, json_data=json_data, headers=headers)
+
+    async def put(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                  json_data: Optional[Dict[str, Any]] = None,
+                  params: Optional[Dict[str, Any]] = None,
+                  headers: Optional[Dict[str, str]] = None) -> APIResponse:
+        """Perform PUT request (see APIHelpers.put)"""
+        return await self.request("PUT", endpoint, params=params, data=data, json_data=json_data, headers=headers)
+
+    async def delete(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                     headers: Optional[Dict[str, str]] = None) -> APIResponse:
+        """Perform DELETE request (see APIHelpers.delete)"""
+        return await self.request("DELETE", endpoint, params=params, headers=headers)
+
+    async def patch(self, endpoint: str, data: Optional[Dict[str, Any]] = None,
+                    json_data: Optional[Dict[str, Any]] = None,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> APIResponse:
+        """Perform PATCH request (see APIHelpers.patch)"""
+        return await self.request("PATCH", endpoint, params=params, data=data, json_data=json_data, headers=headers)
+
+    async def request(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                      data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> APIResponse:
+        """
+        Send a request, or serve it from the cassette when replaying
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint (will be appended to base_url)
+            params: Optional query parameters
+            data: Optional form data
+            json_data: Optional JSON data
+            headers: Optional additional headers
+            timeout: Optional timeout in seconds overriding the client default
+
+        Returns:
+            Fully read response
+        """
+        import aiohttp
+        url = f"{self.base_url}{endpoint}"
+        logger.info(f"Making {method} request to {url}")
+
+        response = None
+        if self.cassette is not None:
+            response = self.cassette.play(method, self.base_url, endpoint, params=params,
+                                          data=data, json_data=json_data)
+        if response is None:
+            try:
+                response = await self._send(method, url, params, data, json_data, headers, timeout)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"{method} request to {url} failed: {e!r}")
+                raise
+            if self.cassette is not None:
+                self.cassette.record(method, endpoint, params, data, json_data, response)
+        else:
+            logger.debug(f"Replayed {method} {endpoint} from cassette")
+            response = as_api_response(response)
+
+        # The step is opened after the await so concurrent requests never interleave
+        # inside one Allure step; its timing covers logging, not the request
+        if allure_enabled():
+            with allure.step(f"API {method}: {endpoint}"):
+                self._log_response(response)
+        else:
+            self._log_response(response)
+        return response
+
+    async def _send(self, method: str, url: str, params: Optional[Dict[str, Any]], data: Optional[Dict[str, Any]],
+                    json_data: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]],
+                    timeout: Optional[float]) -> APIResponse:
+        import aiohttp
+        request_headers = {**self.headers, **(headers or {})}
+        if data is not None and json_data is None:
+            # Let aiohttp set the form content type
+            request_headers.pop("Content-Type", None)
+        request_timeout = aiohttp.ClientTimeout(total=timeout) if timeout is not None else None
+        async with self._get_session().request(method, url, params=params, data=data, json=json_data,
+                                               headers=request_headers, timeout=request_timeout) as raw:
+            content = await raw.read()
+            response = APIResponse()
+            response.status_code = raw.status
+            response.reason = raw.reason
+            response.headers = CaseInsensitiveDict(raw.headers)
+            response.encoding = raw.charset
+            response.url = str(raw.url)
+            response._content = content
+            return response
+
+    def _log_response(self, response: APIResponse) -> None:
+        """Log the response within the limits of the log policy (same format as APIHelpers)"""
+        logger.info(f"Response status code: {response.status_code}")
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+        attach = self.log_policy.attach_to_allure and allure_enabled()
+        if not (log_debug or attach) or not response.content or not self.log_policy.sampled(response):
+            return
+        body, is_json, truncated = self.log_policy.format_body(response)
+        if log_debug:
+            logger.debug(f"Response body{' (truncated)' if truncated else ''}:\n{body}")
+        if attach:
+            allure.attach(
+                body,
+                name=f"Response {response.status_code}{' (truncated)' if truncated else ''}",
+                attachment_type=allure.attachment_type.JSON if is_json and not truncated else allure.attachment_type.TEXT
+            )
+
+    @staticmethod
+    def is_success(response: APIResponse) -> bool:
+        """Check if response is successful (status code 2xx)"""
+        return 200 <= response.status_code < 300
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from config.env import AUTH_STATE_DIR
+from pages.login_page import LoginPage
+from utils.browser_manager import BrowserManager
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext
+
+logger = logging.getLogger(__name__)
+
+# ParaBank expires an idle JSESSIONID after roughly 20 minutes
+DEFAULT_TTL_SECONDS = 900
+
+
+class AuthStateCache:
+    """
+    Caches Playwright storage state (cookies/JSESSIONID) per user role so tests
+    can start from an already authenticated browser context
+    """
+
+    def __init__(self, browser_manager: BrowserManager, users: Dict[str, Dict[str, Any]],
+                 context_args: Optional[Dict[str, Any]] = None,
+                 cache_dir: Path = AUTH_STATE_DIR,
+                 ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache
+
+        Args:
+            browser_manager: Manager of the worker's browser, used for logins and contexts
+            users: User roles from config["users"] (role -> credentials)
+            context_args: Arguments passed to every new browser context
+            cache_dir: Directory where storage state files are persisted
+            ttl_seconds: How long a captured session is trusted
+        """
+        self.browser_manager = browser_manager
+        self.users = users
+        self.context_args = dict(context_args or {})
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, role: str) -> str:
+        # Sessions belong to one server: offline workers each run their own stand-in on another port
+        digest = hashlib.sha1(str(self.context_args.get("base_url", "")).encode()).hexdigest()[:10]
+        return f"{role}-{digest}"
+
+    def _state_path(self, role: str) -> Path:
+        return self.cache_dir / f"{self._key(role)}.json"
+
+    def _meta_path(self, role: str) -> Path:
+        return self.cache_dir / f"{self._key(role)}.meta.json"
+
+    def _credentials(self, role: str) -> Dict[str, Any]:
+        user = self.users.get(role)
+        if not user or not user.get("username") or not user.get("password"):
+            raise KeyError(f"No credentials configured for user role '{role}'")
+        return user
+
+    def _is_fresh(self, role: str) -> bool:
+        """Check that a persisted state exists, belongs to the role's user and server and has not expired"""
+        state_path = self._state_path(role)
+        meta_path = self._meta_path(role)
+        if not state_path.exists() or not meta_path.exists():
+            return False
+        try:
+            with open(meta_path, "r") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if meta.get("username") != self._credentials(role)["username"]:
+            return False
+        if meta.get("base_url") != self.context_args.get("base_url"):
+            # Captured against another server (e.g. the offline stand-in)
+            return False
+        return meta.get("expires_at", 0) > time.time()
+
+    def _login(self, role: str) -> Path:
+        """Log in through the UI once and persist the resulting storage state"""
+        credentials = self._credentials(role)
+        logger.info(f"Capturing authenticated session for role '{role}'")
+        context = self.browser_manager.new_context(**self.context_args)
+        try:
+            login_page = LoginPage(context.new_page())
+            login_page.navigate()
+            login_page.login(credentials["username"], credentials["password"])
+            if not login_page.is_user_logged_in():
+                raise RuntimeError(f"Login failed for role '{role}', cannot cache session")
+
+            # Write to temporary files first so parallel workers never read a partial state
+            state_path = self._state_path(role)
+            tmp_state = state_path.with_suffix(f".{os.getpid()}.tmp")
+            context.storage_state(path=tmp_state)
+            os.replace(tmp_state, state_path)
+
+            meta_path = self._meta_path(role)
+            tmp_meta = meta_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_meta, "w") as f:
+                json.dump({
+                    "username": credentials["username"],
+                    "base_url": self.context_args.get("base_url"),
+                    "created_at": time.time(),
+                    "expires_at": time.time() + self.ttl_seconds
+                }, f)
+            os.replace(tmp_meta, meta_path)
+            return state_path
+        finally:
+            context.close()
+
+    def storage_state(self, role: str = "default") -> Path:
+        """
+        Get the storage state file for a role, logging in again if it is missing or stale
+
+        Args:
+            role: User role from config["users"]
+
+        Returns:
+            Path to the storage state JSON file
+        """
+        if self._is_fresh(role):
+            logger.debug(f"Reusing cached session for role '{role}'")
+            return self._state_path(role)
+        return self._login(role)
+
+    def invalidate(self, role: str = "default") -> None:
+        """
+        Drop the cached session for a role so the next request logs in again
+
+        Args:
+            role: User role from config["users"]
+        """
+        logger.info(f"Invalidating cached session for role '{role}'")
+        for path in (self._state_path(role), self._meta_path(role)):
+            path.unlink(missing_ok=True)
+
+    def new_context(self, role: str = "default", **overrides) -> BrowserContext:
+        """
+        Create a new browser context that is already logged in as the given role
+
+        Args:
+            role: User role from config["users"]
+            overrides: Extra arguments for browser.new_context()
+
+        Returns:
+            Authenticated browser context (caller is responsible for closing it)
+        """
+        context_args = {**self.context_args, **overrides}
+        context_args["storage_state"] = str(self.storage_state(role))
+        return self.browser_manager.new_context(**context_args)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import TYPE_CHECKING, Deque, List, Tuple
+
+if TYPE_CHECKING:
+    from playwright.sync_api import ConsoleMessage, Error, Page, Request, Response
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 500
+
+
+class BrowserLogBuffer:
+    """
+    Bounded in-memory log of what the browser reported during one test
+
+    Collects console messages, uncaught page errors, failed requests and HTTP
+    error responses from every page attached to it. Only the newest
+    max_entries are kept; older entries are dropped and counted.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the buffer
+
+        Args:
+            max_entries: Number of entries kept (the oldest are dropped first)
+        """
+        self.max_entries = max_entries
+        self._entries: Deque[Tuple[float, str, str]] = deque(maxlen=max_entries)
+        self.total = 0
+
+    @property
+    def dropped(self) -> int:
+        """Entries pushed out of the buffer by newer ones"""
+        return self.total - len(self._entries)
+
+    def add(self, kind: str, message: str) -> None:
+        """Append one entry stamped with the current time"""
+        self._entries.append((time.time(), kind, message))
+        self.total += 1
+
+    def attach(self, page: Page) -> None:
+        """Collect the logs of a page into this buffer"""
+        page.on("console", self._on_console)
+        page.on("pageerror", self._on_page_error)
+        page.on("requestfailed", self._on_request_failed)
+        page.on("response", self._on_response)
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        self.add(f"console.{message.type}", message.text)
+
+    def _on_page_error(self, error: Error) -> None:
+        self.add("pageerror", error.message)
+
+    def _on_request_failed(self, request: Request) -> None:
+        failure = request.failure or ""
+        if "BLOCKED_BY_CLIENT" in failure:
+            # Aborted on purpose by the request filter
+            return
+        self.add("requestfailed", f"{request.method} {request.url} {failure}".rstrip())
+
+    def _on_response(self, response: Response) -> None:
+        if response.status >= 400:
+            self.add("http", f"{response.status} {response.request.method} {response.url}")
+
+    def lines(self) -> List[str]:
+        """Entries formatted as '<time> <kind>: <message>', oldest first"""
+        lines = []
+        if self.dropped:
+            lines.append(f"... {self.dropped} earlier entries dropped (buffer holds {self.max_entries})")
+        for timestamp, kind, message in self._entries:
+            lines.append(f"{datetime.fromtimestamp(timestamp).strftime('%H:%M:%S.%f')[:-3]} {kind}: {message}")
+        return lines
+
+    def text(self) -> str:
+        return "\n".join(self.lines())
+
+    def __len__(self) -> int:
+        return len(self._entries)
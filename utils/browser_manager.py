@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, BrowserType
+
+logger = logging.getLogger(__name__)
+
+try:
+    import psutil
+except ImportError:  # psutil is optional, fall back to /proc on Linux
+    psutil = None
+
+
+def _process_tree_rss_mb(root_pid: int) -> Optional[float]:
+    """
+    Resident memory of all descendants of a process (the Playwright driver and browser)
+
+    Args:
+        root_pid: Process whose children are measured
+
+    Returns:
+        Memory in megabytes, or None when it cannot be measured on this platform
+    """
+    if psutil is not None:
+        try:
+            children = psutil.Process(root_pid).children(recursive=True)
+        except psutil.Error:
+            return None
+        total = 0
+        for child in children:
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                continue
+        return total / (1024 * 1024)
+
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    # Build a parent -> children map from /proc/<pid>/stat
+    children_of: Dict[int, list] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name may contain spaces, fields after it are space separated
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children_of.setdefault(ppid, []).append(int(entry.name))
+
+    total_kb = 0
+    pending = list(children_of.get(root_pid, []))
+    while pending:
+        pid = pending.pop()
+        pending.extend(children_of.get(pid, []))
+        try:
+            for line in (proc / str(pid) / "status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total_kb += int(line.split()[1])
+                    break
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+class BrowserManager:
+    """
+    Owns the browser process of a worker and hands out short-lived contexts
+
+    The browser is launched lazily, shared by every test in the worker and
+    optionally relaunched after a number of tests or once its memory grows
+    beyond a threshold. Recycling only happens while no context is open.
+    """
+
+    def __init__(self, browser_type: BrowserType, launch_args: Dict[str, Any],
+                 recycle_after: int = 0, memory_limit_mb: int = 0,
+                 context_hooks: Optional[List[Callable[[BrowserContext], None]]] = None):
+        """
+        Initialize the manager
+
+        Args:
+            browser_type: Playwright browser type to launch
+            launch_args: Arguments for browser_type.launch()
+            recycle_after: Relaunch the browser after this many tests (0 disables)
+            memory_limit_mb: Relaunch once the browser tree exceeds this RSS (0 disables)
+            context_hooks: Callables applied to every new context (routing, tracing, ...)
+        """
+        self.browser_type = browser_type
+        self.launch_args = launch_args
+        self.recycle_after = recycle_after
+        self.memory_limit_mb = memory_limit_mb
+        self.context_hooks = list(context_hooks or [])
+        self._browser: Optional[Browser] = None
+        self._open_contexts = 0
+        self._tests_since_launch = 0
+        self._recycle_pending = False
+        self.launch_count = 0
+
+    @property
+    def browser(self) -> Browser:
+        """The running browser, launched (or relaunched) on demand"""
+        if self._recycle_pending and self._open_contexts == 0:
+            self.recycle()
+        if self._browser is None or not self._browser.is_connected():
+            logger.info(f"Launching {self.browser_type.name} browser")
+            self._browser = self.browser_type.launch(**self.launch_args)
+            self._tests_since_launch = 0
+            self.launch_count += 1
+        return self._browser
+
+    def new_context(self, **context_args) -> BrowserContext:
+        """
+        Create a fresh browser context on the managed browser
+
+        Args:
+            context_args: Arguments for browser.new_context()
+
+        Returns:
+            New browser context (caller is responsible for closing it)
+        """
+        context = self.browser.new_context(**context_args)
+        self._open_contexts += 1
+        context.on("close", lambda _: self._context_closed())
+        for hook in self.context_hooks:
+            hook(context)
+        return context
+
+    def _context_closed(self) -> None:
+        self._open_contexts = max(0, self._open_contexts - 1)
+
+    def memory_usage_mb(self) -> Optional[float]:
+        """Memory used by the browser processes of this worker, if measurable"""
+        return _process_tree_rss_mb(os.getpid())
+
+    def test_finished(self) -> None:
+        """Record that a browser test finished and schedule a recycle if a limit was hit"""
+        self._tests_since_launch += 1
+        if self.recycle_after and self._tests_since_launch >= self.recycle_after:
+            logger.info(f"Browser served {self._tests_since_launch} tests, scheduling recycle")
+            self._recycle_pending = True
+        elif self.memory_limit_mb:
+            memory_mb = self.memory_usage_mb()
+            if memory_mb is not None and memory_mb > self.memory_limit_mb:
+                logger.info(f"Browser memory {memory_mb:.0f} MB exceeds {self.memory_limit_mb} MB, scheduling recycle")
+                self._recycle_pending = True
+
+    def recycle(self) -> None:
+        """Close the current browser so the next request launches a fresh process"""
+        self._recycle_pending = False
+        if self._browser is not None:
+            logger.info("Recycling browser")
+            try:
+                self._browser.close()
+            except Exception as e:
+                logger.warning(f"Failed to close browser during recycle: {e}")
+            self._browser = None
+
+    def close(self) -> None:
+        """Shut the browser down at the end of the session"""
+        self.recycle()
@@ -0,0 +1,229 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import yaml
+from config.env import BASE_DIR, CASE_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+# Bump when CaseSpec or the validation rules change, so stale compiled caches are ignored
+SCHEMA_VERSION = 1
+
+PRIORITIES = ("High", "Medium", "Low")
+AUTOMATION_STATUSES = ("Automated", "To Be Automated", "Not Automated")
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class CaseSpecError(Exception):
+    """Raised when a case file is malformed or a case fails validation"""
+
+
+@dataclass(frozen=True)
+class CaseSpec:
+    """One validated test case from a test_cases YAML file or a data JSON matrix"""
+    id: str
+    title: str
+    source: str
+    test_data: Dict[str, Any] = field(default_factory=dict)
+    priority: Optional[str] = None
+    automation_status: Optional[str] = None
+    description: str = ""
+    steps: Tuple[str, ...] = ()
+    expected_results: Tuple[str, ...] = ()
+
+
+class _UniqueKeyLoader(_Loader):
+    """YAML loader that rejects duplicate mapping keys instead of silently keeping the last one"""
+
+
+def _construct_mapping(loader: yaml.SafeLoader, node: yaml.MappingNode) -> Dict[Any, Any]:
+    loader.flatten_mapping(node)
+    mapping = {}
+    for key_node, value_node in node.value:
+        key = loader.construct_object(key_node)
+        if key in mapping:
+            raise CaseSpecError(f"line {key_node.start_mark.line + 1}: duplicate key '{key}' "
+                                f"(is a '- id:' line missing before it?)")
+        mapping[key] = loader.construct_object(value_node, deep=True)
+    return mapping
+
+
+_UniqueKeyLoader.add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _construct_mapping)
+
+
+def _validate(entry: Any, index: int, source: str) -> CaseSpec:
+    where = f"{source} case #{index + 1}"
+    if not isinstance(entry, dict):
+        raise CaseSpecError(f"{where}: expected a mapping, got {type(entry).__name__}")
+    for key in ("id", "title"):
+        if not entry.get(key):
+            raise CaseSpecError(f"{where}: missing '{key}'")
+    where = f"{source} {entry['id']}"
+    test_data = entry.get("test_data") or {}
+    if not isinstance(test_data, dict):
+        raise CaseSpecError(f"{where}: test_data must be a mapping")
+    priority = entry.get("priority")
+    if priority is not None and priority not in PRIORITIES:
+        raise CaseSpecError(f"{where}: priority '{priority}' is not one of {', '.join(PRIORITIES)}")
+    automation = entry.get("automation_status")
+    if automation is not None:
+        automation = str(automation).strip()
+        if automation not in AUTOMATION_STATUSES:
+            raise CaseSpecError(f"{where}: automation_status '{automation}' is not one of "
+                                f"{', '.join(AUTOMATION_STATUSES)}")
+    return CaseSpec(
+        id=str(entry["id"]),
+        title=str(entry["title"]),
+        source=source,
+        test_data=test_data,
+        priority=priority,
+        automation_status=automation,
+        description=str(entry.get("description") or ""),
+        steps=tuple(entry.get("steps") or ()),
+        expected_results=tuple(entry.get("expected_results") or ())
+    )
+
+
+def parse_cases(content: bytes, source: str, keys: Sequence[str]) -> List[CaseSpec]:
+    """
+    Parse and validate the cases of a YAML or JSON document
+
+    YAML files list full cases under test_cases. JSON data files hold lists of
+    bare test data rows under the given keys; each row becomes a case with the
+    id '<key>[<index>]'.
+
+    Raises:
+        CaseSpecError: The document or a case is invalid
+    """
+    if source.endswith((".yaml", ".yml")):
+        try:
+            document = yaml.load(content, Loader=_UniqueKeyLoader)
+        except CaseSpecError as e:
+            raise CaseSpecError(f"{source} {e}") from None
+        except yaml.YAMLError as e:
+            raise CaseSpecError(f"{source}: invalid YAML: {e}") from None
+    else:
+        try:
+            document = json.loads(content)
+        except ValueError as e:
+            raise CaseSpecError(f"{source}: invalid JSON: {e}") from None
+    if not isinstance(document, dict):
+        raise CaseSpecError(f"{source}: expected a mapping at the top level")
+
+    cases: List[CaseSpec] = []
+    for key in keys:
+        entries = document.get(key)
+        if not isinstance(entries, list):
+            raise CaseSpecError(f"{source}: '{key}' must be a list of cases")
+        for index, entry in enumerate(entries):
+            if key != "test_cases" and isinstance(entry, dict) and "id" not in entry:
+                entry = {"id": f"{key}[{index}]", "title": key.replace("_", " "), "test_data": entry}
+            cases.append(_validate(entry, index, source))
+
+    seen = set()
+    for case in cases:
+        if case.id in seen:
+            raise CaseSpecError(f"{source}: duplicate case id {case.id}")
+        seen.add(case.id)
+    return cases
+
+
+class CaseSpecCache:
+    """
+    Parsed and validated case files, compiled to pickles keyed by file hash
+
+    Reading and hashing a file is far cheaper than parsing YAML, so unchanged
+    files are loaded from the compiled pickle. Parsed files are also memoized
+    for the lifetime of the process.
+    """
+
+    def __init__(self, cache_dir: Path = CASE_CACHE_DIR, base_dir: Path = BASE_DIR):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir: Directory of the compiled pickles
+            base_dir: Directory case file paths are relative to
+        """
+        self.cache_dir = Path(cache_dir)
+        self.base_dir = Path(base_dir)
+        self._memo: Dict[Tuple[str, Tuple[str, ...]], List[CaseSpec]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, path: Union[str, Path], keys: Optional[Iterable[str]] = None) -> List[CaseSpec]:
+        """
+        Cases of a file
+
+        Args:
+            path: YAML or JSON file, relative to base_dir
+            keys: Top-level lists holding the cases (test_cases by default)
+
+        Raises:
+            CaseSpecError: The file is missing or invalid
+        """
+        keys = tuple(keys or ("test_cases",))
+        source = Path(path).as_posix()
+        memo_key = (source, keys)
+        if memo_key in self._memo:
+            return self._memo[memo_key]
+
+        file_path = self.base_dir / path
+        try:
+            content = file_path.read_bytes()
+        except OSError as e:
+            raise CaseSpecError(f"{source}: cannot read case file: {e}") from None
+        digest = hashlib.sha1(content + f"\0{SCHEMA_VERSION}\0{','.join(keys)}".encode()).hexdigest()[:16]
+        stem = source.replace("/", "_")
+        compiled = self.cache_dir / f"{stem}-{digest}.pickle"
+
+        cases = None
+        if compiled.exists():
+            try:
+                cases = pickle.loads(compiled.read_bytes())
+                self.hits += 1
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable compiled cases {compiled.name}: {e}")
+        if cases is None:
+            self.misses += 1
+            cases = parse_cases(content, source, keys)
+            self._store(compiled, stem, cases)
+        self._memo[memo_key] = cases
+        return cases
+
+    def _store(self, compiled: Path, stem: str, cases: List[CaseSpec]) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.cache_dir.glob(f"{stem}-*.pickle"):
+                stale.unlink(missing_ok=True)
+            tmp_path = compiled.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(pickle.dumps(cases, protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_path, compiled)
+        except OSError as e:
+            logger.warning(f"Could not store compiled cases {compiled.name}: {e}")
+
+
+def select_cases(cases: Iterable[CaseSpec], ids: Optional[Iterable[str]] = None,
+                 automation: Optional[Union[str, Iterable[str]]] = None,
+                 priority: Optional[Union[str, Iterable[str]]] = None) -> List[CaseSpec]:
+    """Cases matching every given filter (ids, automation_status, priority)"""
+    def _as_set(value):
+        return {value} if isinstance(value, str) else set(value)
+
+    selected = list(cases)
+    if ids is not None:
+        wanted = _as_set(ids)
+        selected = [case for case in selected if case.id in wanted]
+    if automation is not None:
+        statuses = _as_set(automation)
+        selected = [case for case in selected if case.automation_status in statuses]
+    if priority is not None:
+        priorities = _as_set(priority)
+        selected = [case for case in selected if case.priority in priorities]
+    return selected
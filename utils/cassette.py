@@ -0,0 +1,219 @@
+import base64
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("live", "record", "replay")
+MATCH_FIELDS = ("method", "endpoint", "params", "body")
+
+# Transport headers that no longer describe the stored (already decoded) body
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length", "connection"}
+
+
+class CassetteMissError(Exception):
+    """Raised in strict replay mode when a request was never recorded"""
+
+
+class Cassette:
+    """
+    Recorded API request/response pairs for APIHelpers
+
+    Interactions are keyed by the fields in match_on. The endpoint is stored
+    relative to the client's base_url, so a cassette recorded against one
+    environment replays against any other. Repeated identical requests are
+    replayed in recorded order, the last response being reused once exhausted.
+    Recording into an existing cassette replaces only the interactions of the
+    requests made again, so re-recording a subset of tests keeps the rest.
+    """
+
+    def __init__(self, path: Path, mode: str = "replay",
+                 match_on: Iterable[str] = MATCH_FIELDS, strict: bool = True):
+        """
+        Initialize the cassette
+
+        Args:
+            path: JSON file holding the interactions
+            mode: record (hit the network and store), replay (serve stored) or live
+            match_on: Request fields that identify an interaction (when replaying, a subset
+                of the fields the cassette was recorded with)
+            strict: In replay mode, raise CassetteMissError for unrecorded requests
+                instead of falling through to the network
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}', expected one of {', '.join(CASSETTE_MODES)}")
+        unknown = set(match_on) - set(MATCH_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown match fields {sorted(unknown)}, expected a subset of {MATCH_FIELDS}")
+        self.path = Path(path)
+        self.mode = mode
+        self.match_on = tuple(match_on)
+        self.strict = strict
+        self._lock = threading.Lock()
+        self._interactions: List[Dict[str, Any]] = []
+        self._previous: List[Dict[str, Any]] = []
+        self._index: Dict[Tuple, List[Dict[str, Any]]] = {}
+        self._play_counts: Dict[Tuple, int] = {}
+        self.hits = 0
+        self.misses = 0
+        if mode == "replay" and self.path.exists():
+            self._load()
+        elif mode == "record" and self.path.exists():
+            self._load_previous()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == "record"
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    @staticmethod
+    def _canonical_request(method: str, endpoint: str, params: Optional[Dict[str, Any]],
+                           data: Any, json_data: Any) -> Dict[str, str]:
+        if json_data is not None:
+            body = json.dumps(json_data, sort_keys=True, separators=(",", ":"))
+        elif isinstance(data, dict):
+            body = urlencode(sorted(data.items()), doseq=True)
+        elif isinstance(data, bytes):
+            body = data.decode("utf-8", errors="replace")
+        else:
+            body = "" if data is None else str(data)
+        return {
+            "method": method.upper(),
+            "endpoint": endpoint,
+            "params": urlencode(sorted((params or {}).items()), doseq=True),
+            "body": body
+        }
+
+    def _key(self, request: Dict[str, str]) -> Tuple:
+        return tuple(request[field] for field in self.match_on)
+
+    def _read(self) -> Tuple[Tuple[str, ...], List[Dict[str, Any]]]:
+        """match_on and interactions stored in the cassette file"""
+        with open(self.path, "r") as f:
+            payload = json.load(f)
+        stored_match_on = tuple(payload.get("match_on", self.match_on))
+        unknown = set(stored_match_on) - set(MATCH_FIELDS)
+        if unknown:
+            raise ValueError(f"{self.path} matches on unknown fields {sorted(unknown)}")
+        return stored_match_on, payload.get("interactions", [])
+
+    def _load_previous(self) -> None:
+        stored_match_on, interactions = self._read()
+        if set(stored_match_on) != set(self.match_on):
+            # The file's match_on has to hold for every interaction in it
+            logger.warning(f"{self.path} was recorded matching on {list(stored_match_on)}, "
+                           f"replacing it with a recording matching on {list(self.match_on)}")
+            return
+        self._previous = interactions
+
+    def _load(self) -> None:
+        stored_match_on, interactions = self._read()
+        extra = set(self.match_on) - set(stored_match_on)
+        if extra:
+            # One recorded interaction may stand for requests differing in these fields, so they would miss
+            raise ValueError(f"{self.path} was recorded matching on {list(stored_match_on)} and cannot be "
+                             f"replayed matching on {sorted(extra)} as well; re-record it or narrow match_on")
+        self._interactions = interactions
+        for interaction in self._interactions:
+            self._index.setdefault(self._key(interaction["request"]), []).append(interaction)
+        logger.info(f"Loaded {len(self._interactions)} API interactions from {self.path}")
+
+    def play(self, method: str, base_url: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+             data: Any = None, json_data: Any = None) -> Optional[requests.Response]:
+        """
+        Look up a recorded response (replay mode only)
+
+        Returns:
+            Recorded response, or None when the request should go to the network
+
+        Raises:
+            CassetteMissError: Request not recorded and the cassette is strict
+        """
+        if not self.replaying:
+            return None
+        request = self._canonical_request(method, endpoint, params, data, json_data)
+        key = self._key(request)
+        with self._lock:
+            candidates = self._index.get(key)
+            if not candidates:
+                self.misses += 1
+                if self.strict:
+                    raise CassetteMissError(
+                        f"No recorded interaction for {request['method']} {endpoint}"
+                        f"{'?' + request['params'] if request['params'] else ''} in {self.path}"
+                    )
+                logger.warning(f"Cassette miss, sending live request: {request['method']} {endpoint}")
+                return None
+            played = self._play_counts.get(key, 0)
+            self._play_counts[key] = played + 1
+            self.hits += 1
+            interaction = candidates[min(played, len(candidates) - 1)]
+        return self._build_response(interaction, base_url)
+
+    def record(self, method: str, endpoint: str, params: Optional[Dict[str, Any]],
+               data: Any, json_data: Any, response: requests.Response) -> None:
+        """Store a live interaction (record mode only)"""
+        if not self.recording:
+            return
+        content = response.content or b""
+        try:
+            body = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        interaction = {
+            "request": self._canonical_request(method, endpoint, params, data, json_data),
+            "response": {
+                "status_code": response.status_code,
+                "reason": response.reason,
+                "headers": {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS},
+                "encoding": response.encoding,
+                **body
+            }
+        }
+        with self._lock:
+            self._interactions.append(interaction)
+
+    @staticmethod
+    def _build_response(interaction: Dict[str, Any], base_url: str) -> requests.Response:
+        request = interaction["request"]
+        recorded = interaction["response"]
+        url = f"{base_url}{request['endpoint']}" + (f"?{request['params']}" if request["params"] else "")
+
+        response = requests.Response()
+        response.status_code = recorded["status_code"]
+        response.reason = recorded.get("reason")
+        response.headers = CaseInsensitiveDict(recorded.get("headers", {}))
+        response.encoding = recorded.get("encoding")
+        response.url = url
+        if "base64" in recorded:
+            response._content = base64.b64decode(recorded["base64"])
+        else:
+            response._content = recorded.get("text", "").encode("utf-8")
+        response.request = requests.Request(request["method"], url).prepare()
+        return response
+
+    def save(self) -> None:
+        """Write recorded interactions to disk (record mode only)"""
+        if not self.recording:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with self._lock:
+            recorded = {self._key(interaction["request"]) for interaction in self._interactions}
+            kept = [interaction for interaction in self._previous if self._key(interaction["request"]) not in recorded]
+            payload = {"match_on": list(self.match_on), "interactions": kept + self._interactions}
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f, indent=2)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Recorded {len(self._interactions)} API interactions to {self.path} "
+                    f"({len(kept)} kept from the previous recording)")
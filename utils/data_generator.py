@@ -1,11 +1,115 @@
+import hashlib
+import os
 import random
 import string
 import uuid
 from datetime import datetime, timedelta
-from faker import Faker
+from itertools import count as _count
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    from faker import Faker
+
+
+class _LazyFaker:
+    """Faker proxy built on first use: importing faker and building a locale costs ~100 ms"""
+
+    def __init__(self, locales: List[str]):
+        self._locales = locales
+        self._instance: Optional["Faker"] = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._instance is None:
+            from faker import Faker
+            self._instance = Faker(self._locales)
+        return getattr(self._instance, name)
+
+
+# Initialize faker with multiple locales (on first use)
+fake = _LazyFaker(['en_US'])
+
+# Distinct values drawn from Faker per field for bulk generation
+POOL_SIZE = 512
+
+_SPECIALS = "!@#$%^&*()_+-=[]{}|;:,.<>?"
+
+
+def _worker_shard() -> tuple:
+    """(index, count) of this xdist worker, (0, 1) outside xdist"""
+    worker = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+    index = int(worker[2:]) if worker[2:].isdigit() else 0
+    return index, max(1, int(os.getenv("PYTEST_XDIST_WORKER_COUNT", "1")))
+
+
+def _run_offset(run_id: str) -> int:
+    """Id offset derived from a value every worker of the run shares"""
+    return int(hashlib.sha1(run_id.encode()).hexdigest(), 16) % 36 ** 5
+
+
+class _BulkState:
+    """Seeded RNG, Faker value pools and the worker's unique id sequence"""
+
+    def __init__(self, seed: Optional[int] = None, run_id: Optional[str] = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.worker_index, self.worker_count = _worker_shard()
+        # Shards only stay apart when every worker starts from the same offset: seeded runs
+        # draw it from the seed, unseeded ones from the run id (a random offset without one,
+        # so ids do not repeat across runs on a shared server)
+        if seed is not None:
+            self.id_offset = self.rng.randrange(36 ** 5)
+        elif run_id is not None:
+            self.id_offset = _run_offset(run_id)
+        else:
+            self.id_offset = random.SystemRandom().randrange(36 ** 5)
+        self.sequence = _count()
+        self._pools: Optional[Dict[str, List[str]]] = None
+
+    @property
+    def pools(self) -> Dict[str, List[str]]:
+        if self._pools is None:
+            from faker import Faker
+            faker = Faker(['en_US'])
+            faker.seed_instance(self.seed if self.seed is not None else self.rng.random())
+            self._pools = {
+                "first_name": [faker.first_name() for _ in range(POOL_SIZE)],
+                "last_name": [faker.last_name() for _ in range(POOL_SIZE)],
+                "street_name": [faker.street_name() for _ in range(POOL_SIZE)],
+                "city": [faker.city() for _ in range(POOL_SIZE)],
+                "state": [faker.state() for _ in range(64)],
+                "zip": [faker.zipcode() for _ in range(POOL_SIZE)],
+            }
+        return self._pools
+
+    def next_id(self) -> int:
+        """Next id of this worker's shard: workers sharing id_offset never collide"""
+        return self.id_offset + next(self.sequence) * self.worker_count + self.worker_index
+
+
+_bulk = _BulkState()
+
+
+def _base36(value: int) -> str:
+    digits = string.digits + string.ascii_lowercase
+    out = ""
+    while True:
+        value, remainder = divmod(value, 36)
+        out = digits[remainder] + out
+        if not value:
+            return out
+
+
+def _luhn_complete(digits: List[int]) -> str:
+    """Append the Luhn check digit to a card number prefix"""
+    total = 0
+    for position, digit in enumerate(reversed(digits)):
+        if position % 2 == 0:
+            digit *= 2
+            if digit > 9:
+                digit -= 9
+        total += digit
+    return "".join(map(str, digits)) + str((10 - total % 10) % 10)
 
-# Initialize faker with multiple locales
-fake = Faker(['en_US'])
 
 class DataGenerator:
     """
@@ -170,4 +274,139 @@ class DataGenerator:
     @staticmethod
     def random_sample(elements, count=1):
         """Select a random sample of elements from a list"""
-        return random.sample(elements, min(count, len(elements))) 
\ No newline at end of file
+        return random.sample(elements, min(count, len(elements)))
+    
+    # Bulk generation: records are assembled from pre-built Faker value pools with
+    # one seeded RNG, which is orders of magnitude faster than a Faker call per field
+    
+    @staticmethod
+    def seed(value: Optional[int], run_id: Optional[str] = None) -> None:
+        """
+        Make generated data reproducible
+        
+        Seeds the bulk generator, the shared Faker instance and the random module.
+        Unique ids stay distinct per xdist worker for the same seed, or for the
+        same run id when unseeded.
+        
+        Args:
+            value: Seed, or None to go back to unseeded data
+            run_id: Value shared by all workers of the run (xdist's testrunuid),
+                used for the id offset of unseeded data
+        """
+        global _bulk
+        _bulk = _BulkState(value, run_id)
+        if value is not None:
+            worker_seed = value * 1000 + _bulk.worker_index
+            fake.seed_instance(worker_seed)
+            random.seed(worker_seed)
+            _bulk.rng.seed(worker_seed)
+    
+    @staticmethod
+    def unique_username(prefix: str = "user_") -> str:
+        """Username unique across xdist workers (and across unseeded runs)"""
+        return f"{prefix}{_base36(_bulk.next_id())}"
+    
+    @staticmethod
+    def unique_ssn() -> str:
+        """Nine-digit SSN unique across xdist workers"""
+        return f"{(_bulk.next_id() * 7919) % 10 ** 9:09d}"
+    
+    @staticmethod
+    def _bulk_password(rng: random.Random, length: int = 12) -> str:
+        required = [rng.choice(string.ascii_lowercase), rng.choice(string.ascii_uppercase), rng.choice(string.digits)]
+        rest = rng.choices(string.ascii_letters + string.digits, k=length - len(required))
+        password = required + rest
+        rng.shuffle(password)
+        return "".join(password)
+    
+    @staticmethod
+    def address_records(count: int) -> List[Dict[str, str]]:
+        """Generate count addresses (same keys as random_address)"""
+        rng, pools = _bulk.rng, _bulk.pools
+        numbers = [rng.randint(1, 9999) for _ in range(count)]
+        return [
+            {"street": f"{number} {street}", "city": city, "state": state, "zip": zip_code, "country": "United States"}
+            for number, street, city, state, zip_code in zip(
+                numbers, rng.choices(pools["street_name"], k=count), rng.choices(pools["city"], k=count),
+                rng.choices(pools["state"], k=count), rng.choices(pools["zip"], k=count))
+        ]
+    
+    @staticmethod
+    def registration_records(count: int, password: Optional[str] = None,
+                             username_prefix: str = "testuser_") -> List[Dict[str, str]]:
+        """
+        Generate count ParaBank registration records
+        
+        Records use the keys RegisterPage.register_user expects. Usernames and
+        SSNs come from the worker's unique id shard.
+        
+        Args:
+            count: Number of records
+            password: Password for every record (a random one each by default)
+            username_prefix: Prefix of the generated usernames
+        
+        Returns:
+            Registration records
+        """
+        rng, pools = _bulk.rng, _bulk.pools
+        records = []
+        for address, first_name, last_name in zip(DataGenerator.address_records(count),
+                                                  rng.choices(pools["first_name"], k=count),
+                                                  rng.choices(pools["last_name"], k=count)):
+            user_password = password or DataGenerator._bulk_password(rng)
+            records.append({
+                "firstName": first_name,
+                "lastName": last_name,
+                "address": address["street"],
+                "city": address["city"],
+                "state": address["state"],
+                "zipCode": address["zip"],
+                "phone": f"{rng.randint(200, 999)}-{rng.randint(200, 999)}-{rng.randint(0, 9999):04d}",
+                "ssn": DataGenerator.unique_ssn(),
+                "username": DataGenerator.unique_username(username_prefix),
+                "password": user_password,
+                "confirm": user_password
+            })
+        return records
+    
+    @staticmethod
+    def card_records(count: int) -> List[Dict[str, str]]:
+        """Generate count Luhn-valid Visa cards (same keys as random_credit_card)"""
+        rng, pools = _bulk.rng, _bulk.pools
+        this_year = datetime.now().year % 100
+        return [
+            {
+                "number": _luhn_complete([4] + [rng.randint(0, 9) for _ in range(14)]),
+                "expiry_date": f"{rng.randint(1, 12):02d}/{this_year + rng.randint(1, 5):02d}",
+                "security_code": f"{rng.randint(0, 999):03d}",
+                "holder": f"{first_name} {last_name}"
+            }
+            for first_name, last_name in zip(rng.choices(pools["first_name"], k=count),
+                                              rng.choices(pools["last_name"], k=count))
+        ]
+    
+    @staticmethod
+    def stream(kind: str = "registration", count: Optional[int] = None,
+               batch_size: int = 1000, **kwargs: Any) -> Iterator[Dict[str, str]]:
+        """
+        Yield records lazily, generated batch_size at a time
+        
+        Args:
+            kind: registration, address or card
+            count: Records to yield in total (endless when None)
+            batch_size: Records generated per batch
+            **kwargs: Extra arguments of the matching *_records method
+        """
+        generators = {
+            "registration": DataGenerator.registration_records,
+            "address": DataGenerator.address_records,
+            "card": DataGenerator.card_records
+        }
+        if kind not in generators:
+            raise ValueError(f"Unknown record kind '{kind}', expected one of {', '.join(generators)}")
+        remaining = count
+        while remaining is None or remaining > 0:
+            size = batch_size if remaining is None else min(batch_size, remaining)
+            yield from generators[kind](size, **kwargs)
+            if remaining is not None:
+                remaining -= size
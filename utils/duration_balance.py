@@ -0,0 +1,253 @@
+import logging
+import statistics
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import pytest
+from xdist.scheduler import LoadScheduling
+
+logger = logging.getLogger(__name__)
+
+# pytest cache key of the per-test durations
+CACHE_KEY = "duration_balance/durations"
+
+# Fixtures that put a browser behind a test
+BROWSER_FIXTURES = frozenset({"page", "context", "browser", "logged_in_page", "authenticated_context", "fan_out"})
+
+# Estimates for tests without history when no test of their kind has any either
+DEFAULT_SECONDS = {True: 5.0, False: 0.5}
+
+# Weight of the latest run in the stored moving average
+SMOOTHING = 0.5
+
+# Tests sent ahead to each worker (xdist needs the next test to run the current one)
+IN_FLIGHT = 2
+
+
+def uses_browser(fixturenames: Iterable[str]) -> bool:
+    """Whether a test requests one of the browser fixtures"""
+    return not BROWSER_FIXTURES.isdisjoint(fixturenames)
+
+
+class DurationHistory:
+    """
+    Per-test durations (setup + call + teardown) of previous runs, updated with this run
+
+    Stored in the pytest cache as {nodeid: {"seconds": float, "browser": bool}},
+    smoothed with an exponential moving average so one slow run does not
+    reshuffle the next schedule.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, Any]]] = None, smoothing: float = SMOOTHING):
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries or {})
+        self.smoothing = smoothing
+        self._run: Dict[str, Dict[str, Any]] = {}
+
+    def load(self, cache) -> None:
+        """Read the durations stored by previous runs (none without the cache provider)"""
+        if cache is not None:
+            self.entries = dict(cache.get(CACHE_KEY, {}))
+
+    def save(self, cache) -> None:
+        """Fold this run's durations into the history and store it"""
+        if cache is None or not self._run:
+            return
+        for nodeid, measured in self._run.items():
+            if measured["skipped"]:
+                continue
+            previous = self.entries.get(nodeid)
+            seconds = measured["seconds"]
+            if previous is not None:
+                seconds = (1 - self.smoothing) * previous["seconds"] + self.smoothing * seconds
+            self.entries[nodeid] = {"seconds": round(seconds, 3), "browser": measured["browser"]}
+        cache.set(CACHE_KEY, self.entries)
+        self._run.clear()
+
+    def record(self, report: pytest.TestReport) -> None:
+        """Add one phase report of this run (skipped tests are not recorded) and its uses_browser flag"""
+        entry = self._run.setdefault(report.nodeid, {"seconds": 0.0, "browser": False, "skipped": False})
+        entry["seconds"] += report.duration
+        entry["browser"] = entry["browser"] or getattr(report, "uses_browser", False)
+        entry["skipped"] = entry["skipped"] or report.skipped
+
+    def estimate(self, nodeid: str) -> Tuple[float, bool]:
+        """Expected seconds of a test and whether it uses a browser"""
+        entry = self.entries.get(nodeid)
+        if entry is not None:
+            return entry["seconds"], entry["browser"]
+        browser = "/ui/" in f"/{nodeid}"
+        same_kind = [e["seconds"] for e in self.entries.values() if e["browser"] == browser]
+        return (statistics.median(same_kind) if same_kind else DEFAULT_SECONDS[browser]), browser
+
+
+def plan_longest_first(nodeids: Sequence[str], history: DurationHistory,
+                       workers: int) -> Tuple[List[List[int]], List[float]]:
+    """
+    Assign tests longest-first to the least-loaded worker
+
+    Browser tests are placed first so they spread evenly over the workers,
+    then API-only tests fill up the lightest workers.
+
+    Args:
+        nodeids: Collected tests
+        history: Duration estimates
+        workers: Number of workers
+
+    Returns:
+        Indices into nodeids per worker (longest first) and the predicted seconds per worker
+    """
+    estimates = [history.estimate(nodeid) for nodeid in nodeids]
+    order = sorted(range(len(nodeids)), key=lambda i: (not estimates[i][1], -estimates[i][0], i))
+    queues: List[List[int]] = [[] for _ in range(workers)]
+    loads = [0.0] * workers
+    for index in order:
+        worker = min(range(workers), key=lambda w: (loads[w], len(queues[w])))
+        queues[worker].append(index)
+        loads[worker] += estimates[index][0]
+    return queues, loads
+
+
+class MakespanStats:
+    """Predicted and measured busy time per worker of a balanced run"""
+
+    def __init__(self):
+        self.predicted: Dict[str, float] = {}
+        self.actual: Dict[str, float] = {}
+        self.tests: Dict[str, int] = {}
+        self.unknown = 0
+        self.stolen = 0
+
+    def record(self, report: pytest.TestReport) -> None:
+        """Add the duration of one phase report to the busy time of the worker that ran it"""
+        node = getattr(report, "node", None)
+        worker = node.gateway.id if node is not None else "main"
+        self.actual[worker] = self.actual.get(worker, 0.0) + report.duration
+        if report.when == "call":
+            self.tests[worker] = self.tests.get(worker, 0) + 1
+
+    def summary_lines(self) -> List[str]:
+        predicted = max(self.predicted.values(), default=0.0)
+        actual = max(self.actual.values(), default=0.0)
+        lines = [f"Makespan: predicted {predicted:.1f}s, actual {actual:.1f}s "
+                 f"({len(self.predicted)} workers, {self.unknown} tests without history, "
+                 f"{self.stolen} tests moved to idle workers)"]
+        for worker in sorted(set(self.predicted) | set(self.actual)):
+            lines.append(f"{worker:>6}  predicted {self.predicted.get(worker, 0.0):>7.1f}s  "
+                         f"actual {self.actual.get(worker, 0.0):>7.1f}s  {self.tests.get(worker, 0):>4} tests")
+        return lines
+
+
+class DurationScheduling(LoadScheduling):
+    """
+    xdist scheduler sending tests longest-first to the worker with the least predicted work
+
+    The whole collection is planned up front from the duration history
+    (see plan_longest_first); each worker then gets its planned tests a
+    couple at a time. A worker that runs out takes the shortest remaining
+    tests of the worker with the most work left, so wrong estimates cost
+    little.
+    """
+
+    def __init__(self, config: pytest.Config, log=None, history: Optional[DurationHistory] = None,
+                 stats: Optional[MakespanStats] = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+        self.stats = stats or MakespanStats()
+        self._plan: Optional[Dict[Any, List[int]]] = None
+        self._seconds: List[float] = []
+
+    @property
+    def tests_finished(self) -> bool:
+        if self._plan is not None and any(self._plan.values()):
+            return False
+        return super().tests_finished
+
+    @property
+    def has_pending(self) -> bool:
+        if self._plan is not None and any(self._plan.values()):
+            return True
+        return super().has_pending
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = []
+        nodes = self.nodes
+        queues, loads = plan_longest_first(self.collection, self.history, len(nodes))
+        self._seconds = [self.history.estimate(nodeid)[0] for nodeid in self.collection]
+        self._plan = dict(zip(nodes, queues))
+        self.stats.predicted = {node.gateway.id: load for node, load in zip(nodes, loads)}
+        self.stats.unknown = sum(nodeid not in self.history.entries for nodeid in self.collection)
+        logger.info(f"Planned {len(self.collection)} tests on {len(nodes)} workers, "
+                    f"predicted makespan {max(loads, default=0.0):.1f}s")
+        for node in nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration: float = 0) -> None:
+        if self._plan is None:
+            return super().check_schedule(node, duration)
+        if node.shutting_down:
+            return
+        queue = self._plan.setdefault(node, [])
+        wanted = IN_FLIGHT - len(self.node2pending[node])
+        while len(queue) < wanted and self._steal(node):
+            pass
+        batch = queue[:max(wanted, 0)]
+        if batch:
+            del queue[:len(batch)]
+            self.node2pending[node].extend(batch)
+            node.send_runtest_some(batch)
+        if not any(self._plan.values()):
+            # Nothing left to hand out: the worker runs what it has and exits
+            node.shutdown()
+
+    def _remaining(self, node) -> float:
+        return sum(self._seconds[index] for index in self._plan[node])
+
+    def _lightest(self):
+        nodes = [node for node in self._plan if not node.shutting_down]
+        return min(nodes, key=self._remaining, default=None)
+
+    def _steal(self, node) -> bool:
+        """Move the shortest planned test of the worker with the most planned work to the given worker"""
+        donors = [other for other, queue in self._plan.items() if other is not node and queue]
+        if not donors:
+            return False
+        donor = max(donors, key=self._remaining)
+        self._plan[node].append(self._plan[donor].pop())
+        self.stats.stolen += 1
+        return True
+
+    def mark_test_pending(self, item: str) -> None:
+        if self._plan is None:
+            return super().mark_test_pending(item)
+        node = self._lightest()
+        if node is not None:
+            self._plan[node].insert(0, self.collection.index(item))
+        for other in self.nodes:
+            self.check_schedule(other)
+
+    def remove_node(self, node) -> Optional[str]:
+        if self._plan is None:
+            return super().remove_node(node)
+        pending = self.node2pending.pop(node)
+        orphans = self._plan.pop(node, [])
+        crashitem = None
+        if pending:
+            # The first pending test was running when the worker died
+            crashitem = self.collection[pending.pop(0)]
+            orphans = pending + orphans
+        for index in orphans:
+            target = self._lightest()
+            if target is None:
+                break
+            self._plan[target].append(index)
+        for other in self.nodes:
+            self.check_schedule(other)
+        return crashitem
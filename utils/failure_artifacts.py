@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import allure
+from config.env import TRACES_DIR, VIDEOS_DIR
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Page
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_MODES = ("off", "on", "retain-on-failure")
+
+
+class FailureArtifacts:
+    """
+    Per-test Playwright traces and videos, kept only for failed or rerun tests
+
+    Tracing runs in memory for every test; a passing test's trace is dropped by
+    stopping without a path, so nothing is serialized. Videos are recorded to a
+    scratch directory and deleted unless kept. At most max_retained traces and
+    videos are kept on disk, the oldest being removed first.
+    """
+
+    def __init__(self, tracing: str = "off", video: str = "off", max_retained: int = 20,
+                 traces_dir: Path = TRACES_DIR, videos_dir: Path = VIDEOS_DIR):
+        """
+        Initialize the recorder
+
+        Args:
+            tracing: off, on (keep every trace) or retain-on-failure
+            video: off, on (keep every video) or retain-on-failure
+            max_retained: Rolling cap on kept traces and on kept videos (0 keeps all)
+            traces_dir: Directory for kept trace archives
+            videos_dir: Directory for kept videos
+        """
+        for kind, mode in (("tracing", tracing), ("video", video)):
+            if mode not in ARTIFACT_MODES:
+                raise ValueError(f"Unknown {kind} mode '{mode}', expected one of {', '.join(ARTIFACT_MODES)}")
+        self.tracing = tracing
+        self.video = video
+        self.max_retained = max_retained
+        self.traces_dir = Path(traces_dir)
+        self.videos_dir = Path(videos_dir)
+        self._pages: Dict[BrowserContext, List[Page]] = {}
+        self.retained = 0
+        self.discarded = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], tracing: Optional[str] = None,
+                    video: Optional[str] = None) -> "FailureArtifacts":
+        """
+        Build a recorder from the config's reporting section
+
+        Args:
+            config: Environment configuration
+            tracing: Mode overriding reporting.tracing
+            video: Mode overriding reporting.videoRecording
+        """
+        reporting = config.get("reporting", {})
+        return cls(
+            tracing=tracing or ("retain-on-failure" if reporting.get("tracing") else "off"),
+            video=video or ("retain-on-failure" if reporting.get("videoRecording") else "off"),
+            max_retained=reporting.get("maxRetainedArtifacts", 20)
+        )
+
+    @staticmethod
+    def _file_stem(test_id: str) -> str:
+        return re.sub(r"[^A-Za-z0-9_.-]+", "_", test_id).strip("_")
+
+    @property
+    def _scratch_video_dir(self) -> Path:
+        # One per xdist worker, so a finishing worker never removes another's recordings
+        return self.videos_dir / f".recording-{os.getenv('PYTEST_XDIST_WORKER', 'main')}"
+
+    def context_args(self) -> Dict[str, Any]:
+        """Extra browser.new_context() arguments (video recording)"""
+        if self.video == "off":
+            return {}
+        self._scratch_video_dir.mkdir(parents=True, exist_ok=True)
+        return {"record_video_dir": str(self._scratch_video_dir)}
+
+    def start(self, context: BrowserContext) -> None:
+        """Start tracing on a new context and track its pages for their videos"""
+        if self.tracing != "off":
+            context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        if self.video != "off":
+            # Pages are usually closed before the context, so collect them as they open
+            pages = self._pages[context] = []
+            context.on("page", pages.append)
+
+    def _keep(self, mode: str, failed: bool) -> bool:
+        return mode == "on" or (mode == "retain-on-failure" and failed)
+
+    def finish(self, context: BrowserContext, test_id: str, failed: bool) -> List[Path]:
+        """
+        Close a context, keeping its trace and videos only when required
+
+        Args:
+            context: Context created for the test (closed by this call)
+            test_id: pytest node id, used to name kept files
+            failed: The test failed or is being rerun
+
+        Returns:
+            Paths of the kept artifacts
+        """
+        kept: List[Path] = []
+        stem = self._file_stem(test_id)
+        pages = self._pages.pop(context, [])
+
+        if self.tracing != "off":
+            try:
+                if self._keep(self.tracing, failed):
+                    self.traces_dir.mkdir(parents=True, exist_ok=True)
+                    trace_path = self._unique_path(self.traces_dir, stem, ".zip")
+                    context.tracing.stop(path=trace_path)
+                    kept.append(trace_path)
+                else:
+                    # Without a path the trace is dropped in the driver, never written
+                    context.tracing.stop()
+                    self.discarded += 1
+            except Exception as e:
+                logger.warning(f"Failed to stop tracing for {test_id}: {e}")
+
+        context.close()
+
+        for page in pages:
+            video = page.video
+            if video is None:
+                continue
+            try:
+                if self._keep(self.video, failed):
+                    self.videos_dir.mkdir(parents=True, exist_ok=True)
+                    video_path = self._unique_path(self.videos_dir, stem, ".webm")
+                    video.save_as(video_path)
+                    kept.append(video_path)
+                else:
+                    self.discarded += 1
+                video.delete()
+            except Exception as e:
+                logger.warning(f"Failed to process video for {test_id}: {e}")
+
+        if kept:
+            self.retained += len(kept)
+            self._prune()
+        return kept
+
+    @staticmethod
+    def _unique_path(directory: Path, stem: str, suffix: str) -> Path:
+        path = directory / f"{stem}{suffix}"
+        attempt = 1
+        while path.exists():
+            attempt += 1
+            path = directory / f"{stem}-{attempt}{suffix}"
+        return path
+
+    def _prune(self) -> None:
+        """Keep only the newest max_retained traces and videos"""
+        if not self.max_retained:
+            return
+        for directory, pattern in ((self.traces_dir, "*.zip"), (self.videos_dir, "*.webm")):
+            if not directory.exists():
+                continue
+            files = sorted(directory.glob(pattern), key=lambda path: path.stat().st_mtime, reverse=True)
+            for stale in files[self.max_retained:]:
+                stale.unlink(missing_ok=True)
+
+    @staticmethod
+    def attach(paths: List[Path]) -> None:
+        """Attach kept traces and videos to the current Allure test"""
+        for path in paths:
+            if path.suffix == ".zip":
+                allure.attach.file(str(path), name="Playwright trace", attachment_type=allure.attachment_type.ZIP)
+            elif path.suffix == ".webm":
+                allure.attach.file(str(path), name="Video", attachment_type=allure.attachment_type.WEBM)
+
+    def cleanup(self) -> None:
+        """Remove the scratch video directory at the end of the session"""
+        shutil.rmtree(self._scratch_video_dir, ignore_errors=True)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+import allure
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Playwright
+
+logger = logging.getLogger(__name__)
+
+# Outcomes of a fanned-out case, named like pytest report outcomes
+PASSED, FAILED, SKIPPED = "passed", "failed", "skipped"
+
+
+def _is_playwright_object(value: Any) -> bool:
+    """Whether a value is an object of the Playwright API (Page, Locator, expect_* managers, ...)"""
+    return type(value).__module__.split(".", 1)[0] == "playwright"
+
+
+class _LoopBridge:
+    """
+    Event loop on a background thread and blocking access to the async objects living on it
+
+    Playwright's sync API is bound to the thread that started it, so sync page
+    objects cannot share one browser across threads. Here every call is
+    executed on the loop thread and the calling thread blocks on the result,
+    which lets any number of threads drive pages of the same async browser.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="fan-out-loop", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, awaitable) -> Any:
+        """Wait for an awaitable on the loop thread and return its (wrapped) result"""
+        if threading.current_thread() is self._thread:
+            # Event handlers and predicates run on the loop; blocking there would deadlock
+            raise RuntimeError("Blocking Playwright call made on the fan-out event loop thread")
+
+        async def _await():
+            return await awaitable
+
+        return self.wrap(asyncio.run_coroutine_threadsafe(_await(), self.loop).result())
+
+    def call(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call a function of the async API on the loop thread, awaiting its result if needed"""
+        args = [self.unwrap(arg) for arg in args]
+        kwargs = {name: self.unwrap(value) for name, value in kwargs.items()}
+
+        async def _invoke():
+            result = function(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return self.run(_invoke())
+
+    def wrap(self, value: Any) -> Any:
+        if _is_playwright_object(value):
+            return SyncView(self, value)
+        if isinstance(value, list):
+            return [self.wrap(item) for item in value]
+        return value
+
+    @staticmethod
+    def unwrap(value: Any) -> Any:
+        if isinstance(value, SyncView):
+            return value._target
+        if isinstance(value, (list, tuple)):
+            return type(value)(_LoopBridge.unwrap(item) for item in value)
+        if isinstance(value, dict):
+            return {key: _LoopBridge.unwrap(item) for key, item in value.items()}
+        return value
+
+    def stop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=10)
+        self.loop.close()
+
+
+class SyncView:
+    """
+    Blocking view of an async Playwright object (Page, Locator, expect_* context managers, ...)
+
+    Behaves like the sync API object for page objects: methods block until
+    done, awaitable properties are resolved, and objects returned by the async
+    API are wrapped again. Callbacks passed in (predicates, event handlers)
+    run on the loop thread and receive async objects, so they may only read
+    properties.
+    """
+
+    __slots__ = ("_bridge", "_target")
+
+    def __init__(self, bridge: _LoopBridge, target: Any):
+        self._bridge = bridge
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        value = getattr(self._target, name)
+        if inspect.isawaitable(value):
+            return self._bridge.run(value)
+        if inspect.ismethod(value):
+            return functools.partial(self._bridge.call, value)
+        return self._bridge.wrap(value)
+
+    def __enter__(self) -> Any:
+        return self._bridge.call(self._target.__aenter__)
+
+    def __exit__(self, *exc_info) -> Optional[bool]:
+        return self._bridge.call(self._target.__aexit__, *exc_info)
+
+    def __eq__(self, other: Any) -> bool:
+        return self._target == (other._target if isinstance(other, SyncView) else other)
+
+    def __hash__(self) -> int:
+        return hash(self._target)
+
+    def __repr__(self) -> str:
+        return f"SyncView({self._target!r})"
+
+
+@dataclass
+class CaseResult:
+    """Outcome of one case run by FanOutRunner"""
+    case: Any
+    case_id: str
+    outcome: str
+    duration: float
+    message: str = ""
+    longrepr: str = ""
+    screenshot: Optional[bytes] = None
+
+    @property
+    def passed(self) -> bool:
+        return self.outcome == PASSED
+
+
+def case_id(case: Any, index: int) -> str:
+    """Id of a case for reports: its id attribute or key, else its position"""
+    if isinstance(case, dict):
+        return str(case.get("id", index))
+    return str(getattr(case, "id", index))
+
+
+class FanOutRunner:
+    """
+    Runs independent UI cases concurrently, each in its own context of one shared browser
+
+    The browser is launched on first use and kept for the whole session, so
+    every fan-out pays for one launch. Flows are plain functions taking a page
+    and a case, written against the sync page objects (LoginPage,
+    RegisterPage, ...); each runs on its own thread with a SyncView of an
+    async page, and at most `concurrency` cases are in flight at a time.
+
+    Usage:
+        results = runner.run(cases, login_is_rejected)
+    """
+
+    def __init__(self, browser_name: str = "chromium", launch_args: Optional[Dict[str, Any]] = None,
+                 context_args: Optional[Dict[str, Any]] = None, concurrency: int = 4,
+                 screenshot_on_failure: bool = True):
+        """
+        Initialize the runner
+
+        Args:
+            browser_name: Playwright browser type (chromium, firefox, webkit)
+            launch_args: Arguments for browser_type.launch()
+            context_args: Arguments for every browser.new_context()
+            concurrency: Cases in flight at most
+            screenshot_on_failure: Keep a screenshot of the page of each failed case
+        """
+        self.browser_name = browser_name
+        self.launch_args = dict(launch_args or {})
+        self.context_args = dict(context_args or {})
+        self.concurrency = max(1, concurrency)
+        self.screenshot_on_failure = screenshot_on_failure
+        self._bridge: Optional[_LoopBridge] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], browser_name: str, launch_args: Dict[str, Any],
+                    context_args: Dict[str, Any]) -> "FanOutRunner":
+        """Build a runner from the config's fanOut section"""
+        section = config.get("fanOut", {})
+        return cls(
+            browser_name,
+            launch_args,
+            context_args,
+            concurrency=section.get("concurrency", 4),
+            screenshot_on_failure=section.get("screenshotOnFailure", True)
+        )
+
+    def _ensure_browser(self) -> SyncView:
+        with self._lock:
+            if self._bridge is None:
+                self._bridge = _LoopBridge()
+            if self._browser is None or not self._browser.is_connected():
+                from playwright.async_api import async_playwright
+                if self._playwright is None:
+                    self._playwright = self._bridge.run(async_playwright().start())._target
+                logger.info(f"Launching {self.browser_name} browser for fan-out runs")
+                browser_type = getattr(self._playwright, self.browser_name)
+                self._browser = self._bridge.call(browser_type.launch, **self.launch_args)._target
+            return SyncView(self._bridge, self._browser)
+
+    def run(self, cases: Iterable[Any], flow: Callable[[Any, Any], None],
+            concurrency: Optional[int] = None) -> List[CaseResult]:
+        """
+        Run a flow for every case concurrently
+
+        Args:
+            cases: Cases passed to the flow (CaseSpec objects, dicts, ...)
+            flow: Function driving a page for one case; raising fails the case
+            concurrency: Cases in flight at most (defaults to the runner's concurrency)
+
+        Returns:
+            One result per case, in the order of cases
+        """
+        cases = list(cases)
+        if not cases:
+            return []
+        browser = self._ensure_browser()
+        workers = min(concurrency or self.concurrency, len(cases))
+        started = time.perf_counter()
+        # A fresh pool per run: Allure ties a thread's steps to the test that was running when it started
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fan-out") as pool:
+            futures = [pool.submit(self._run_case, browser, case, case_id(case, index), flow)
+                       for index, case in enumerate(cases)]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - started
+        slowest = max(result.duration for result in results)
+        logger.info(f"Fanned out {len(results)} cases over {workers} contexts in {elapsed:.1f}s "
+                    f"(slowest case {slowest:.1f}s, sum {sum(r.duration for r in results):.1f}s)")
+        return results
+
+    def _run_case(self, browser: SyncView, case: Any, identifier: str, flow: Callable[[Any, Any], None]) -> CaseResult:
+        import pytest  # Outcomes of flows calling pytest.skip() / pytest.fail() (not Exception subclasses)
+
+        started = time.perf_counter()
+        context = browser.new_context(**self.context_args)
+        page = None
+        result = CaseResult(case, identifier, PASSED, 0.0)
+        try:
+            page = context.new_page()
+            with allure.step(f"Case {identifier}"):
+                flow(page, case)
+        except pytest.skip.Exception as e:
+            result.outcome, result.message = SKIPPED, str(e)
+        except (Exception, pytest.fail.Exception) as e:
+            result.outcome = FAILED
+            result.message = f"{type(e).__name__}: {e}"
+            result.longrepr = "".join(traceback.format_exception(e))
+            if self.screenshot_on_failure and page is not None:
+                try:
+                    result.screenshot = page.screenshot(full_page=True)
+                except Exception as screenshot_error:
+                    logger.warning(f"Could not capture screenshot of case {identifier}: {screenshot_error}")
+        finally:
+            try:
+                context.close()
+            except Exception as e:
+                logger.warning(f"Failed to close context of case {identifier}: {e}")
+        result.duration = time.perf_counter() - started
+        logger.info(f"Case {identifier} {result.outcome} in {result.duration:.2f}s")
+        return result
+
+    def close(self) -> None:
+        """Close the browser and stop the event loop at the end of the session"""
+        if self._bridge is None:
+            return
+        shutdown = [(self._browser, "close"), (self._playwright, "stop")]
+        for resource, method in shutdown:
+            if resource is None:
+                continue
+            try:
+                self._bridge.call(getattr(resource, method))
+            except Exception as e:
+                logger.warning(f"Failed to shut down fan-out {type(resource).__name__}: {e}")
+        self._browser = self._playwright = None
+        self._bridge.stop()
+        self._bridge = None
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import logging
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from config.env import HAR_DIR
+from utils.request_filter import RequestFilter
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Request, Route
+
+logger = logging.getLogger(__name__)
+
+NETWORK_MODES = ("live", "record", "replay")
+
+
+class HarNetwork:
+    """
+    Records browser traffic per test into HAR archives and replays it offline
+
+    In record mode the first context of a test writes test-result/har/<test>.har
+    and further contexts <test>-2.har, <test>-3.har, ... (one HAR per context,
+    since each context overwrites its archive when it closes). In replay mode
+    the contexts, opened in the same order, are served from those archives
+    through context routes; requests that are not in the archive are aborted
+    and reported so stale recordings are easy to spot.
+    """
+
+    def __init__(self, mode: str = "live", har_dir: Path = HAR_DIR,
+                 request_filter: Optional[RequestFilter] = None):
+        """
+        Initialize the network mode
+
+        Args:
+            mode: One of live, record, replay
+            har_dir: Directory holding one HAR archive per test
+            request_filter: Filter whose blocked requests are not reported as unmatched
+        """
+        if mode not in NETWORK_MODES:
+            raise ValueError(f"Unknown network mode '{mode}', expected one of {', '.join(NETWORK_MODES)}")
+        self.mode = mode
+        self.har_dir = Path(har_dir)
+        self.request_filter = request_filter
+        self.unmatched: Dict[str, List[str]] = {}
+        self._contexts: Dict[str, int] = {}
+        if mode != "live":
+            self.har_dir.mkdir(parents=True, exist_ok=True)
+
+    def har_path(self, test_id: str, index: int = 1) -> Path:
+        """HAR archive of a test's index-th context (node id made filesystem safe)"""
+        suffix = f"-{index}" if index > 1 else ""
+        return self.har_dir / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', test_id).strip('_')}{suffix}.har"
+
+    def _next_har_path(self, test_id: str) -> Path:
+        index = self._contexts.get(test_id, 0) + 1
+        self._contexts[test_id] = index
+        return self.har_path(test_id, index)
+
+    def context_args(self, test_id: str) -> Dict[str, Any]:
+        """
+        Extra browser.new_context() arguments for a test
+
+        Args:
+            test_id: pytest node id of the test
+
+        Returns:
+            HAR recording arguments in record mode, otherwise nothing
+        """
+        if self.mode != "record":
+            return {}
+        return {
+            "record_har_path": str(self._next_har_path(test_id)),
+            "record_har_mode": "full",
+            "record_har_content": "embed"
+        }
+
+    def attach(self, context: BrowserContext, test_id: str) -> None:
+        """
+        Serve a test's recorded responses on a context (replay mode only)
+
+        Args:
+            context: Browser context created for the test
+            test_id: pytest node id of the test
+        """
+        if self.mode != "replay":
+            return
+        har_path = self._next_har_path(test_id)
+        if not har_path.exists():
+            raise FileNotFoundError(f"No HAR recording at {har_path}, run with --network-mode=record first")
+
+        unmatched = self.unmatched.setdefault(test_id, [])
+
+        def _unmatched(route: Route, request: Request) -> None:
+            if self.request_filter and self.request_filter.enabled and \
+                    self.request_filter.should_block(request.url, request.resource_type):
+                # Let the request filter abort it and count it as blocked
+                route.fallback()
+                return
+            unmatched.append(f"{request.method} {request.url}")
+            logger.warning(f"Request not found in {har_path.name}: {request.method} {request.url}")
+            route.abort("internetdisconnected")
+
+        # Routes registered later take precedence: the archive is consulted first
+        # and falls back to the catch-all only for requests it does not contain
+        context.route("**/*", _unmatched)
+        context.route_from_har(har_path, not_found="fallback")
+
+    def take_unmatched(self, test_id: str) -> List[str]:
+        """Unmatched requests recorded for a test (cleared once read, with its context count)"""
+        self._contexts.pop(test_id, None)
+        return self.unmatched.pop(test_id, [])
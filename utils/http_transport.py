@@ -0,0 +1,160 @@
+import logging
+import threading
+from typing import Any, Dict, Iterable, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_RETRY_STATUSES = (502, 503, 504)
+
+
+class TransportStats:
+    """Requests sent vs connections opened for and reused by their attempts"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.opened = 0
+        self.reused = 0
+
+    @property
+    def retries(self) -> int:
+        """Attempts beyond the first one of each request"""
+        return max(0, self.opened + self.reused - self.requests)
+
+    def add(self, requests: int = 0, opened: int = 0, reused: int = 0) -> None:
+        with self._lock:
+            self.requests += requests
+            self.opened += opened
+            self.reused += reused
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"requests": self.requests, "opened": self.opened, "reused": self.reused}
+
+    def merge(self, data: Dict[str, int]) -> None:
+        """Add counters reported by another process"""
+        self.add(requests=data.get("requests", 0), opened=data.get("opened", 0), reused=data.get("reused", 0))
+
+    def __str__(self) -> str:
+        attempts = self.opened + self.reused
+        reuse = self.reused / attempts if attempts else 0
+        line = f"{self.requests} requests, {self.opened} connections opened, {self.reused} reused ({reuse:.0%})"
+        return f"{line}, {self.retries} retried attempts" if self.retries else line
+
+
+def _counting_pools(stats: TransportStats) -> Dict[str, type]:
+    """Connection pool classes that count whether each attempt needs a new connection (and TLS handshake)"""
+    def _make_request(base):
+        def make_request(self, conn, *args, **kwargs):
+            # Pooled connections keep their socket; new or dropped ones connect on this request
+            if getattr(conn, "sock", None) is None:
+                stats.add(opened=1)
+            else:
+                stats.add(reused=1)
+            return base._make_request(self, conn, *args, **kwargs)
+        return make_request
+
+    return {
+        "http": type("CountingHTTPConnectionPool", (HTTPConnectionPool,),
+                     {"_make_request": _make_request(HTTPConnectionPool)}),
+        "https": type("CountingHTTPSConnectionPool", (HTTPSConnectionPool,),
+                      {"_make_request": _make_request(HTTPSConnectionPool)})
+    }
+
+
+class PooledTransport(HTTPAdapter):
+    """
+    requests transport adapter shared by every APIHelpers of a worker
+
+    Mounting one adapter on many sessions makes them share its keep-alive
+    connection pools, so a connection (and its TLS handshake) opened by one
+    test class is reused by the next. Idempotent requests and connection
+    failures are retried with exponential backoff.
+    """
+
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 retries: int = 0, backoff_factor: float = 0.5,
+                 retry_statuses: Iterable[int] = DEFAULT_RETRY_STATUSES):
+        """
+        Initialize the transport
+
+        Args:
+            pool_connections: Hosts whose connection pools are kept
+            pool_maxsize: Connections kept open per host
+            retries: Retries for connection errors, read errors and retry_statuses
+                (reads and statuses only for idempotent methods)
+            backoff_factor: Sleep backoff_factor * 2^(retry - 1) seconds between retries
+            retry_statuses: Response statuses that are retried
+        """
+        self.stats = TransportStats()
+        self._pool_classes = _counting_pools(self.stats)
+        max_retries = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=tuple(retry_statuses),
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        ) if retries else Retry(0, read=False)
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=max_retries)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PooledTransport":
+        """Build a transport from config["retries"] and the httpPool section"""
+        pool = config.get("httpPool", {})
+        return cls(
+            pool_connections=pool.get("poolConnections", DEFAULT_POOL_CONNECTIONS),
+            pool_maxsize=pool.get("poolMaxsize", DEFAULT_POOL_MAXSIZE),
+            retries=config.get("retries", 0),
+            backoff_factor=pool.get("backoffFactor", 0.5),
+            retry_statuses=pool.get("retryStatuses", DEFAULT_RETRY_STATUSES)
+        )
+
+    def init_poolmanager(self, connections: int, maxsize: int, block: bool = False, **pool_kwargs) -> None:
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    def send(self, request, **kwargs):
+        self.stats.add(requests=1)
+        return super().send(request, **kwargs)
+
+    @property
+    def pool_maxsize(self) -> int:
+        return self._pool_maxsize
+
+    def close(self) -> None:
+        # requests.Session.close() closes its adapters; one helper closing its
+        # session must not drop the connections every other helper is reusing
+        pass
+
+    def shutdown(self) -> None:
+        """Close every pooled connection"""
+        super().close()
+
+
+_default_transport: Optional[PooledTransport] = None
+_default_lock = threading.Lock()
+
+
+def default_transport() -> PooledTransport:
+    """The worker's shared transport (created with defaults on first use)"""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = PooledTransport()
+        return _default_transport
+
+
+def configure_default_transport(config: Dict[str, Any]) -> PooledTransport:
+    """Replace the worker's shared transport with one built from config"""
+    global _default_transport
+    with _default_lock:
+        previous, _default_transport = _default_transport, PooledTransport.from_config(config)
+    if previous is not None:
+        # Keep counting across the swap so the session summary stays complete
+        _default_transport.stats.merge(previous.stats.to_dict())
+        previous.shutdown()
+    return _default_transport
@@ -0,0 +1,284 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+import allure
+from utils.api_helpers import APIHelpers, RequestSpec
+from utils.response_logging import APIResponse
+
+logger = logging.getLogger(__name__)
+
+# newAccountType values of the createAccount service
+ACCOUNT_TYPES = ("CHECKING", "SAVINGS", "LOAN")
+
+
+class ParaBankAPIError(Exception):
+    """Raised when a ParaBank service answers with a 4xx/5xx status"""
+
+    def __init__(self, method: str, endpoint: str, response: APIResponse):
+        self.status_code = response.status_code
+        self.message = response.text.strip()
+        super().__init__(f"{method} {endpoint} failed with HTTP {self.status_code}: {self.message}")
+
+
+@dataclass(frozen=True, slots=True)
+class Address:
+    street: str
+    city: str
+    state: str
+    zip_code: str
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Address":
+        return cls(data.get("street", ""), data.get("city", ""), data.get("state", ""), data.get("zipCode", ""))
+
+
+@dataclass(frozen=True, slots=True)
+class Customer:
+    id: int
+    first_name: str
+    last_name: str
+    address: Address
+    phone_number: str
+    ssn: str
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Customer":
+        return cls(data["id"], data.get("firstName", ""), data.get("lastName", ""),
+                   Address.from_json(data.get("address") or {}), data.get("phoneNumber", ""), data.get("ssn", ""))
+
+
+@dataclass(frozen=True, slots=True)
+class Account:
+    id: int
+    customer_id: int
+    type: str
+    balance: float
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Account":
+        return cls(data["id"], data["customerId"], data["type"], float(data["balance"]))
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    id: int
+    account_id: int
+    type: str
+    amount: float
+    description: str
+    date: datetime
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Transaction":
+        return cls(data["id"], data["accountId"], data["type"], float(data["amount"]),
+                   data.get("description", ""), datetime.fromtimestamp(data["date"] / 1000))
+
+    @property
+    def signed_amount(self) -> float:
+        """Amount with debits negative"""
+        return self.amount if self.type == "Credit" else -self.amount
+
+
+@dataclass(frozen=True, slots=True)
+class BillPayment:
+    payee_name: str
+    amount: float
+    account_id: int
+
+
+@dataclass(frozen=True, slots=True)
+class LoanDecision:
+    approved: bool
+    message: Optional[str]
+    account_id: Optional[int]
+    provider: str
+
+
+class ParaBankClient:
+    """
+    Typed client for the ParaBank REST services, built on APIHelpers
+
+    Responses are returned as compact immutable records, and bulk helpers send
+    their requests concurrently through APIHelpers.batch(). Lets tests set up
+    customers, accounts and balances over HTTP instead of through the UI.
+
+    Usage:
+        bank = ParaBankClient(APIHelpers(config["apiUrl"]))
+        customer = bank.login("john", "demo")
+        checking = bank.get_accounts(customer.id)[0]
+        savings = bank.create_accounts(customer.id, checking.id, count=3, account_type="SAVINGS")
+        bank.fund_accounts([a.id for a in savings], 250)
+    """
+
+    def __init__(self, api: APIHelpers, max_workers: int = 10):
+        """
+        Initialize the client
+
+        Args:
+            api: Helper pointing at the services root (config["apiUrl"])
+            max_workers: Requests in flight at most for bulk operations
+        """
+        self.api = api
+        self.max_workers = max_workers
+
+    def _check(self, method: str, endpoint: str, response: APIResponse) -> APIResponse:
+        if response.status_code >= 400:
+            raise ParaBankAPIError(method, endpoint, response)
+        return response
+
+    def _get(self, endpoint: str) -> Any:
+        return self._check("GET", endpoint, self.api.get(endpoint)).json()
+
+    def _post(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+              json_data: Optional[Dict[str, Any]] = None) -> APIResponse:
+        return self._check("POST", endpoint, self.api.post(endpoint, params=params, json_data=json_data))
+
+    def _batch(self, specs: List[RequestSpec]) -> List[APIResponse]:
+        """Send specs concurrently, raising for the first failed one"""
+        result = self.api.batch(specs, max_workers=self.max_workers)
+        for index in sorted(result.errors):
+            raise result.errors[index]
+        for index, response in sorted(result.http_errors.items()):
+            raise ParaBankAPIError(specs[index].method, specs[index].endpoint, response)
+        return result.responses
+
+    # Customers
+
+    @allure.step("API login as {username}")
+    def login(self, username: str, password: str) -> Customer:
+        """Customer owning the credentials"""
+        return Customer.from_json(self._get(f"/login/{username}/{password}"))
+
+    def get_customer(self, customer_id: int) -> Customer:
+        return Customer.from_json(self._get(f"/customers/{customer_id}"))
+
+    @allure.step("API update customer profile")
+    def update_customer(self, customer: Customer, username: str, password: str) -> None:
+        """
+        Replace a customer's profile (ParaBank requires every field, credentials included)
+
+        Args:
+            customer: Customer with the new values
+            username: Login username to keep or set
+            password: Login password to keep or set
+        """
+        self._post(f"/customers/update/{customer.id}", params={
+            "firstName": customer.first_name,
+            "lastName": customer.last_name,
+            "street": customer.address.street,
+            "city": customer.address.city,
+            "state": customer.address.state,
+            "zipCode": customer.address.zip_code,
+            "phoneNumber": customer.phone_number,
+            "ssn": customer.ssn,
+            "username": username,
+            "password": password
+        })
+
+    # Accounts
+
+    def get_accounts(self, customer_id: int) -> List[Account]:
+        return [Account.from_json(item) for item in self._get(f"/customers/{customer_id}/accounts")]
+
+    def get_account(self, account_id: int) -> Account:
+        return Account.from_json(self._get(f"/accounts/{account_id}"))
+
+    @staticmethod
+    def _create_account_spec(customer_id: int, from_account_id: int, account_type: str) -> RequestSpec:
+        if account_type not in ACCOUNT_TYPES:
+            raise ValueError(f"Unknown account type '{account_type}', expected one of {', '.join(ACCOUNT_TYPES)}")
+        return RequestSpec("POST", "/createAccount", params={
+            "customerId": customer_id,
+            "newAccountType": ACCOUNT_TYPES.index(account_type),
+            "fromAccountId": from_account_id
+        })
+
+    @allure.step("API open {account_type} account for customer {customer_id}")
+    def create_account(self, customer_id: int, from_account_id: int, account_type: str = "CHECKING") -> Account:
+        """
+        Open an account, funded with ParaBank's minimum deposit from another account
+
+        Args:
+            customer_id: Owner of the new account
+            from_account_id: Account of the same customer funding the opening deposit
+            account_type: CHECKING, SAVINGS or LOAN
+        """
+        spec = self._create_account_spec(customer_id, from_account_id, account_type)
+        return Account.from_json(self._post(spec.endpoint, params=spec.params).json())
+
+    @allure.step("API open {count} {account_type} accounts for customer {customer_id}")
+    def create_accounts(self, customer_id: int, from_account_id: int, count: int,
+                        account_type: str = "CHECKING") -> List[Account]:
+        """Open count accounts concurrently (see create_account)"""
+        spec = self._create_account_spec(customer_id, from_account_id, account_type)
+        return [Account.from_json(response.json()) for response in self._batch([spec] * count)]
+
+    # Transactions
+
+    def get_transactions(self, account_id: int) -> List[Transaction]:
+        return [Transaction.from_json(item) for item in self._get(f"/accounts/{account_id}/transactions")]
+
+    def get_transactions_for(self, account_ids: Iterable[int]) -> Dict[int, List[Transaction]]:
+        """Transactions of several accounts, fetched concurrently, by account id"""
+        account_ids = list(dict.fromkeys(account_ids))
+        responses = self._batch([RequestSpec("GET", f"/accounts/{account_id}/transactions")
+                                 for account_id in account_ids])
+        return {account_id: [Transaction.from_json(item) for item in response.json()]
+                for account_id, response in zip(account_ids, responses)}
+
+    # Money movement
+
+    @allure.step("API transfer {amount} from {from_account_id} to {to_account_id}")
+    def transfer(self, from_account_id: int, to_account_id: int, amount: float) -> None:
+        self._post("/transfer", params={"fromAccountId": from_account_id, "toAccountId": to_account_id,
+                                        "amount": amount})
+
+    @allure.step("API deposit {amount} to {account_id}")
+    def deposit(self, account_id: int, amount: float) -> None:
+        self._post("/deposit", params={"accountId": account_id, "amount": amount})
+
+    @allure.step("API withdraw {amount} from {account_id}")
+    def withdraw(self, account_id: int, amount: float) -> None:
+        self._post("/withdraw", params={"accountId": account_id, "amount": amount})
+
+    @allure.step("API fund {amount} to each of {account_ids}")
+    def fund_accounts(self, account_ids: Iterable[int], amount: float) -> None:
+        """Deposit amount to every account concurrently"""
+        self._batch([RequestSpec("POST", "/deposit", params={"accountId": account_id, "amount": amount})
+                     for account_id in account_ids])
+
+    @allure.step("API pay {amount} to {payee_name} from {account_id}")
+    def pay_bill(self, account_id: int, amount: float, payee_name: str, payee_account: int,
+                 address: Optional[Address] = None, phone_number: str = "") -> BillPayment:
+        """
+        Pay a payee from an account
+
+        Args:
+            account_id: Account the payment is debited from
+            amount: Amount to pay
+            payee_name: Payee name
+            payee_account: Payee's account number
+            address: Payee address
+            phone_number: Payee phone number
+        """
+        address = address or Address("", "", "", "")
+        payee = {
+            "name": payee_name,
+            "address": {"street": address.street, "city": address.city,
+                        "state": address.state, "zipCode": address.zip_code},
+            "phoneNumber": phone_number,
+            "accountNumber": payee_account
+        }
+        data = self._post("/billpay", params={"accountId": account_id, "amount": amount}, json_data=payee).json()
+        return BillPayment(data["payeeName"], float(data["amount"]), data["accountId"])
+
+    @allure.step("API request loan of {amount} for customer {customer_id}")
+    def request_loan(self, customer_id: int, amount: float, down_payment: float,
+                     from_account_id: int) -> LoanDecision:
+        """Request a loan; a declined loan is a normal result, not an error"""
+        data = self._post("/requestLoan", params={"customerId": customer_id, "amount": amount,
+                                                  "downPayment": down_payment,
+                                                  "fromAccountId": from_account_id}).json()
+        return LoanDecision(bool(data.get("approved")), data.get("message"), data.get("accountId"),
+                            data.get("loanProviderName", ""))
@@ -0,0 +1,641 @@
+import html
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.cookies import SimpleCookie
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_PATH = "/parabank"
+SERVICES_PATH = f"{CONTEXT_PATH}/services/bank"
+
+# newAccountType values of the createAccount service
+ACCOUNT_TYPES = ("CHECKING", "SAVINGS", "LOAN")
+
+# ParaBank funds every new account from an existing one with this amount
+MINIMUM_OPENING_DEPOSIT = 100.0
+
+
+class ServiceError(Exception):
+    """A request the stand-in answers with 400 and the message as plain text"""
+
+
+class ParaBankState:
+    """
+    In-memory customers, accounts and sessions backing the stand-in server
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.customers: Dict[int, Dict[str, Any]] = {}
+        self.credentials: Dict[str, Tuple[str, int]] = {}
+        self.accounts: Dict[int, Dict[str, Any]] = {}
+        self.transactions: Dict[int, Dict[str, Any]] = {}
+        self.sessions: Dict[str, int] = {}
+        self._next_customer_id = 12212
+        self._next_account_id = 12345
+        self._next_transaction_id = 14476
+        self.add_customer({
+            "firstName": "John",
+            "lastName": "Smith",
+            "address": {"street": "1431 Main St", "city": "Beverly Hills", "state": "CA", "zipCode": "90210"},
+            "phoneNumber": "310-447-4121",
+            "ssn": "622-11-9999"
+        }, "john", "demo")
+
+    def add_customer(self, customer: Dict[str, Any], username: str, password: str,
+                     opening_balance: float = 515.50) -> Dict[str, Any]:
+        """
+        Create a customer with one checking account
+
+        Args:
+            customer: Customer fields (firstName, lastName, address, phoneNumber, ssn)
+            username: Login username
+            password: Login password
+            opening_balance: Balance of the initial checking account
+
+        Returns:
+            Stored customer record
+        """
+        with self.lock:
+            customer_id = self._next_customer_id
+            self._next_customer_id += 11
+            record = {"id": customer_id, **customer}
+            self.customers[customer_id] = record
+            self.credentials[username] = (password, customer_id)
+        self.add_account(customer_id, "CHECKING", opening_balance)
+        return record
+
+    def add_account(self, customer_id: int, account_type: str, balance: float) -> Dict[str, Any]:
+        """Open an account for a customer"""
+        with self.lock:
+            account_id = self._next_account_id
+            self._next_account_id += 111
+            account = {"id": account_id, "customerId": customer_id, "type": account_type, "balance": round(balance, 2)}
+            self.accounts[account_id] = account
+            return account
+
+    def authenticate(self, username: str, password: str) -> Optional[int]:
+        """Return the customer id for valid credentials"""
+        stored = self.credentials.get(username)
+        if stored and stored[0] == password:
+            return stored[1]
+        return None
+
+    def customer_accounts(self, customer_id: int) -> List[Dict[str, Any]]:
+        return [a for a in self.accounts.values() if a["customerId"] == customer_id]
+
+    def customer(self, customer_id: int) -> Dict[str, Any]:
+        if customer_id not in self.customers:
+            raise ServiceError(f"Could not find customer #{customer_id}")
+        return self.customers[customer_id]
+
+    def account(self, account_id: int) -> Dict[str, Any]:
+        if account_id not in self.accounts:
+            raise ServiceError(f"Could not find account #{account_id}")
+        return self.accounts[account_id]
+
+    def account_transactions(self, account_id: int) -> List[Dict[str, Any]]:
+        self.account(account_id)
+        return [t for t in self.transactions.values() if t["accountId"] == account_id]
+
+    def _post(self, account_id: int, amount: float, description: str) -> None:
+        """Apply a credit (amount > 0) or debit to an account and log it (lock held)"""
+        account = self.account(account_id)
+        account["balance"] = round(account["balance"] + amount, 2)
+        transaction_id = self._next_transaction_id
+        self._next_transaction_id += 11
+        self.transactions[transaction_id] = {
+            "id": transaction_id,
+            "accountId": account_id,
+            "type": "Credit" if amount > 0 else "Debit",
+            "date": int(time.time() * 1000),
+            "amount": round(abs(amount), 2),
+            "description": description
+        }
+
+    def create_account(self, customer_id: int, account_type: str, from_account_id: int) -> Dict[str, Any]:
+        """Open an account funded with the minimum deposit from another account of the customer"""
+        self.customer(customer_id)
+        if self.account(from_account_id)["customerId"] != customer_id:
+            raise ServiceError(f"Account #{from_account_id} does not belong to customer #{customer_id}")
+        account = self.add_account(customer_id, account_type, 0)
+        with self.lock:
+            self._post(from_account_id, -MINIMUM_OPENING_DEPOSIT, "Funds Transfer Sent")
+            self._post(account["id"], MINIMUM_OPENING_DEPOSIT, "Funds Transfer Received")
+        return account
+
+    def transfer(self, from_account_id: int, to_account_id: int, amount: float) -> None:
+        with self.lock:
+            self.account(to_account_id)
+            self._post(from_account_id, -amount, "Funds Transfer Sent")
+            self._post(to_account_id, amount, "Funds Transfer Received")
+
+    def deposit(self, account_id: int, amount: float) -> None:
+        with self.lock:
+            self._post(account_id, amount, "Deposit via Web Service")
+
+    def withdraw(self, account_id: int, amount: float) -> None:
+        with self.lock:
+            self._post(account_id, -amount, "Withdrawal via Web Service")
+
+    def bill_pay(self, account_id: int, amount: float, payee_name: str) -> None:
+        with self.lock:
+            self._post(account_id, -amount, f"Bill Payment to {payee_name}")
+
+    def request_loan(self, customer_id: int, amount: float, down_payment: float,
+                     from_account_id: int) -> Dict[str, Any]:
+        """Approve the loan when the source account covers the down payment"""
+        self.customer(customer_id)
+        result = {
+            "responseDate": int(time.time() * 1000),
+            "loanProviderName": "ParaBank",
+            "approved": False,
+            "message": None,
+            "accountId": None
+        }
+        if self.account(from_account_id)["balance"] < down_payment:
+            result["message"] = "error.insufficient.funds.for.down.payment"
+            return result
+        loan = self.add_account(customer_id, "LOAN", 0)
+        with self.lock:
+            self._post(from_account_id, -down_payment, "Down Payment for Loan")
+            self._post(loan["id"], amount, "Loan Funds")
+        result.update(approved=True, accountId=loan["id"])
+        return result
+
+    def update_customer(self, customer_id: int, fields: Dict[str, str]) -> None:
+        with self.lock:
+            customer = self.customer(customer_id)
+            address = customer.setdefault("address", {})
+            for name in ("firstName", "lastName", "phoneNumber", "ssn"):
+                if name in fields:
+                    customer[name] = fields[name]
+            for name in ("street", "city", "state", "zipCode"):
+                if name in fields:
+                    address[name] = fields[name]
+            if fields.get("username") and fields.get("password"):
+                for username, (_, stored_id) in list(self.credentials.items()):
+                    if stored_id == customer_id:
+                        del self.credentials[username]
+                self.credentials[fields["username"]] = (fields["password"], customer_id)
+
+
+LAYOUT = """<!DOCTYPE html>
+<html><head><title>ParaBank | {title}</title></head>
+<body>
+<div id="mainPanel">
+  <div id="topPanel"><a href="admin.htm">ParaBank</a></div>
+  <div id="bodyPanel">
+    <div id="leftPanel">{left}</div>
+    <div id="rightPanel">{right}</div>
+  </div>
+</div>
+</body></html>"""
+
+LOGIN_PANEL = """<h2>Customer Login</h2>
+<form name="login" method="post" action="login.htm">
+  <p><b>Username</b></p><div class="login"><input type="text" class="input" name="username"/></div>
+  <p><b>Password</b></p><div class="login"><input type="password" class="input" name="password"/></div>
+  <div class="login"><input type="submit" class="button" value="Log In"/></div>
+</form>
+<p><a href="lookup.htm">Forgot login info?</a></p>
+<p><a href="register.htm">Register</a></p>"""
+
+ACCOUNT_SERVICES_PANEL = """<p class="smallText"><b>Welcome</b> {name}</p>
+<h2>Account Services</h2>
+<ul>
+  <li><a href="openaccount.htm">Open New Account</a></li>
+  <li><a href="overview.htm">Accounts Overview</a></li>
+  <li><a href="updateprofile.htm">Update Contact Info</a></li>
+  <li><a href="logout.htm">Log Out</a></li>
+</ul>"""
+
+REGISTER_FIELDS = [
+    ("customer.firstName", "First Name:", "First name is required."),
+    ("customer.lastName", "Last Name:", "Last name is required."),
+    ("customer.address.street", "Address:", "Address is required."),
+    ("customer.address.city", "City:", "City is required."),
+    ("customer.address.state", "State:", "State is required."),
+    ("customer.address.zipCode", "Zip Code:", "Zip Code is required."),
+    ("customer.phoneNumber", "Phone #:", None),
+    ("customer.ssn", "SSN:", "Social Security Number is required."),
+    ("customer.username", "Username:", "Username is required."),
+    ("customer.password", "Password:", "Password is required."),
+    ("repeatedPassword", "Confirm:", "Password confirmation is required."),
+]
+
+PROFILE_FIELDS = [
+    ("customer.firstName", "First Name:", "First name is required."),
+    ("customer.lastName", "Last Name:", "Last name is required."),
+    ("customer.address.street", "Address:", "Address is required."),
+    ("customer.address.city", "City:", "City is required."),
+    ("customer.address.state", "State:", "State is required."),
+    ("customer.address.zipCode", "Zip Code:", "Zip Code is required."),
+    ("customer.phoneNumber", "Phone #:", None),
+]
+
+
+class ParaBankRequestHandler(BaseHTTPRequestHandler):
+    """Serves the subset of ParaBank pages and REST endpoints used by the suite"""
+
+    server_version = "ParaBankStub/1.0"
+    # Keep-alive like the real server, so clients can reuse connections
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> ParaBankState:
+        return self.server.state
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(f"[ParaBank stub] {format % args}")
+
+    # Request plumbing
+
+    def _session_customer(self) -> Optional[int]:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        if "JSESSIONID" in cookie:
+            return self.state.sessions.get(cookie["JSESSIONID"].value)
+        return None
+
+    def _read_body(self) -> None:
+        # Always consumed, or leftover bytes would corrupt the next request on the connection
+        length = int(self.headers.get("Content-Length") or 0)
+        self._body = self.rfile.read(length) if length else b""
+
+    def _form(self) -> Dict[str, str]:
+        body = self._body.decode("utf-8")
+        return {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+
+    def _send(self, status: int, body: str, content_type: str = "text/html;charset=UTF-8",
+              headers: Optional[Dict[str, str]] = None) -> None:
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def _json(self, status: int, data: Any) -> None:
+        self._send(status, json.dumps(data), content_type="application/json")
+
+    def _page(self, title: str, right: str, customer_id: Optional[int] = None,
+              status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        if customer_id is not None:
+            customer = self.state.customers[customer_id]
+            left = ACCOUNT_SERVICES_PANEL.format(name=html.escape(f"{customer['firstName']} {customer['lastName']}"))
+        else:
+            left = LOGIN_PANEL
+        self._send(status, LAYOUT.format(title=title, left=left, right=right), headers=headers)
+
+    def _start_session(self, customer_id: int) -> Dict[str, str]:
+        session_id = uuid.uuid4().hex.upper()
+        self.state.sessions[session_id] = customer_id
+        return {"Set-Cookie": f"JSESSIONID={session_id}; Path={CONTEXT_PATH}; HttpOnly"}
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        self._read_body()
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+
+        if path.startswith(SERVICES_PATH):
+            return self._service(method, path[len(SERVICES_PATH):], query)
+
+        routes = {
+            ("GET", f"{CONTEXT_PATH}/"): self._index,
+            ("GET", f"{CONTEXT_PATH}/index.htm"): self._index,
+            ("POST", f"{CONTEXT_PATH}/login.htm"): self._login,
+            ("GET", f"{CONTEXT_PATH}/overview.htm"): self._overview,
+            ("GET", f"{CONTEXT_PATH}/logout.htm"): self._logout,
+            ("GET", f"{CONTEXT_PATH}/register.htm"): self._register_form,
+            ("POST", f"{CONTEXT_PATH}/register.htm"): self._register,
+            ("GET", f"{CONTEXT_PATH}/lookup.htm"): self._lookup,
+            ("GET", f"{CONTEXT_PATH}/updateprofile.htm"): self._profile_form,
+            ("POST", f"{CONTEXT_PATH}/updateprofile.htm"): self._update_profile,
+        }
+        handler = routes.get((method, path))
+        if handler is None:
+            return self._send(404, "<html><body><h1>404 Not Found</h1></body></html>")
+        handler()
+
+    # Pages
+
+    def _index(self) -> None:
+        right = "<h1 class=\"title\">Welcome to ParaBank</h1><p class=\"caption\">Online banking for the test suite.</p>"
+        self._page("Welcome | Online Banking", right, self._session_customer())
+
+    def _login(self) -> None:
+        form = self._form()
+        username, password = form.get("username", ""), form.get("password", "")
+        if not username or not password:
+            message = "Please enter a username and password."
+        else:
+            customer_id = self.state.authenticate(username, password)
+            if customer_id is not None:
+                return self._redirect("overview.htm", headers=self._start_session(customer_id))
+            message = "The username and password could not be verified."
+        right = f"<h1 class=\"title\">Error!</h1><p class=\"error\">{message}</p>"
+        self._page("Error", right)
+
+    def _overview(self) -> None:
+        customer_id = self._session_customer()
+        if customer_id is None:
+            right = "<h1 class=\"title\">Error!</h1><p class=\"error\">An internal error has occurred and has been logged.</p>"
+            return self._page("Error", right)
+        rows = "".join(
+            f"<tr><td><a href=\"activity.htm?id={a['id']}\">{a['id']}</a></td><td>${a['balance']:.2f}</td></tr>"
+            for a in self.state.customer_accounts(customer_id)
+        )
+        right = (
+            "<div id=\"showOverview\"><h1 class=\"title\">Accounts Overview</h1>"
+            "<table id=\"accountTable\" class=\"table\"><thead><tr><th>Account</th><th>Balance*</th></tr></thead>"
+            f"<tbody>{rows}</tbody></table></div>"
+        )
+        self._page("Accounts Overview", right, customer_id)
+
+    def _logout(self) -> None:
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        if "JSESSIONID" in cookie:
+            self.state.sessions.pop(cookie["JSESSIONID"].value, None)
+        self._redirect("index.htm", headers={"Set-Cookie": f"JSESSIONID=; Path={CONTEXT_PATH}; Max-Age=0"})
+
+    def _lookup(self) -> None:
+        right = "<h1 class=\"title\">Customer Lookup</h1><p>Please fill out the following information in order to validate your account.</p>"
+        self._page("Customer Lookup", right, self._session_customer())
+
+    def _register_form(self, values: Optional[Dict[str, str]] = None,
+                       errors: Optional[Dict[str, str]] = None) -> None:
+        values = values or {}
+        errors = errors or {}
+        rows = []
+        for field, label, _ in REGISTER_FIELDS:
+            input_type = "password" if field in ("customer.password", "repeatedPassword") else "text"
+            value = "" if input_type == "password" else html.escape(values.get(field, ""))
+            error = f"<span id=\"{field}.errors\" class=\"error\">{errors[field]}</span>" if field in errors else ""
+            rows.append(
+                f"<tr><td align=\"right\" width=\"20%\"><b>{label}</b></td>"
+                f"<td width=\"20%\"><input id=\"{field}\" name=\"{field}\" class=\"input\" type=\"{input_type}\" value=\"{value}\"/></td>"
+                f"<td>{error}</td></tr>"
+            )
+        right = (
+            "<h1 class=\"title\">Signing up is easy!</h1>"
+            "<p>If you have an account with us you can sign-up for free instant online access.</p>"
+            "<form id=\"customerForm\" action=\"register.htm\" method=\"post\"><table class=\"form2\">"
+            f"{''.join(rows)}"
+            "<tr><td></td><td colspan=\"2\"><input type=\"submit\" class=\"button\" value=\"Register\"/></td></tr>"
+            "</table></form>"
+        )
+        self._page("Register for Free Online Account Access", right, self._session_customer())
+
+    def _register(self) -> None:
+        form = self._form()
+        errors = {field: message for field, _, message in REGISTER_FIELDS if message and not form.get(field)}
+        username = form.get("customer.username", "")
+        if username and username in self.state.credentials:
+            errors["customer.username"] = "This username already exists."
+        if form.get("customer.password") and form.get("repeatedPassword") and \
+                form["customer.password"] != form["repeatedPassword"]:
+            errors["repeatedPassword"] = "Passwords did not match."
+        if errors:
+            return self._register_form(form, errors)
+
+        customer = self.state.add_customer({
+            "firstName": form["customer.firstName"],
+            "lastName": form["customer.lastName"],
+            "address": {
+                "street": form["customer.address.street"],
+                "city": form["customer.address.city"],
+                "state": form["customer.address.state"],
+                "zipCode": form["customer.address.zipCode"]
+            },
+            "phoneNumber": form.get("customer.phoneNumber", ""),
+            "ssn": form["customer.ssn"]
+        }, username, form["customer.password"])
+        right = (
+            f"<h1 class=\"title\">Welcome {html.escape(username)}</h1>"
+            "<p>Your account was created successfully. You are now logged in.</p>"
+        )
+        self._page("Customer Created", right, customer["id"], headers=self._start_session(customer["id"]))
+
+    @staticmethod
+    def _profile_values(customer: Dict[str, Any]) -> Dict[str, str]:
+        address = customer.get("address", {})
+        return {
+            "customer.firstName": customer.get("firstName", ""),
+            "customer.lastName": customer.get("lastName", ""),
+            "customer.address.street": address.get("street", ""),
+            "customer.address.city": address.get("city", ""),
+            "customer.address.state": address.get("state", ""),
+            "customer.address.zipCode": address.get("zipCode", ""),
+            "customer.phoneNumber": customer.get("phoneNumber", "")
+        }
+
+    def _profile_form(self, values: Optional[Dict[str, str]] = None,
+                      errors: Optional[Dict[str, str]] = None) -> None:
+        customer_id = self._session_customer()
+        if customer_id is None:
+            right = "<h1 class=\"title\">Error!</h1><p class=\"error\">An internal error has occurred and has been logged.</p>"
+            return self._page("Error", right)
+        values = values or self._profile_values(self.state.customers[customer_id])
+        errors = errors or {}
+        rows = []
+        for field, label, _ in PROFILE_FIELDS:
+            error = f"<span id=\"{field}.errors\" class=\"error\">{errors[field]}</span>" if field in errors else ""
+            rows.append(
+                f"<tr><td align=\"right\" width=\"20%\"><b>{label}</b></td>"
+                f"<td width=\"20%\"><input id=\"{field}\" name=\"{field}\" class=\"input\" type=\"text\" "
+                f"value=\"{html.escape(values.get(field, ''))}\"/></td><td>{error}</td></tr>"
+            )
+        right = (
+            "<div id=\"updateProfileForm\"><h1 class=\"title\">Update Profile</h1>"
+            "<form action=\"updateprofile.htm\" method=\"post\"><table class=\"form2\">"
+            f"{''.join(rows)}"
+            "<tr><td></td><td colspan=\"2\"><input type=\"submit\" class=\"button\" value=\"Update Profile\"/></td></tr>"
+            "</table></form></div>"
+        )
+        self._page("Update Profile", right, customer_id)
+
+    def _update_profile(self) -> None:
+        customer_id = self._session_customer()
+        form = self._form()
+        if customer_id is None:
+            return self._profile_form()
+        errors = {field: message for field, _, message in PROFILE_FIELDS if message and not form.get(field)}
+        if errors:
+            return self._profile_form(form, errors)
+
+        with self.state.lock:
+            customer = self.state.customers[customer_id]
+            customer.update({
+                "firstName": form["customer.firstName"],
+                "lastName": form["customer.lastName"],
+                "address": {
+                    "street": form["customer.address.street"],
+                    "city": form["customer.address.city"],
+                    "state": form["customer.address.state"],
+                    "zipCode": form["customer.address.zipCode"]
+                },
+                "phoneNumber": form.get("customer.phoneNumber", "")
+            })
+        right = (
+            "<div id=\"updateProfileResult\"><h1 class=\"title\">Profile Updated</h1>"
+            "<p>Your updated address and phone number have been added to the system.</p></div>"
+        )
+        self._page("Profile Updated", right, customer_id)
+
+    # REST services
+
+    def _service(self, method: str, path: str, query: Dict[str, str]) -> None:
+        match = re.fullmatch(r"/login/([^/]+)/([^/]+)", path)
+        if method == "GET" and (match or path == "/login"):
+            username, password = match.groups() if match else (query.get("username", ""), query.get("password", ""))
+            customer_id = self.state.authenticate(username, password)
+            if customer_id is None:
+                return self._send(400, "Invalid username and/or password", content_type="text/plain")
+            return self._json(200, self.state.customers[customer_id])
+
+        try:
+            result = self._banking_service(method, path, query)
+        except ServiceError as e:
+            return self._send(400, str(e), content_type="text/plain")
+        except (KeyError, ValueError, IndexError) as e:
+            return self._send(400, f"Invalid request: {e}", content_type="text/plain")
+        if result is not None:
+            if isinstance(result, str):
+                return self._send(200, result, content_type="text/plain")
+            return self._json(200, result)
+
+        self._send(404, f"No service found for {method} {path}", content_type="text/plain")
+
+    def _banking_service(self, method: str, path: str, query: Dict[str, str]) -> Any:
+        """JSON data or a plain-text message for a banking service, None for unknown services"""
+        state = self.state
+        if method == "GET":
+            match = re.fullmatch(r"/customers/(\d+)(/accounts)?", path)
+            if match:
+                customer = state.customer(int(match.group(1)))
+                return state.customer_accounts(customer["id"]) if match.group(2) else customer
+            match = re.fullmatch(r"/accounts/(\d+)(/transactions)?", path)
+            if match:
+                account_id = int(match.group(1))
+                return state.account_transactions(account_id) if match.group(2) else state.account(account_id)
+            match = re.fullmatch(r"/transactions/(\d+)", path)
+            if match:
+                transaction_id = int(match.group(1))
+                if transaction_id not in state.transactions:
+                    raise ServiceError(f"Could not find transaction #{transaction_id}")
+                return state.transactions[transaction_id]
+            return None
+
+        if method != "POST":
+            return None
+        if path == "/createAccount":
+            return state.create_account(int(query["customerId"]), ACCOUNT_TYPES[int(query["newAccountType"])],
+                                        int(query["fromAccountId"]))
+        if path == "/transfer":
+            amount = float(query["amount"])
+            state.transfer(int(query["fromAccountId"]), int(query["toAccountId"]), amount)
+            return (f"Successfully transferred ${amount:.2f} from account #{query['fromAccountId']} "
+                    f"to account #{query['toAccountId']}")
+        if path == "/deposit":
+            amount = float(query["amount"])
+            state.deposit(int(query["accountId"]), amount)
+            return f"Successfully deposited ${amount:.2f} to account #{query['accountId']}"
+        if path == "/withdraw":
+            amount = float(query["amount"])
+            state.withdraw(int(query["accountId"]), amount)
+            return f"Successfully withdrew ${amount:.2f} from account #{query['accountId']}"
+        if path == "/billpay":
+            payee = json.loads(self._body or b"{}")
+            amount = float(query["amount"])
+            state.bill_pay(int(query["accountId"]), amount, payee.get("name", ""))
+            return {"payeeName": payee.get("name", ""), "amount": amount, "accountId": int(query["accountId"])}
+        if path == "/requestLoan":
+            return state.request_loan(int(query["customerId"]), float(query["amount"]),
+                                      float(query["downPayment"]), int(query["fromAccountId"]))
+        match = re.fullmatch(r"/customers/update/(\d+)", path)
+        if match:
+            state.update_customer(int(match.group(1)), query)
+            return "Successfully updated customer profile"
+        return None
+
+
+class ParaBankStubServer:
+    """
+    Local stand-in for the public ParaBank demo, served from a background thread
+    on an ephemeral port so UI and API tests can run without the internet
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Initialize the server (call start() to begin serving)
+
+        Args:
+            host: Interface to bind
+            port: Port to bind, 0 picks a free port
+        """
+        self.host = host
+        self.port = port
+        self.state = ParaBankState()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Web application root, equivalent to https://parabank.parasoft.com/parabank"""
+        return f"http://{self.host}:{self.port}{CONTEXT_PATH}"
+
+    @property
+    def api_url(self) -> str:
+        """REST services root, equivalent to .../parabank/services/bank"""
+        return f"http://{self.host}:{self.port}{SERVICES_PATH}"
+
+    def start(self) -> "ParaBankStubServer":
+        """Start serving in a daemon thread"""
+        self._httpd = ThreadingHTTPServer((self.host, self.port), ParaBankRequestHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = self.state
+        self.port = self._httpd.server_address[1]
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="parabank-stub", daemon=True)
+        self._thread.start()
+        logger.info(f"ParaBank stub server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "ParaBankStubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
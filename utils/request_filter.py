@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+from utils.waits import glob_to_regex
+
+if TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext, Request, Response, Route
+
+logger = logging.getLogger(__name__)
+
+
+class RequestStats:
+    """
+    Counters of requests seen by a RequestFilter
+    """
+
+    FIELDS = ("allowed", "blocked", "allowed_bytes", "blocked_bytes", "blocked_unknown_size")
+
+    def __init__(self, **values: int):
+        for field in self.FIELDS:
+            setattr(self, field, values.get(field, 0))
+
+    def to_dict(self) -> Dict[str, int]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def snapshot(self) -> "RequestStats":
+        return RequestStats(**self.to_dict())
+
+    def merge(self, other: Dict[str, int]) -> None:
+        """Fold in the counters of another worker"""
+        for field in self.FIELDS:
+            setattr(self, field, getattr(self, field) + other.get(field, 0))
+
+    def __sub__(self, other: "RequestStats") -> "RequestStats":
+        return RequestStats(**{field: getattr(self, field) - getattr(other, field) for field in self.FIELDS})
+
+    def __str__(self) -> str:
+        return (
+            f"{self.allowed} allowed ({self.allowed_bytes / 1024:.0f} KiB), "
+            f"{self.blocked} blocked (>= {self.blocked_bytes / 1024:.0f} KiB saved, "
+            f"{self.blocked_unknown_size} of unknown size)"
+        )
+
+
+class RequestFilter:
+    """
+    Blocks requests the assertions never depend on (images, fonts, trackers, ...)
+
+    Rules are evaluated in order: an allowUrls glob always wins, then blockUrls
+    globs, third-party hosts and finally resource types. Bytes saved are a lower
+    bound, learned from the Content-Length of the same URL when it was allowed
+    (in this or an earlier run, see load_sizes/save_sizes).
+    """
+
+    def __init__(self, block_resource_types: Iterable[str] = (), block_urls: Iterable[str] = (),
+                 allow_urls: Iterable[str] = (), block_third_party: bool = False,
+                 first_party_hosts: Iterable[str] = (), enabled: bool = True):
+        """
+        Initialize the filter
+
+        Args:
+            block_resource_types: Playwright resource types to abort (image, font, media, stylesheet, ...)
+            block_urls: URL globs to abort
+            allow_urls: URL globs that are never blocked
+            block_third_party: Abort requests to hosts other than first_party_hosts
+            first_party_hosts: Hosts of the application under test
+            enabled: When False nothing is blocked, responses are only measured
+        """
+        self.block_resource_types = set(block_resource_types)
+        self.block_urls = [glob_to_regex(glob) for glob in block_urls]
+        self.allow_urls = [glob_to_regex(glob) for glob in allow_urls]
+        self.block_third_party = block_third_party
+        self.first_party_hosts = set(first_party_hosts)
+        self.enabled = enabled
+        self.totals = RequestStats()
+        self._known_sizes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> Optional["RequestFilter"]:
+        """
+        Build a filter from the "requestFiltering" section of an environment config
+
+        Returns:
+            RequestFilter, or None when the environment has no filtering rules
+        """
+        rules = config.get("requestFiltering")
+        if rules is None:
+            return None
+        first_party_hosts: List[str] = []
+        for key in ("baseUrl", "apiUrl"):
+            if config.get(key):
+                first_party_hosts.append(urlparse(config[key]).hostname)
+        return cls(
+            block_resource_types=rules.get("blockResourceTypes", []),
+            block_urls=rules.get("blockUrls", []),
+            allow_urls=rules.get("allowUrls", []),
+            block_third_party=rules.get("blockThirdParty", False),
+            first_party_hosts=first_party_hosts,
+            enabled=rules.get("enabled", True)
+        )
+
+    def load_sizes(self, path: Path) -> None:
+        """Load response sizes learned by earlier runs"""
+        try:
+            with open(path, "r") as f:
+                self._known_sizes.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+
+    def save_sizes(self, path: Path) -> None:
+        """Persist learned response sizes so later filtered runs can estimate savings"""
+        with self._lock:
+            sizes = dict(self._known_sizes)
+        tmp_path = Path(path).with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(sizes, f)
+        tmp_path.replace(path)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Decide whether a request is blocked"""
+        if any(pattern.search(url) for pattern in self.allow_urls):
+            return False
+        if any(pattern.search(url) for pattern in self.block_urls):
+            return True
+        if self.block_third_party and self.first_party_hosts and \
+                urlparse(url).hostname not in self.first_party_hosts and url.startswith("http"):
+            return True
+        return resource_type in self.block_resource_types
+
+    def attach(self, context: BrowserContext) -> None:
+        """
+        Install the filter on a browser context (call right after creating it)
+
+        Args:
+            context: Browser context to filter
+        """
+        if self.enabled:
+            context.route("**/*", self._handle_route)
+        context.on("response", self._record_response)
+
+    def _handle_route(self, route: Route, request: Request) -> None:
+        if self.should_block(request.url, request.resource_type):
+            with self._lock:
+                self.totals.blocked += 1
+                size = self._known_sizes.get(request.url)
+                if size is None:
+                    self.totals.blocked_unknown_size += 1
+                else:
+                    self.totals.blocked_bytes += size
+            logger.debug(f"Blocked {request.resource_type} request: {request.url}")
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def _record_response(self, response: Response) -> None:
+        try:
+            size = int(response.headers.get("content-length", ""))
+        except ValueError:
+            size = None
+        with self._lock:
+            self.totals.allowed += 1
+            if size is not None:
+                self.totals.allowed_bytes += size
+                self._known_sizes[response.url] = size
@@ -0,0 +1,195 @@
+import copy
+import fnmatch
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode
+import requests
+from utils.response_logging import APIResponse
+
+logger = logging.getLogger(__name__)
+
+MUTATING_METHODS = ("POST", "PUT", "PATCH", "DELETE")
+
+# Rough per-entry overhead (response object, headers, key) added to the body size
+_ENTRY_OVERHEAD = 512
+
+
+class CacheStats:
+    """Hit/miss counters of a response cache"""
+
+    FIELDS = ("hits", "misses", "expired", "evicted", "invalidated")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        for name in self.FIELDS:
+            setattr(self, name, 0)
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for name, count in counts.items():
+                setattr(self, name, getattr(self, name) + count)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def merge(self, data: Dict[str, int]) -> None:
+        """Add counters reported by another process"""
+        self.add(**{name: data.get(name, 0) for name in self.FIELDS})
+
+    def __str__(self) -> str:
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups if lookups else 0
+        return (f"{self.hits} hits, {self.misses} misses ({rate:.0%} hit rate), {self.expired} expired, "
+                f"{self.evicted} evicted, {self.invalidated} invalidated")
+
+
+class ResponseCache:
+    """
+    TTL/LRU cache of successful GET responses for APIHelpers
+
+    Entries are keyed by URL, query parameters and auth identity (the
+    Authorization header and session cookies), so clients logged in as
+    different users never share entries. Each endpoint gets the TTL of the
+    first matching glob in ttls (0 disables caching for it). The least
+    recently used entries are evicted once the cached bodies exceed max_bytes.
+    A POST/PUT/PATCH/DELETE drops every entry under the resource prefixes it
+    touches: its own path, its first path segment and the prefixes listed for
+    it in invalidates.
+    """
+
+    def __init__(self, default_ttl: float = 60, max_bytes: int = 8 * 1024 * 1024,
+                 ttls: Optional[Dict[str, float]] = None, invalidates: Optional[Dict[str, Iterable[str]]] = None,
+                 stats: Optional[CacheStats] = None):
+        """
+        Initialize the cache
+
+        Args:
+            default_ttl: Seconds an entry lives when no ttls pattern matches
+            max_bytes: Memory bound for cached responses (bodies plus a fixed overhead)
+            ttls: Endpoint glob (e.g. "/customers/*/accounts") -> TTL in seconds
+            invalidates: Mutated endpoint glob (e.g. "/transfer") -> cached prefixes it makes stale
+            stats: Counters to update (a fresh CacheStats by default)
+        """
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.ttls = dict(ttls or {})
+        self.invalidates = {pattern: list(prefixes) for pattern, prefixes in (invalidates or {}).items()}
+        self.stats = stats or CacheStats()
+        self._lock = threading.Lock()
+        # key -> (expires_at, size, endpoint, response)
+        self._entries: "OrderedDict[Tuple, Tuple[float, int, str, APIResponse]]" = OrderedDict()
+        self.size = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], stats: Optional[CacheStats] = None) -> Optional["ResponseCache"]:
+        """Build a cache from the config's responseCache section (None unless enabled)"""
+        section = config.get("responseCache", {})
+        if not section.get("enabled", False):
+            return None
+        return cls(
+            default_ttl=section.get("defaultTtl", 60),
+            max_bytes=section.get("maxBytes", 8 * 1024 * 1024),
+            ttls=section.get("ttls"),
+            invalidates=section.get("invalidates"),
+            stats=stats
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl_for(self, endpoint: str) -> float:
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(session: requests.Session, base_url: str, endpoint: str, params: Optional[Dict[str, Any]],
+            headers: Optional[Dict[str, str]] = None) -> Tuple[str, str, str]:
+        """Cache key for a GET sent through session"""
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        authorization = (headers or {}).get("Authorization") or session.headers.get("Authorization", "")
+        cookies = "; ".join(f"{c.name}={c.value}" for c in sorted(session.cookies, key=lambda c: c.name))
+        identity = hashlib.sha1(f"{authorization}\n{cookies}".encode()).hexdigest() if authorization or cookies else ""
+        return f"{base_url}{endpoint}", query, identity
+
+    def get(self, key: Tuple) -> Optional[APIResponse]:
+        """A copy of the cached response, or None when absent or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._drop(key)
+                self.stats.add(expired=1)
+                entry = None
+            if entry is None:
+                self.stats.add(misses=1)
+                return None
+            self._entries.move_to_end(key)
+            self.stats.add(hits=1)
+            return self._copy(entry[3])
+
+    def put(self, key: Tuple, endpoint: str, response: APIResponse) -> None:
+        """Store a successful response for its endpoint's TTL"""
+        if not 200 <= response.status_code < 300:
+            return
+        ttl = self.ttl_for(endpoint)
+        size = len(response.content or b"") + _ENTRY_OVERHEAD
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, size, endpoint, self._copy(response))
+            self.size += size
+            while self.size > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.stats.add(evicted=1)
+
+    def _drop(self, key: Tuple) -> None:
+        self.size -= self._entries.pop(key)[1]
+
+    @staticmethod
+    def _copy(response: APIResponse) -> APIResponse:
+        # Shallow copy without the parsed JSON, so callers never mutate each other's data
+        clone = copy.copy(response)
+        clone.__dict__.pop("_json_cache", None)
+        return clone
+
+    def prefixes_for(self, endpoint: str) -> List[str]:
+        """Cached resource prefixes made stale by a mutation of endpoint"""
+        path = endpoint.split("?", 1)[0].rstrip("/")
+        first_segment = "/" + path.lstrip("/").split("/", 1)[0]
+        prefixes = {path, first_segment}
+        for pattern, extra in self.invalidates.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                prefixes.update(extra)
+        return sorted(prefix for prefix in prefixes if prefix and prefix != "/")
+
+    def invalidate(self, *prefixes: str) -> int:
+        """
+        Drop entries whose endpoint lies under any of prefixes
+
+        Returns:
+            Number of dropped entries
+        """
+        def _under(endpoint: str, prefix: str) -> bool:
+            return endpoint == prefix or endpoint.startswith(prefix.rstrip("/") + "/")
+
+        with self._lock:
+            stale = [key for key, entry in self._entries.items()
+                     if any(_under(entry[2].split("?", 1)[0], prefix) for prefix in prefixes)]
+            for key in stale:
+                self._drop(key)
+        if stale:
+            self.stats.add(invalidated=len(stale))
+            logger.debug(f"Invalidated {len(stale)} cached responses under {', '.join(prefixes)}")
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
@@ -0,0 +1,106 @@
+import json
+import logging
+import threading
+from typing import Any, Dict, Tuple
+import requests
+
+logger = logging.getLogger(__name__)
+
+_UNPARSED = object()
+
+
+class APIResponse(requests.Response):
+    """requests.Response whose json() parses the body once and caches the result"""
+
+    def json(self, **kwargs) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        cached = self.__dict__.get("_json_cache", _UNPARSED)
+        if cached is _UNPARSED:
+            cached = super().json()
+            self.__dict__["_json_cache"] = cached
+        return cached
+
+
+def as_api_response(response: requests.Response) -> APIResponse:
+    """Give a response the cached json() accessor without copying it"""
+    if not isinstance(response, APIResponse):
+        response.__class__ = APIResponse
+    return response
+
+
+class ResponseLogPolicy:
+    """
+    Decides how much of an API response is formatted for logs and Allure
+
+    Bodies are only formatted when a DEBUG log record or an Allure attachment
+    will actually be produced. Only the first max_body_bytes are decoded; JSON
+    bodies under the cap are pretty-printed, larger ones are shown raw and
+    truncated. With sample_rate below 1 only every n-th successful response is
+    formatted, error responses always are.
+    """
+
+    def __init__(self, max_body_bytes: int = 2048, sample_rate: float = 1.0,
+                 attach_to_allure: bool = True, always_log_errors: bool = True):
+        """
+        Initialize the policy
+
+        Args:
+            max_body_bytes: Bytes of the body shown at most
+            sample_rate: Fraction (0-1) of successful responses whose body is formatted
+            attach_to_allure: Attach formatted bodies to the Allure report
+            always_log_errors: Format 4xx/5xx responses regardless of sampling
+        """
+        if not 0 <= sample_rate <= 1:
+            raise ValueError(f"sample_rate must be between 0 and 1, got {sample_rate}")
+        self.max_body_bytes = max_body_bytes
+        self.sample_rate = sample_rate
+        self.attach_to_allure = attach_to_allure
+        self.always_log_errors = always_log_errors
+        self._lock = threading.Lock()
+        self._seen = 0
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ResponseLogPolicy":
+        """Build a policy from the config's apiLogging section (defaults when absent)"""
+        section = config.get("apiLogging", {})
+        return cls(
+            max_body_bytes=section.get("maxBodyBytes", 2048),
+            sample_rate=section.get("sampleRate", 1.0),
+            attach_to_allure=section.get("attachToAllure", True),
+            always_log_errors=section.get("alwaysLogErrors", True)
+        )
+
+    def sampled(self, response: requests.Response) -> bool:
+        """Whether this response's body should be formatted"""
+        if self.always_log_errors and response.status_code >= 400:
+            return True
+        if self.sample_rate >= 1:
+            return True
+        if self.sample_rate <= 0:
+            return False
+        # Deterministic 1-in-n sampling keeps runs comparable
+        every = max(1, round(1 / self.sample_rate))
+        with self._lock:
+            self._seen += 1
+            return (self._seen - 1) % every == 0
+
+    def format_body(self, response: requests.Response) -> Tuple[str, bool, bool]:
+        """
+        Format the body for display
+
+        Returns:
+            (text, is_json, truncated)
+        """
+        content = response.content or b""
+        is_json = "json" in response.headers.get("Content-Type", "")
+        if len(content) <= self.max_body_bytes:
+            if is_json:
+                try:
+                    return json.dumps(response.json(), indent=2), True, False
+                except ValueError:
+                    is_json = False
+            return content.decode(response.encoding or "utf-8", errors="replace"), is_json, False
+        # Decode only the slice that is shown, never the whole payload
+        head = content[:self.max_body_bytes].decode(response.encoding or "utf-8", errors="replace")
+        return f"{head}... [{len(content) - self.max_body_bytes} more bytes]", is_json, True
@@ -0,0 +1,92 @@
+import os
+import re
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Options that would start xdist workers or a second profile in the child run
+_DROPPED_OPTIONS = {"--startup-profile"}
+_DROPPED_WITH_VALUE = {"-n", "--numprocesses", "--dist", "--maxprocesses"}
+
+
+@dataclass
+class ImportRecord:
+    """One line of python -X importtime output"""
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+    @property
+    def package(self) -> str:
+        return self.module.split(".", 1)[0]
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse the stderr of an interpreter started with -X importtime"""
+    records = []
+    for line in output.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            records.append(ImportRecord(module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return records
+
+
+def child_args(args: Sequence[str]) -> List[str]:
+    """Pytest arguments of the profiled run: collection only, in a single process"""
+    result, skip_next = [], False
+    for arg in args:
+        if skip_next:
+            skip_next = False
+            continue
+        if arg in _DROPPED_OPTIONS:
+            continue
+        if arg in _DROPPED_WITH_VALUE:
+            skip_next = True
+            continue
+        if any(arg.startswith(f"{option}=") for option in _DROPPED_WITH_VALUE) or re.fullmatch(r"-n\S+", arg):
+            continue
+        result.append(arg)
+    return result + ["--collect-only", "-q", "-p", "no:cacheprovider"]
+
+
+def profile_startup(args: Sequence[str], top: int = 15) -> List[str]:
+    """
+    Collect the suite in a child interpreter under -X importtime and summarize where startup time goes
+
+    Args:
+        args: Pytest arguments of the current run (xdist options are dropped)
+        top: Packages and modules listed at most
+
+    Returns:
+        Report lines
+    """
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", *child_args(args)]
+    started = time.perf_counter()
+    completed = subprocess.run(command, capture_output=True, text=True, env=os.environ.copy())
+    elapsed = time.perf_counter() - started
+    records = parse_importtime(completed.stderr)
+
+    by_package: Dict[str, int] = {}
+    for record in records:
+        by_package[record.package] = by_package.get(record.package, 0) + record.self_us
+    total_us = sum(record.self_us for record in records)
+    top_level = sorted((r for r in records if r.depth == 0), key=lambda r: r.cumulative_us, reverse=True)
+
+    lines = [
+        f"Collection run: {elapsed * 1000:.0f} ms wall, {total_us / 1000:.0f} ms importing "
+        f"{len(records)} modules (exit code {completed.returncode})",
+        "",
+        f"{'self ms':>9}  {'share':>6}  package"
+    ]
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:top]:
+        lines.append(f"{self_us / 1000:>9.1f}  {self_us / total_us if total_us else 0:>6.1%}  {package}")
+    lines += ["", f"{'cum. ms':>9}  top-level import"]
+    for record in top_level[:top]:
+        lines.append(f"{record.cumulative_us / 1000:>9.1f}  {record.module}")
+    return lines
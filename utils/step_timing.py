@@ -0,0 +1,205 @@
+import contextlib
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from config.env import TIMINGS_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class StepTimer:
+    """
+    Records the wall time of every page-object action, split into the time spent
+    waiting for the element and the time spent performing the action
+
+    Records are buffered in memory and appended to one JSONL file per xdist
+    worker (test-result/timings/steps-<worker>.jsonl).
+    """
+
+    def __init__(self, output_dir: Path = TIMINGS_DIR, flush_every: int = 1000):
+        """
+        Initialize the timer
+
+        Args:
+            output_dir: Directory for the per-worker JSONL files
+            flush_every: Number of buffered records that triggers a write
+        """
+        self.output_dir = Path(output_dir)
+        self.flush_every = flush_every
+        self.enabled = True
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def output_file(self) -> Path:
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        return self.output_dir / f"steps-{worker}.jsonl"
+
+    def _stack(self) -> List[Dict[str, Any]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    @contextlib.contextmanager
+    def step(self, action: str, page_object: str, selector: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Time one action; nested actions are recorded separately
+
+        Args:
+            action: Action type (click, fill_text, ...)
+            page_object: Page-object class performing the action
+            selector: Element selector, if the action targets one
+        """
+        if not self.enabled:
+            yield {}
+            return
+        record = {
+            "test": os.getenv("PYTEST_CURRENT_TEST", "").split(" ")[0],
+            "page_object": page_object,
+            "action": action,
+            "selector": selector,
+            "wait_ms": 0.0,
+            "ok": True
+        }
+        stack = self._stack()
+        stack.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        except BaseException:
+            record["ok"] = False
+            raise
+        finally:
+            stack.pop()
+            record["total_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            record["wait_ms"] = round(record["wait_ms"], 3)
+            record["action_ms"] = round(max(0.0, record["total_ms"] - record["wait_ms"]), 3)
+            record["ts"] = time.time()
+            with self._lock:
+                self._buffer.append(record)
+                should_flush = len(self._buffer) >= self.flush_every
+            if should_flush:
+                self.flush()
+
+    @contextlib.contextmanager
+    def waiting(self) -> Iterator[None]:
+        """Attribute the enclosed time to the waiting phase of the current action"""
+        stack = self._stack() if self.enabled else None
+        if not stack:
+            yield
+            return
+        record = stack[-1]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["wait_ms"] += (time.perf_counter() - start) * 1000
+
+    def flush(self) -> None:
+        """Append buffered records to this worker's JSONL file"""
+        with self._lock:
+            records, self._buffer = self._buffer, []
+        if not records:
+            return
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_file, "a") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+
+    def reset_output(self) -> None:
+        """Remove JSONL files of previous runs (call once, before workers start)"""
+        if self.output_dir.exists():
+            for path in self.output_dir.glob("steps-*.jsonl"):
+                path.unlink()
+
+    def load_records(self) -> List[Dict[str, Any]]:
+        """Read the records written by every worker of this run"""
+        records = []
+        if self.output_dir.exists():
+            for path in sorted(self.output_dir.glob("steps-*.jsonl")):
+                with open(path, "r") as f:
+                    records.extend(json.loads(line) for line in f if line.strip())
+        return records
+
+    def summary_lines(self, top: int = 10) -> List[str]:
+        """Per-action p50/p95 table followed by the slowest selectors"""
+        records = self.load_records()
+        if not records:
+            return []
+
+        by_action: Dict[str, List[Dict[str, Any]]] = {}
+        by_selector: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_action.setdefault(record["action"], []).append(record)
+            if record.get("selector"):
+                key = f"{record['page_object']} {record['selector']}"
+                by_selector.setdefault(key, []).append(record)
+
+        lines = [f"{'action':<22} {'count':>7} {'p50 ms':>9} {'p95 ms':>9} {'wait p95':>9} {'total s':>9}"]
+        for action, items in sorted(by_action.items(), key=lambda item: -sum(r["total_ms"] for r in item[1])):
+            totals = sorted(r["total_ms"] for r in items)
+            waits = sorted(r["wait_ms"] for r in items)
+            lines.append(
+                f"{action:<22} {len(items):>7} {_percentile(totals, 0.5):>9.1f} {_percentile(totals, 0.95):>9.1f} "
+                f"{_percentile(waits, 0.95):>9.1f} {sum(totals) / 1000:>9.2f}"
+            )
+
+        lines.append("")
+        lines.append(f"Top {top} slowest selectors (by p95):")
+        ranked = sorted(
+            by_selector.items(),
+            key=lambda item: -_percentile(sorted(r["total_ms"] for r in item[1]), 0.95)
+        )[:top]
+        for key, items in ranked:
+            totals = sorted(r["total_ms"] for r in items)
+            wait_share = sum(r["wait_ms"] for r in items) / max(sum(totals), 1e-9)
+            lines.append(
+                f"  p95 {_percentile(totals, 0.95):>9.1f} ms  x{len(items):<5} wait {wait_share:>4.0%}  {key}"
+            )
+        return lines
+
+
+# Process-wide step timer used by BasePage
+STEP_TIMER = StepTimer()
+
+
+def timed_step(action: str) -> Callable:
+    """
+    Decorator timing a page-object method with STEP_TIMER
+
+    The selector is taken from the method's 'selector' argument when it has one.
+
+    Args:
+        action: Action type recorded for the method
+    """
+    def decorator(func: Callable) -> Callable:
+        parameters = list(inspect.signature(func).parameters)
+        selector_index = parameters.index("selector") if "selector" in parameters else None
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            selector = None
+            if selector_index is not None:
+                if "selector" in kwargs:
+                    selector = kwargs["selector"]
+                elif len(args) >= selector_index:
+                    selector = args[selector_index - 1]
+            with STEP_TIMER.step(action, type(self).__name__, selector):
+                return func(self, *args, **kwargs)
+
+        return wrapper
+    return decorator
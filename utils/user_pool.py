@@ -0,0 +1,231 @@
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import socket
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+from config.env import USER_POOL_DIR
+from utils.api_helpers import APIHelpers
+from utils.data_generator import DataGenerator
+from utils.parabank_client import Address, Customer, ParaBankAPIError, ParaBankClient
+
+logger = logging.getLogger(__name__)
+
+
+class UserPoolExhausted(Exception):
+    """Raised when no pooled user became free within the wait time"""
+
+
+@dataclass
+class PooledUser:
+    """A provisioned ParaBank user; profile uses the keys of config["users"] entries"""
+    username: str
+    password: str
+    customer_id: Optional[int] = None
+    profile: Dict[str, str] = field(default_factory=dict)
+
+    def as_config_user(self) -> Dict[str, str]:
+        """Credentials and profile in the shape of a config["users"] entry"""
+        return {**self.profile, "username": self.username, "password": self.password}
+
+    @classmethod
+    def from_config_user(cls, user: Dict[str, Any]) -> "PooledUser":
+        profile = {k: v for k, v in user.items() if k not in ("username", "password", "confirm")}
+        return cls(user["username"], user["password"], profile=profile)
+
+
+class UserPool:
+    """
+    File-locked pool of ParaBank users shared by all xdist workers
+
+    Users are registered over HTTP on first demand (the whole pool in one
+    pass) and persisted per application URL, so later runs reuse them. Each
+    lease is exclusive across processes; leases of crashed processes are
+    reclaimed. Released users get their profile and credentials restored
+    through the customers/update service.
+    """
+
+    def __init__(self, base_url: str, client: ParaBankClient, size: int = 4, pool_dir: Path = USER_POOL_DIR,
+                 wait_seconds: float = 60, stale_seconds: float = 1800, reset_on_release: bool = True):
+        """
+        Initialize the pool
+
+        Args:
+            base_url: Web application root, used to register users and to key the pool file
+            client: Service client used to verify and reset users
+            size: Users provisioned at most
+            pool_dir: Directory of the pool and lock files
+            wait_seconds: How long lease() waits for a user to become free
+            stale_seconds: Age after which a lease is reclaimed even if its holder is alive
+            reset_on_release: Restore each user's profile and credentials when released
+        """
+        self.base_url = base_url
+        self.client = client
+        self.size = size
+        self.pool_dir = Path(pool_dir)
+        self.wait_seconds = wait_seconds
+        self.stale_seconds = stale_seconds
+        self.reset_on_release = reset_on_release
+        digest = hashlib.sha1(base_url.encode()).hexdigest()[:10]
+        self.path = self.pool_dir / f"users-{digest}.json"
+        self._lock_path = self.path.with_suffix(".lock")
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], client: ParaBankClient) -> "UserPool":
+        """Build a pool from the config's userPool section"""
+        section = config.get("userPool", {})
+        return cls(
+            config["baseUrl"],
+            client,
+            size=section.get("size", 4),
+            wait_seconds=section.get("waitSeconds", 60),
+            stale_seconds=section.get("staleLeaseSeconds", 1800),
+            reset_on_release=section.get("resetOnRelease", True)
+        )
+
+    @contextmanager
+    def _locked(self) -> Iterator[Dict[str, Any]]:
+        """Hold the cross-process lock and yield the pool data, saved on exit"""
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                data = {"users": []}
+                if self.path.exists():
+                    try:
+                        data = json.loads(self.path.read_text())
+                    except ValueError:
+                        logger.warning(f"Discarding corrupt user pool {self.path}")
+                yield data
+                tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(json.dumps(data, indent=2))
+                os.replace(tmp_path, self.path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _is_stale(self, lease: Dict[str, Any]) -> bool:
+        if time.time() - lease["since"] > self.stale_seconds:
+            return True
+        if lease["host"] != socket.gethostname():
+            return False
+        try:
+            os.kill(lease["pid"], 0)
+        except ProcessLookupError:
+            return True
+        except PermissionError:
+            pass
+        return False
+
+    def lease(self, holder: str) -> PooledUser:
+        """
+        Lease a user exclusively, provisioning the pool if needed
+
+        Args:
+            holder: Description of the leaseholder (worker and test id) for diagnostics
+
+        Returns:
+            Leased user (give it back with release())
+
+        Raises:
+            UserPoolExhausted: Every user stayed leased for wait_seconds
+        """
+        deadline = time.monotonic() + self.wait_seconds
+        while True:
+            with self._locked() as data:
+                users: List[Dict[str, Any]] = data["users"]
+                for entry in users:
+                    lease = entry.get("lease")
+                    if lease and self._is_stale(lease):
+                        logger.warning(f"Reclaiming user {entry['username']} from stale lease of {lease['holder']}")
+                        entry["lease"] = None
+                if not any(entry.get("lease") is None for entry in users) and len(users) < self.size:
+                    users.extend(asdict(user) for user in self.provision(self.size - len(users)))
+                for entry in users:
+                    if entry.get("lease") is None:
+                        entry["lease"] = {"holder": holder, "host": socket.gethostname(),
+                                          "pid": os.getpid(), "since": time.time()}
+                        user = PooledUser(**{k: v for k, v in entry.items() if k != "lease"})
+                        break
+                else:
+                    user = None
+            if user is not None:
+                if self._verify(user):
+                    logger.info(f"Leased user {user.username} to {holder}")
+                    return user
+                continue
+            if time.monotonic() >= deadline:
+                raise UserPoolExhausted(f"All {self.size} pooled users stayed leased for {self.wait_seconds}s")
+            time.sleep(0.5)
+
+    def _verify(self, user: PooledUser) -> bool:
+        """Check the user still exists on the server, dropping it from the pool otherwise"""
+        try:
+            user.customer_id = self.client.login(user.username, user.password).id
+            return True
+        except ParaBankAPIError:
+            logger.warning(f"Pooled user {user.username} no longer exists, dropping it")
+            with self._locked() as data:
+                data["users"] = [entry for entry in data["users"] if entry["username"] != user.username]
+            return False
+
+    def release(self, user: PooledUser) -> None:
+        """Reset a leased user if configured and make it available again"""
+        if self.reset_on_release and user.customer_id is not None:
+            try:
+                self.reset(user)
+            except Exception as e:
+                logger.warning(f"Failed to reset pooled user {user.username}: {e}")
+        with self._locked() as data:
+            for entry in data["users"]:
+                if entry["username"] == user.username:
+                    entry["lease"] = None
+        logger.info(f"Released user {user.username}")
+
+    def reset(self, user: PooledUser) -> None:
+        """Restore the user's registered profile and credentials"""
+        profile = user.profile
+        self.client.update_customer(Customer(
+            user.customer_id,
+            profile.get("firstName", ""),
+            profile.get("lastName", ""),
+            Address(profile.get("address", ""), profile.get("city", ""),
+                    profile.get("state", ""), profile.get("zipCode", "")),
+            profile.get("phone", ""),
+            profile.get("ssn", "")
+        ), user.username, user.password)
+
+    def provision(self, count: int) -> List[PooledUser]:
+        """Register count new users through the registration form over HTTP"""
+        web = APIHelpers(self.base_url, headers={"Accept": "text/html"}, transport=self.client.api.transport)
+        users = []
+        # Bulk passwords are alphanumeric, which the login service's URL path needs
+        for record in DataGenerator.registration_records(count, username_prefix="pool_"):
+            user = PooledUser.from_config_user(record)
+            self._register(web, user)
+            users.append(user)
+        logger.info(f"Provisioned {count} pooled users for {self.base_url}")
+        return users
+
+    @staticmethod
+    def _register(web: APIHelpers, user: PooledUser) -> None:
+        profile = user.profile
+        response = web.post("/register.htm", data={
+            "customer.firstName": profile["firstName"],
+            "customer.lastName": profile["lastName"],
+            "customer.address.street": profile["address"],
+            "customer.address.city": profile["city"],
+            "customer.address.state": profile["state"],
+            "customer.address.zipCode": profile["zipCode"],
+            "customer.phoneNumber": profile["phone"],
+            "customer.ssn": profile["ssn"],
+            "customer.username": user.username,
+            "customer.password": user.password,
+            "repeatedPassword": user.password
+        }, headers={"Content-Type": "application/x-www-form-urlencoded"})
+        if response.status_code >= 400 or "created successfully" not in response.text:
+            raise RuntimeError(f"Registering pooled user {user.username} failed with HTTP {response.status_code}")
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import re
+import threading
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Pattern, Union
+
+if TYPE_CHECKING:
+    from playwright.sync_api import Page
+
+logger = logging.getLogger(__name__)
+
+
+class WaitStats:
+    """
+    Aggregated wait durations per condition kind, mergeable across xdist workers
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.kinds: Dict[str, Dict[str, float]] = {}
+
+    def record(self, kind: str, seconds: float, ok: bool = True) -> None:
+        """
+        Record one completed wait
+
+        Args:
+            kind: Condition kind (response, navigation, element, networkidle, ...)
+            seconds: Time spent waiting
+            ok: False when the wait timed out or failed
+        """
+        with self._lock:
+            entry = self.kinds.setdefault(kind, {"count": 0, "failed": 0, "total": 0.0, "max": 0.0})
+            entry["count"] += 1
+            entry["failed"] += 0 if ok else 1
+            entry["total"] += seconds
+            entry["max"] = max(entry["max"], seconds)
+
+    def to_dict(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {kind: dict(entry) for kind, entry in self.kinds.items()}
+
+    def merge(self, other: Dict[str, Dict[str, float]]) -> None:
+        """Fold in the stats of another worker"""
+        with self._lock:
+            for kind, theirs in other.items():
+                entry = self.kinds.setdefault(kind, {"count": 0, "failed": 0, "total": 0.0, "max": 0.0})
+                entry["count"] += theirs["count"]
+                entry["failed"] += theirs["failed"]
+                entry["total"] += theirs["total"]
+                entry["max"] = max(entry["max"], theirs["max"])
+
+    def summary_lines(self) -> List[str]:
+        """Human readable table, one line per condition kind"""
+        lines = [f"{'kind':<12} {'count':>7} {'failed':>7} {'total s':>9} {'mean ms':>9} {'max ms':>9}"]
+        for kind, entry in sorted(self.to_dict().items(), key=lambda item: -item[1]["total"]):
+            mean_ms = entry["total"] / entry["count"] * 1000 if entry["count"] else 0.0
+            lines.append(
+                f"{kind:<12} {entry['count']:>7} {entry['failed']:>7} {entry['total']:>9.2f} "
+                f"{mean_ms:>9.1f} {entry['max'] * 1000:>9.1f}"
+            )
+        return lines
+
+
+# Process-wide wait statistics, reported at the end of the session
+WAIT_STATS = WaitStats()
+
+
+class WaitCondition:
+    """
+    Something a page-object action waits for
+
+    Conditions that react to browser events (responses, navigations) are armed
+    before the action runs through expect(); state conditions are checked
+    afterwards through wait().
+    """
+
+    kind = "condition"
+
+    def expect(self, page: Page, timeout: float) -> ContextManager:
+        """Context manager armed around the action, resolved when the condition is met"""
+        return contextlib.nullcontext()
+
+    def wait(self, page: Page, timeout: float) -> None:
+        """Block until the condition holds after the action"""
+
+    @property
+    def armed(self) -> bool:
+        return type(self).expect is not WaitCondition.expect
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.describe()})"
+
+    def describe(self) -> str:
+        return self.kind
+
+
+class ResponseCondition(WaitCondition):
+    """Wait for a network response whose URL matches a glob, regex or predicate"""
+
+    kind = "response"
+
+    def __init__(self, url: Union[str, Pattern, Callable[[str], bool]], status: Optional[int] = None):
+        self.url = url
+        self.status = status
+
+    def _matches(self, response) -> bool:
+        if callable(self.url) and not isinstance(self.url, re.Pattern):
+            url_ok = self.url(response.url)
+        elif isinstance(self.url, re.Pattern):
+            url_ok = bool(self.url.search(response.url))
+        else:
+            url_ok = glob_to_regex(self.url).search(response.url) is not None
+        return url_ok and (self.status is None or response.status == self.status)
+
+    def expect(self, page: Page, timeout: float) -> ContextManager:
+        return page.expect_response(self._matches, timeout=timeout)
+
+    def describe(self) -> str:
+        return f"{self.url}" + (f" [{self.status}]" if self.status else "")
+
+
+class NavigationCondition(WaitCondition):
+    """Wait for a main-frame navigation to commit (response received, document starting to load)"""
+
+    kind = "navigation"
+
+    def __init__(self, url: Optional[Union[str, Pattern]] = None, wait_until: str = "commit"):
+        self.url = url
+        self.wait_until = wait_until
+
+    def expect(self, page: Page, timeout: float) -> ContextManager:
+        kwargs: Dict[str, Any] = {"wait_until": self.wait_until, "timeout": timeout}
+        if self.url is not None:
+            kwargs["url"] = self.url
+        return page.expect_navigation(**kwargs)
+
+    def describe(self) -> str:
+        return f"{self.url or 'any'} until {self.wait_until}"
+
+
+class ElementCondition(WaitCondition):
+    """Wait for an element to reach a state (attached, detached, visible, hidden)"""
+
+    kind = "element"
+
+    def __init__(self, selector: str, state: str = "visible"):
+        self.selector = selector
+        self.state = state
+
+    def wait(self, page: Page, timeout: float) -> None:
+        page.locator(self.selector).first.wait_for(state=self.state, timeout=timeout)
+
+    def describe(self) -> str:
+        return f"{self.selector} {self.state}"
+
+
+class ValueCondition(WaitCondition):
+    """Wait for an input to hold a non-empty value, e.g. one filled in by a script after the page loaded"""
+
+    kind = "value"
+
+    def __init__(self, selector: str):
+        self.selector = selector
+
+    def wait(self, page: Page, timeout: float) -> None:
+        page.wait_for_function(
+            "selector => { const input = document.querySelector(selector); return !!input && input.value !== ''; }",
+            arg=self.selector,
+            timeout=timeout
+        )
+
+    def describe(self) -> str:
+        return f"{self.selector} filled"
+
+
+class LoadStateCondition(WaitCondition):
+    """Wait for a document load state; 'networkidle' costs at least 500 ms and should be a last resort"""
+
+    def __init__(self, state: str = "load"):
+        self.state = state
+        self.kind = state
+
+    def wait(self, page: Page, timeout: float) -> None:
+        page.wait_for_load_state(self.state, timeout=timeout)
+
+    def describe(self) -> str:
+        return self.state
+
+
+class WaitFor:
+    """
+    Factory for wait conditions used by page objects
+    """
+
+    @staticmethod
+    def response(url: Union[str, Pattern, Callable[[str], bool]], status: Optional[int] = None) -> ResponseCondition:
+        """Wait for a response whose URL matches a glob (e.g. '**/services/bank/**'), regex or predicate"""
+        return ResponseCondition(url, status)
+
+    @staticmethod
+    def navigation(url: Optional[Union[str, Pattern]] = None, wait_until: str = "commit") -> NavigationCondition:
+        """Wait for the main frame to navigate, by default only until the navigation commits"""
+        return NavigationCondition(url, wait_until)
+
+    @staticmethod
+    def element(selector: str, state: str = "visible") -> ElementCondition:
+        """Wait for an element to reach a state"""
+        return ElementCondition(selector, state)
+
+    @staticmethod
+    def value(selector: str) -> ValueCondition:
+        """Wait for an input (CSS selector) to hold a non-empty value"""
+        return ValueCondition(selector)
+
+    @staticmethod
+    def load_state(state: str = "load") -> LoadStateCondition:
+        """Wait for a document load state"""
+        return LoadStateCondition(state)
+
+
+def glob_to_regex(glob: str) -> Pattern:
+    """Translate a Playwright-style URL glob ('**' any path, '*' one segment) into a full-URL regex"""
+    cached = _GLOB_CACHE.get(glob)
+    if cached is None:
+        pattern = ""
+        i = 0
+        while i < len(glob):
+            if glob.startswith("**", i):
+                pattern += ".*"
+                i += 2
+            elif glob[i] == "*":
+                pattern += "[^/]*"
+                i += 1
+            else:
+                pattern += re.escape(glob[i])
+                i += 1
+        cached = _GLOB_CACHE[glob] = re.compile(f"^{pattern}$")
+    return cached
+
+
+_GLOB_CACHE: Dict[str, Pattern] = {}